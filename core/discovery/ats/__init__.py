@@ -1,21 +1,43 @@
-"""ATS adapters for job fetching."""
-
-from .base import CareerFetcher
-from .detector import ATSDetector
-from .greenhouse import GreenhouseFetcher
-from .lever import LeverFetcher
-from .ashby import AshbyFetcher
-from .workday import WorkdayFetcher
-from .generic import GenericFetcher
-from .uber import UberFetcher
-from .amazon import AmazonFetcher
-from .meta import MetaFetcher
-from .google import GoogleFetcher
-from .tiktok import TikTokFetcher
+"""ATS adapters for job fetching.
+
+Adapters are imported lazily on first attribute access, so importing the
+package does not load every fetcher (see ``FETCHER_REGISTRY``).
+"""
+
+import importlib
+
+from .fetcher_registry import FETCHER_REGISTRY, FetcherRegistry
+
+_LAZY_ATTRIBUTES = {
+    "CareerFetcher": ".base",
+    "ATSDetector": ".detector",
+    "GreenhouseFetcher": ".greenhouse",
+    "LeverFetcher": ".lever",
+    "AshbyFetcher": ".ashby",
+    "WorkdayFetcher": ".workday",
+    "GenericFetcher": ".generic",
+    "UberFetcher": ".uber",
+    "AmazonFetcher": ".amazon",
+    "MetaFetcher": ".meta",
+    "GoogleFetcher": ".google",
+    "TikTokFetcher": ".tiktok",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "CareerFetcher",
     "ATSDetector",
+    "FetcherRegistry",
+    "FETCHER_REGISTRY",
     "GreenhouseFetcher",
     "LeverFetcher",
     "AshbyFetcher",
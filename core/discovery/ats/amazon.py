@@ -1,75 +1,262 @@
 """Amazon jobs API fetcher."""
 
-from typing import List
+from itertools import chain
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
-from .base import CareerFetcher
+from .base import CareerFetcher, aclosing
 from ..models import Job
 
 
 class AmazonFetcher(CareerFetcher):
-    """Fetcher for Amazon jobs using their JSON API."""
+    """Fetcher for Amazon jobs using their JSON API.
+
+    The first page reveals the total number of ``hits``; the remaining
+    offsets are then requested concurrently (at most ``PAGE_WINDOW`` in
+    flight) and parsed as they arrive, one page per yielded batch.
+
+    Offset paging stops at ``MAX_OFFSET``. When a query has more hits than
+    that, it is split by the next field in ``FACET_FIELDS`` (country, then
+    business category, then job category) and each partition is crawled
+    the same way, recursively, in parallel.
+
+    In incremental mode results are sorted by recency and fetched one
+    window at a time, stopping once enough consecutive pages hold only
+    known jobs.
+    """
 
     API_URL = "https://www.amazon.jobs/en/search.json"
     JOB_URL_TEMPLATE = "https://www.amazon.jobs/en/jobs/{job_id}"
 
+    PAGE_SIZE = 100
+    MAX_OFFSET = 15000  # Deepest offset the API will page to
+    PAGE_WINDOW = 8  # Requests in flight at once
+
+    # Split oversized queries by these facets, in order
+    PARTITION_BY_FACETS = True
+    FACET_FIELDS = ["normalized_country_code", "business_category", "category"]
+
     def __init__(self, company_name: str, career_url: str, timeout: float = 30.0):
         super().__init__(company_name, career_url, timeout)
 
+    def _params(self, offset: int, filters: Dict[str, str], facet: Optional[str] = None) -> dict:
+        params = {
+            "radius": "24km",
+            "offset": offset,
+            "result_limit": self.PAGE_SIZE,
+            "sort": "recent" if self.incremental else "relevant",
+        }
+        for field, value in filters.items():
+            params[f"{field}[]"] = value
+        if facet:
+            # Ask for the value counts of the facet we may split on
+            params["facets[]"] = facet
+        return params
+
+    def _next_facet(self, filters: Dict[str, str]) -> Optional[str]:
+        """First facet field not already fixed by this partition."""
+        if not self.PARTITION_BY_FACETS:
+            return None
+        for field in self.FACET_FIELDS:
+            if field not in filters:
+                return field
+        return None
+
+    def _over_cap(self, first_page: dict) -> bool:
+        return first_page.get("hits", 0) > self.MAX_OFFSET + self.PAGE_SIZE
+
+    @staticmethod
+    def _facet_values(data: dict, field: str) -> List[str]:
+        """Values of a facet, from either ``[value, count]`` or ``{value: count}`` buckets."""
+        facets = data.get("facets") or {}
+        buckets = facets.get(f"{field}_facet") or facets.get(field) or []
+        values = []
+        for bucket in buckets:
+            if isinstance(bucket, dict):
+                values.extend(bucket.keys())
+            elif isinstance(bucket, (list, tuple)) and bucket:
+                values.append(bucket[0])
+            elif isinstance(bucket, str):
+                values.append(bucket)
+        return [str(value) for value in values if value]
+
+    def _partitions(self, first_page: dict, filters: Dict[str, str],
+                    facet: Optional[str]) -> List[Dict[str, str]]:
+        """Sub-queries to crawl instead of paging, or [] if paging suffices."""
+        if not self._over_cap(first_page):
+            return []
+        values = self._facet_values(first_page, facet) if facet else []
+        if not values:
+            print(f"  ⚠️  Amazon query {filters or 'all'} has {first_page.get('hits')} hits; "
+                  f"only the first {self.MAX_OFFSET + self.PAGE_SIZE} are reachable")
+            return []
+        return [{**filters, facet: value} for value in values]
+
+    def _remaining_offsets(self, first_page: dict) -> List[int]:
+        """Offsets still to fetch after the first page."""
+        if len(first_page.get("jobs", [])) < self.PAGE_SIZE:
+            return []
+        total_hits = first_page.get("hits", 0)
+        return list(range(self.PAGE_SIZE, min(total_hits, self.MAX_OFFSET + 1), self.PAGE_SIZE))
+
+    def _fetch_page(self, offset: int, filters: Dict[str, str],
+                    facet: Optional[str] = None) -> Optional[dict]:
+        try:
+            response = self.client.get(self.API_URL, params=self._params(offset, filters, facet))
+            if response.status_code != 200:
+                return None
+            return response.json()
+        except Exception as e:
+            print(f"Error fetching Amazon jobs at offset {offset}: {e}")
+            return None
+
+    async def _fetch_page_async(self, offset: int, filters: Dict[str, str],
+                                facet: Optional[str] = None) -> Optional[dict]:
+        try:
+            response = await self.async_client.get(
+                self.API_URL, params=self._params(offset, filters, facet)
+            )
+            if response.status_code != 200:
+                return None
+            return response.json()
+        except Exception as e:
+            print(f"Error fetching Amazon jobs at offset {offset}: {e}")
+            return None
+
     def fetch_job_list(self) -> List[Job]:
         """Fetch all jobs from Amazon's jobs API."""
-        jobs = []
-        offset = 0
-        limit = 100
+        return [job for batch in self.iter_job_batches() for job in batch]
 
-        while True:
-            params = {
-                "radius": "24km",
-                "offset": offset,
-                "result_limit": limit,
-                "sort": "relevant",
-            }
+    async def fetch_job_list_async(self) -> List[Job]:
+        """Fetch all jobs from Amazon's jobs API using the async client."""
+        return [job async for batch in self.iter_job_batches_async() for job in batch]
 
-            try:
-                response = self.client.get(self.API_URL, params=params)
+    def iter_job_batches(self) -> Iterator[List[Job]]:
+        """Yield each results page's new jobs as soon as the page arrives."""
+        seen_ids = set()
+        pages = self._iter_recent_pages() if self.incremental else self._iter_pages()
+        for page in pages:
+            jobs = self._parse_pages([page], seen_ids)
+            if jobs:
+                yield jobs
 
-                if response.status_code != 200:
-                    break
+    async def iter_job_batches_async(self) -> AsyncIterator[List[Job]]:
+        """Async variant of ``iter_job_batches``."""
+        seen_ids = set()
+        pages = self._iter_recent_pages_async() if self.incremental else self._iter_pages_async()
+        async for page in pages:
+            jobs = self._parse_pages([page], seen_ids)
+            if jobs:
+                yield jobs
 
-                data = response.json()
-                job_list = data.get("jobs", [])
+    def _iter_recent_pages(self) -> Iterator[Optional[dict]]:
+        """Page newest-first until ``known_page_limit`` pages in a row hold only known jobs.
 
-                if not job_list:
-                    break
+        No facet partitioning: an incremental crawl never needs to go past
+        the offset cap. Each page is checked against known jobs before it
+        is yielded, since the caller may store its jobs straight away.
+        """
+        first_page = self._fetch_page(0, {})
+        if not first_page:
+            return
 
-                for job_data in job_list:
-                    job_id = job_data.get("id_icims")
-                    title = job_data.get("title", "")
-                    location = job_data.get("location", "")
-                    team = job_data.get("business_category", "")
-
-                    if job_id and title:
-                        jobs.append(Job(
-                            company=self.company_name,
-                            title=title,
-                            url=self.JOB_URL_TEMPLATE.format(job_id=job_id),
-                            location=location,
-                            team=team,
-                            source="amazon",
-                        ))
-
-                # Check if we've fetched all jobs
-                total_hits = data.get("hits", 0)
-                if len(jobs) >= total_hits or len(job_list) < limit:
-                    break
+        pages = chain([first_page], self._iter_windowed(
+            lambda offset: self._fetch_page(offset, {}),
+            self._remaining_offsets(first_page), self.PAGE_WINDOW,
+        ))
+        known_pages = 0
+        for page in pages:
+            known_pages = known_pages + 1 if self._all_known(self._parse_pages([page])) else 0
+            yield page
+            if known_pages >= self.known_page_limit:
+                break
+
+    async def _iter_recent_pages_async(self) -> AsyncIterator[Optional[dict]]:
+        """Async variant of ``_iter_recent_pages``."""
+        first_page = await self._fetch_page_async(0, {})
+        if not first_page:
+            return
 
-                offset += limit
+        known_pages = 1 if self._all_known(self._parse_pages([first_page])) else 0
+        yield first_page
+        if known_pages >= self.known_page_limit:
+            return
 
-                # Safety limit to prevent infinite loops
-                if offset > 15000:
+        # aclosing cancels the pages still in flight when we stop early
+        async with aclosing(self._aiter_windowed(
+            lambda offset: self._fetch_page_async(offset, {}),
+            self._remaining_offsets(first_page), self.PAGE_WINDOW,
+        )) as pages:
+            async for page in pages:
+                known_pages = known_pages + 1 if self._all_known(self._parse_pages([page])) else 0
+                yield page
+                if known_pages >= self.known_page_limit:
                     break
 
-            except Exception as e:
-                print(f"Error fetching Amazon jobs at offset {offset}: {e}")
-                break
+    def _expand(self, filters: Dict[str, str],
+                first_page: dict) -> Tuple[List[Dict[str, str]], List[int]]:
+        """Split a query into partitions, or list its remaining offsets."""
+        partitions = self._partitions(first_page, filters, self._next_facet(filters))
+        if partitions:
+            return partitions, []
+        return [], self._remaining_offsets(first_page)
+
+    def _request_facet(self, offset: int, filters: Dict[str, str]) -> Optional[str]:
+        # Only a query's first page asks for the counts of the facet it may split on
+        return self._next_facet(filters) if offset == 0 else None
+
+    def _iter_pages(self) -> Iterator[dict]:
+        """Yield every page of the whole crawl.
+
+        Partition first pages and page offsets share one window of
+        ``PAGE_WINDOW`` requests, so partitions are crawled in parallel;
+        each query's pages are re-assembled in offset order.
+        """
+        return self._iter_crawl(
+            lambda offset, filters: self._fetch_page(
+                offset, filters, self._request_facet(offset, filters)
+            ),
+            self._expand, {}, self.PAGE_WINDOW,
+        )
+
+    def _iter_pages_async(self) -> AsyncIterator[dict]:
+        """Async variant of ``_iter_pages``."""
+        return self._aiter_crawl(
+            lambda offset, filters: self._fetch_page_async(
+                offset, filters, self._request_facet(offset, filters)
+            ),
+            self._expand, {}, self.PAGE_WINDOW,
+        )
+
+    def _parse_pages(self, pages: List[Optional[dict]], seen_ids: Optional[set] = None) -> List[Job]:
+        """Parse pages in offset order, dropping jobs already seen.
+
+        Results can shift between concurrent requests, so the same
+        ``id_icims`` may show up on two neighbouring pages (or in two
+        partitions, for multi-valued facets). Pass ``seen_ids`` to dedup
+        across calls.
+        """
+        jobs = []
+        seen_ids = set() if seen_ids is None else seen_ids
+
+        for data in pages:
+            if not data:
+                continue
+
+            for job_data in data.get("jobs", []):
+                job_id = job_data.get("id_icims")
+                title = job_data.get("title", "")
+                location = job_data.get("location", "")
+                team = job_data.get("business_category", "")
+
+                if job_id and title and job_id not in seen_ids:
+                    seen_ids.add(job_id)
+                    jobs.append(Job(
+                        company=self.company_name,
+                        title=title,
+                        url=self.JOB_URL_TEMPLATE.format(job_id=job_id),
+                        location=location,
+                        team=team,
+                        source="amazon",
+                    ))
 
         return jobs
@@ -1,15 +1,54 @@
 """Ashby ATS adapter."""
 
+import asyncio
 import re
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
 from urllib.parse import urlparse
 
 from .base import CareerFetcher
+from ..detail_cache import DETAIL_CACHE
 from ..models import Job
 
 
 class AshbyFetcher(CareerFetcher):
-    """Fetcher for Ashby ATS job boards."""
+    """Fetcher for Ashby ATS job boards.
+
+    With ``FETCH_DETAILS`` on, descriptions are fetched in batches: each
+    GraphQL request asks for up to ``DETAIL_BATCH_SIZE`` postings through
+    aliased ``jobPosting`` fields, with at most ``DETAIL_CONCURRENCY``
+    requests in flight. Descriptions are cached by posting content hash
+    and expire after a few days, so only new or edited postings (and
+    descriptions due for a refresh) are fetched again.
+    """
+
+    FETCH_DETAILS = True
+    DETAIL_BATCH_SIZE = 25
+    DETAIL_CONCURRENCY = 4
+
+    # Ashby GraphQL API endpoint
+    API_URL = "https://jobs.ashbyhq.com/api/non-user-graphql"
+
+    # Updated query - jobPostings are now at the board level, not under teams
+    BOARD_QUERY = """
+        query ApiJobBoardWithTeams($organizationHostedJobsPageName: String!) {
+            jobBoard: jobBoardWithTeams(
+                organizationHostedJobsPageName: $organizationHostedJobsPageName
+            ) {
+                teams {
+                    id
+                    name
+                }
+                jobPostings {
+                    id
+                    title
+                    locationName
+                    employmentType
+                    teamId
+                }
+            }
+        }
+    """
 
     def __init__(self, company_name: str, career_url: str, timeout: float = 30.0):
         super().__init__(company_name, career_url, timeout)
@@ -28,49 +67,137 @@ class AshbyFetcher(CareerFetcher):
         # Fallback to company name slug
         return self.company_name.lower().replace(" ", "")
 
-    def fetch_job_list(self) -> List[Job]:
-        """Fetch jobs from Ashby GraphQL API."""
-        jobs = []
-
-        # Ashby GraphQL API endpoint
-        api_url = "https://jobs.ashbyhq.com/api/non-user-graphql"
-
-        # Updated query - jobPostings are now at the board level, not under teams
-        query = {
+    def _board_query(self) -> dict:
+        """Build the GraphQL job board request body."""
+        return {
             "operationName": "ApiJobBoardWithTeams",
             "variables": {
                 "organizationHostedJobsPageName": self.company_slug
             },
-            "query": """
-                query ApiJobBoardWithTeams($organizationHostedJobsPageName: String!) {
-                    jobBoard: jobBoardWithTeams(
-                        organizationHostedJobsPageName: $organizationHostedJobsPageName
-                    ) {
-                        teams {
-                            id
-                            name
-                        }
-                        jobPostings {
-                            id
-                            title
-                            locationName
-                            employmentType
-                            teamId
-                        }
-                    }
-                }
-            """
+            "query": self.BOARD_QUERY,
         }
 
+    def _detail_query(self, posting_ids: List[str]) -> dict:
+        """Build one GraphQL request for the descriptions of several postings."""
+        params = "".join(f", $id{i}: String!" for i in range(len(posting_ids)))
+        fields = "\n".join(
+            f"p{i}: jobPosting(organizationHostedJobsPageName: $organizationHostedJobsPageName, "
+            f"jobPostingId: $id{i}) {{ id descriptionPlainText }}"
+            for i in range(len(posting_ids))
+        )
+        variables = {f"id{i}": posting_id for i, posting_id in enumerate(posting_ids)}
+        variables["organizationHostedJobsPageName"] = self.company_slug
+        return {
+            "operationName": "ApiJobPostings",
+            "variables": variables,
+            "query": f"query ApiJobPostings($organizationHostedJobsPageName: String!{params}) {{\n{fields}\n}}",
+        }
+
+    @staticmethod
+    def _parse_detail_response(data: dict) -> Dict[str, str]:
+        """Map posting id -> description from an aliased detail response."""
+        details = {}
+        for posting in (data.get("data") or {}).values():
+            if posting and posting.get("id"):
+                details[posting["id"]] = posting.get("descriptionPlainText") or ""
+        return details
+
+    def _fetch_detail_batch(self, posting_ids: List[str]) -> Dict[str, str]:
         try:
             response = self.client.post(
-                api_url,
-                json=query,
+                self.API_URL,
+                json=self._detail_query(posting_ids),
                 headers={"Content-Type": "application/json"}
             )
             if response.status_code == 200:
+                return self._parse_detail_response(response.json())
+        except Exception as e:
+            print(f"Error fetching Ashby job details for {self.company_name}: {e}")
+        return {}
+
+    async def _fetch_detail_batch_async(self, posting_ids: List[str],
+                                        semaphore: asyncio.Semaphore) -> Dict[str, str]:
+        async with semaphore:
+            try:
+                response = await self.async_client.post(
+                    self.API_URL,
+                    json=self._detail_query(posting_ids),
+                    headers={"Content-Type": "application/json"}
+                )
+                if response.status_code == 200:
+                    return self._parse_detail_response(response.json())
+            except Exception as e:
+                print(f"Error fetching Ashby job details for {self.company_name}: {e}")
+        return {}
+
+    def _plan_details(self, data: dict) -> Tuple[Dict[str, str], Dict[str, dict], List[List[str]]]:
+        """Work out which descriptions are cached and which need fetching.
+
+        Returns:
+            Tuple of (posting id -> content hash, cache entries by content
+            hash, batches of posting ids to fetch).
+        """
+        postings = data.get("data", {}).get("jobBoard", {}).get("jobPostings", [])
+        hashes = {
+            posting["id"]: DETAIL_CACHE.content_hash(posting)
+            for posting in postings if posting.get("id")
+        }
+        cached = DETAIL_CACHE.load(self.company_slug)
+        missing = [posting_id for posting_id, key in hashes.items() if key not in cached]
+        batches = [
+            missing[i:i + self.DETAIL_BATCH_SIZE]
+            for i in range(0, len(missing), self.DETAIL_BATCH_SIZE)
+        ]
+        return hashes, cached, batches
+
+    def _apply_details(self, jobs: List[Job], hashes: Dict[str, str], cached: Dict[str, dict],
+                       fetched: List[Dict[str, str]]) -> None:
+        """Attach descriptions to jobs and save the board's cache."""
+        for details in fetched:
+            for posting_id, description in details.items():
+                if posting_id in hashes:
+                    cached[hashes[posting_id]] = DETAIL_CACHE.entry(description)
+
+        for job in jobs:
+            key = hashes.get(job.url.rsplit("/", 1)[-1])
+            if key in cached:
+                job.description = cached[key]["description"]
+
+        DETAIL_CACHE.save(
+            self.company_slug, {key: cached[key] for key in hashes.values() if key in cached}
+        )
+
+    def _add_details(self, jobs: List[Job], data: dict) -> None:
+        hashes, cached, batches = self._plan_details(data)
+        with ThreadPoolExecutor(max_workers=self.DETAIL_CONCURRENCY) as executor:
+            fetched = list(executor.map(self._fetch_detail_batch, batches))
+        self._apply_details(jobs, hashes, cached, fetched)
+
+    async def _add_details_async(self, jobs: List[Job], data: dict) -> None:
+        hashes, cached, batches = self._plan_details(data)
+        semaphore = asyncio.Semaphore(self.DETAIL_CONCURRENCY)
+        fetched = await asyncio.gather(
+            *(self._fetch_detail_batch_async(batch, semaphore) for batch in batches)
+        )
+        self._apply_details(jobs, hashes, cached, fetched)
+
+    def fetch_job_list(self) -> List[Job]:
+        """Fetch jobs from Ashby GraphQL API."""
+        jobs = []
+
+        try:
+            response = self.client.post(
+                self.API_URL,
+                json=self._board_query(),
+                headers={"Content-Type": "application/json"}
+            )
+            if response.status_code == 200:
+                if self._check_unchanged(response.content):
+                    return []
                 data = response.json()
                 jobs = self._parse_graphql_response(data)
+                if self.FETCH_DETAILS:
+                    self._add_details(jobs, data)
             else:
                 # Try fetching from HTML page
                 jobs = self._fetch_from_html()
@@ -80,6 +207,31 @@ class AshbyFetcher(CareerFetcher):
 
         return jobs
 
+    async def fetch_job_list_async(self) -> List[Job]:
+        """Fetch jobs from Ashby GraphQL API using the async client."""
+        jobs = []
+
+        try:
+            response = await self.async_client.post(
+                self.API_URL,
+                json=self._board_query(),
+                headers={"Content-Type": "application/json"}
+            )
+            if response.status_code == 200:
+                if self._check_unchanged(response.content):
+                    return []
+                data = response.json()
+                jobs = self._parse_graphql_response(data)
+                if self.FETCH_DETAILS:
+                    await self._add_details_async(jobs, data)
+            else:
+                jobs = await asyncio.to_thread(self._fetch_from_html)
+        except Exception as e:
+            print(f"Error fetching Ashby jobs for {self.company_name}: {e}")
+            jobs = await asyncio.to_thread(self._fetch_from_html)
+
+        return jobs
+
     def _parse_graphql_response(self, data: dict) -> List[Job]:
         """Parse jobs from GraphQL response."""
         jobs = []
@@ -1,34 +1,78 @@
 """Base interface for career page fetchers."""
 
+import asyncio
+import hashlib
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from itertools import count, islice
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, List, Optional, Set, Tuple,
+)
 import httpx
 
 from ..models import Job
+from ..http_client import CLIENT_MANAGER
+from .browser import BROWSER_POOL
+
+
+@asynccontextmanager
+async def aclosing(agen):
+    """Close an async generator on exit (``contextlib.aclosing`` needs Python 3.10)."""
+    try:
+        yield agen
+    finally:
+        await agen.aclose()
 
 
 class CareerFetcher(ABC):
     """Abstract base class for ATS-specific job fetchers."""
 
+    # Browser-based fetchers run on the shared browser pool's workers
+    uses_browser = False
+
     def __init__(self, company_name: str, career_url: str, timeout: float = 30.0):
         self.company_name = company_name
         self.career_url = career_url
         self.timeout = timeout
         self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        # Fingerprint of the board as of the last run (set by the caller)
+        # and of the board as fetched now (set by fetch_job_list).
+        self.previous_fingerprint: Optional[str] = None
+        self.fingerprint: Optional[str] = None
+        # Incremental mode (set by the caller): paginating fetchers ask for
+        # the most recent postings first and stop after ``known_page_limit``
+        # consecutive pages whose jobs ``is_known`` already.
+        self.is_known: Optional[Callable[[str], bool]] = None
+        self.known_page_limit = 0
+        # Delta sync (set by the caller; used by fetchers whose source reports
+        # per-job update times): only jobs updated after ``since`` are
+        # returned. ``open_urls`` is every job on the board, so jobs in
+        # ``previous_open_urls`` but no longer open count as closed. Both
+        # hold ``Job.job_key`` URLs, the key ``JobStore`` dedups on.
+        self.delta_sync = False
+        self.since: Optional[str] = None
+        self.previous_open_urls: Optional[Set[str]] = None
+        self.high_water_mark: Optional[str] = None
+        self.open_urls: Optional[Set[str]] = None
 
     @property
     def client(self) -> httpx.Client:
-        """Get or create HTTP client."""
+        """Get HTTP client borrowed from the shared connection pool."""
         if self._client is None:
-            self._client = httpx.Client(
-                timeout=self.timeout,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                },
-                follow_redirects=True,
-            )
+            self._client = CLIENT_MANAGER.get_client(self.timeout)
         return self._client
 
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Get async HTTP client borrowed from the shared connection pool."""
+        if self._async_client is None:
+            self._async_client = CLIENT_MANAGER.get_async_client(self.timeout)
+        return self._async_client
+
     @abstractmethod
     def fetch_job_list(self) -> List[Job]:
         """Fetch all jobs from the career page.
@@ -38,14 +82,283 @@ class CareerFetcher(ABC):
         """
         pass
 
+    async def fetch_job_list_async(self) -> List[Job]:
+        """Fetch all jobs without blocking the event loop.
+
+        Fetchers that talk to a plain JSON API override this with a native
+        ``httpx.AsyncClient`` implementation. Browser-based fetchers run
+        their blocking ``fetch_job_list`` on a browser pool worker (which
+        owns a long-lived Chromium); other multi-step fetchers run it in a
+        plain worker thread.
+
+        Returns:
+            List of Job objects found on the career page.
+        """
+        if self.uses_browser:
+            return await BROWSER_POOL.run(self.fetch_job_list)
+        return await asyncio.to_thread(self.fetch_job_list)
+
+    def iter_job_batches(self) -> Iterator[List[Job]]:
+        """Yield jobs in batches as the board is fetched.
+
+        Paginating fetchers override this to yield each results page as
+        soon as it is parsed, so callers can store and filter jobs while
+        later pages are still downloading, holding only a page's worth of
+        jobs at a time. By default the whole board is one batch.
+        """
+        jobs = self.fetch_job_list()
+        if jobs:
+            yield jobs
+
+    async def iter_job_batches_async(self) -> AsyncIterator[List[Job]]:
+        """Async variant of ``iter_job_batches``."""
+        jobs = await self.fetch_job_list_async()
+        if jobs:
+            yield jobs
+
+    @staticmethod
+    def _iter_windowed(fetch: Callable, items: Iterable, window: int) -> Iterator:
+        """Yield ``fetch(item)`` for each item, in order, with up to ``window``
+        calls running ahead on worker threads.
+
+        At most ``window`` results are held at once. Stopping early cancels
+        calls that have not started yet.
+        """
+        items = iter(items)
+        window = max(1, window)
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=window) as executor:
+            try:
+                pending.extend(executor.submit(fetch, item) for item in islice(items, window))
+                while pending:
+                    result = pending.popleft().result()
+                    pending.extend(executor.submit(fetch, item) for item in islice(items, 1))
+                    yield result
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    @staticmethod
+    async def _aiter_windowed(fetch: Callable[..., Awaitable], items: Iterable,
+                              window: int) -> AsyncIterator:
+        """Async variant of ``_iter_windowed``; ``fetch`` returns a coroutine."""
+        items = iter(items)
+        window = max(1, window)
+        pending = deque()
+        try:
+            pending.extend(asyncio.ensure_future(fetch(item)) for item in islice(items, window))
+            while pending:
+                result = await pending.popleft()
+                pending.extend(asyncio.ensure_future(fetch(item)) for item in islice(items, 1))
+                yield result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    def _iter_crawl(fetch: Callable, expand: Callable, query: Any, window: int) -> Iterator:
+        """Yield the pages of a paged crawl that may split into partitions.
+
+        ``fetch(offset, query)`` requests one page, on worker threads with
+        at most ``window`` pages in flight or held back at once.
+        ``expand(query, first_page)`` returns ``(partitions, offsets)``:
+        sub-queries to crawl instead (their first pages are requested next,
+        and the page that split is not yielded), or the query's remaining
+        offsets.
+
+        Partitions are crawled in parallel, but each query's pages are
+        yielded in offset order, so results stay deterministic. Missing
+        (None) pages are skipped. A new request is only sent once the
+        consumer took a page.
+        """
+        crawl = _PagedCrawl(expand, query, window)
+        running = {}
+        with ThreadPoolExecutor(max_workers=max(1, window)) as executor:
+            try:
+                while crawl.todo or running:
+                    while crawl.can_send(len(running)):
+                        request = crawl.todo.popleft()
+                        running[executor.submit(fetch, request[0], request[1])] = request
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from crawl.complete(running.pop(future), future.result())
+            finally:
+                for future in running:
+                    future.cancel()
+
+    @staticmethod
+    async def _aiter_crawl(fetch: Callable[..., Awaitable], expand: Callable, query: Any,
+                           window: int) -> AsyncIterator:
+        """Async variant of ``_iter_crawl``; ``fetch`` returns a coroutine."""
+        crawl = _PagedCrawl(expand, query, window)
+        running = {}
+        try:
+            while crawl.todo or running:
+                while crawl.can_send(len(running)):
+                    request = crawl.todo.popleft()
+                    running[asyncio.ensure_future(fetch(request[0], request[1]))] = request
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    for page in crawl.complete(running.pop(task), task.result()):
+                        yield page
+        finally:
+            for task in running:
+                task.cancel()
+
+    @property
+    def incremental(self) -> bool:
+        """Whether pagination may stop early on already-known jobs."""
+        return self.is_known is not None and self.known_page_limit > 0
+
+    def _all_known(self, page_jobs: List[Job]) -> bool:
+        """Whether every job on a results page is already known."""
+        return self.incremental and bool(page_jobs) and all(
+            self.is_known(job.url) for job in page_jobs
+        )
+
+    @property
+    def closed_urls(self) -> Set[str]:
+        """Job keys (URLs) of jobs that were open last sync but are gone now."""
+        if self.open_urls is None or not self.previous_open_urls:
+            return set()
+        return self.previous_open_urls - self.open_urls
+
+    @staticmethod
+    def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+        """Parse an ISO 8601 timestamp into an aware UTC datetime."""
+        if not value:
+            return None
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.astimezone(timezone.utc)
+
+    def _apply_delta(self, jobs: List[Job]) -> List[Job]:
+        """Record the board's open jobs and high-water mark; in delta mode
+        return only the jobs updated since the last sync.
+        """
+        if not self.delta_sync:
+            return jobs
+
+        self.open_urls = {job.job_key for job in jobs}
+        stamps = [self._parse_timestamp(job.updated_at) for job in jobs]
+        stamps = [stamp for stamp in stamps if stamp is not None]
+        if stamps:
+            self.high_water_mark = max(stamps).isoformat()
+
+        since = self._parse_timestamp(self.since)
+        if since is None:
+            return jobs
+
+        # Jobs missing from the last sync are emitted even with an old
+        # timestamp (e.g. a reopened posting)
+        previous = self.previous_open_urls or set()
+        delta = []
+        for job in jobs:
+            updated = self._parse_timestamp(job.updated_at)
+            if job.job_key not in previous or updated is None or updated > since:
+                delta.append(job)
+        return delta
+
+    @property
+    def unchanged(self) -> bool:
+        """Whether the board matched ``previous_fingerprint`` on this fetch."""
+        return self.fingerprint is not None and self.fingerprint == self.previous_fingerprint
+
+    def _check_unchanged(self, payload: bytes) -> bool:
+        """Fingerprint a raw board payload and compare it to the last run.
+
+        Single-request API fetchers call this before parsing so an
+        unchanged board skips parsing entirely (they return no jobs and
+        the caller checks ``unchanged``).
+        """
+        self.fingerprint = hashlib.sha256(payload).hexdigest()
+        return self.unchanged
+
+    @staticmethod
+    def fingerprint_urls(urls: Iterable[str]) -> str:
+        """Fingerprint a board by its canonical job URLs (in any order)."""
+        return hashlib.sha256("\n".join(sorted(set(urls))).encode()).hexdigest()
+
     def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client is not None:
-            self._client.close()
-            self._client = None
+        """Release the HTTP client.
+
+        The underlying pool is shared, so it stays open for other fetchers;
+        ``CLIENT_MANAGER.close()`` shuts it down at the end of a run.
+        """
+        self._client = None
+
+    async def aclose(self) -> None:
+        """Release both the async and the blocking HTTP clients."""
+        self._async_client = None
+        self.close()
 
     def __enter__(self) -> "CareerFetcher":
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         self.close()
+
+    async def __aenter__(self) -> "CareerFetcher":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+
+class _PagedCrawl:
+    """Request queue and reorder buffer behind ``CareerFetcher._iter_crawl``.
+
+    Requests are ``(offset, query, key, index)`` tuples, where ``key``
+    identifies the query and ``index`` is the page's position in it.
+    """
+
+    def __init__(self, expand: Callable, query: Any, window: int):
+        self.expand = expand
+        self.window = max(1, window)
+        self.todo = deque()
+        self._keys = count()
+        self._pages = {}  # key -> [next index to yield, page count, {index: page}]
+        self._held = 0
+        self.todo.append(self._first_request(query))
+
+    def _first_request(self, query: Any) -> Tuple:
+        key = next(self._keys)
+        self._pages[key] = [0, 1, {}]
+        return (0, query, key, 0)
+
+    def can_send(self, running: int) -> bool:
+        """Whether another request fits in the window."""
+        return bool(self.todo) and running + self._held < self.window
+
+    def complete(self, request: Tuple, page: Optional[Any]) -> List:
+        """Record a fetched page; return the pages now due, in order."""
+        _, query, key, index = request
+        partitions, offsets = [], []
+        if index == 0 and page:
+            partitions, offsets = self.expand(query, page)
+
+        # Partitions go first, so splits are found early
+        self.todo.extendleft(reversed([self._first_request(partition) for partition in partitions]))
+        self.todo.extend((offset, query, key, i) for i, offset in enumerate(offsets, 1))
+
+        state = self._pages[key]
+        state[1] += len(offsets)
+        state[2][index] = None if partitions else page
+        self._held += 1
+
+        due = []
+        while state[0] in state[2]:
+            ready = state[2].pop(state[0])
+            state[0] += 1
+            self._held -= 1
+            if ready:
+                due.append(ready)
+        if state[0] == state[1]:
+            del self._pages[key]
+        return due
@@ -0,0 +1,234 @@
+"""Shared Playwright browser pool for browser-based fetchers."""
+
+import asyncio
+import importlib.util
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, List, Optional
+from urllib.parse import urlparse
+
+
+class BrowserPool:
+    """Launches Chromium once per worker and hands out isolated contexts.
+
+    Playwright's sync API is bound to the thread that started it, so the
+    pool keeps one browser per thread (created on first use) and runs
+    browser fetchers on its own small executor. Each fetch gets a fresh
+    context, so cookies and storage never leak between companies, while
+    the expensive browser launch happens only once per worker per run.
+
+    A global semaphore caps how many pages are open at once across all
+    workers.
+
+    Contexts abort requests for non-essential resource types (images,
+    fonts, media) and known tracker hosts. When a ``storage_key`` is given,
+    the context's cookies/local storage are loaded from and saved back to
+    ``storage_dir`` so consent walls are only negotiated once.
+    """
+
+    BLOCK_RESOURCE_TYPES = ["image", "font", "media"]
+    BLOCK_HOSTS = [
+        "google-analytics.com",
+        "googletagmanager.com",
+        "doubleclick.net",
+        "connect.facebook.net",
+        "hotjar.com",
+        "segment.io",
+        "optimizely.com",
+    ]
+
+    def __init__(self, workers: int = 2, max_pages: int = 4, headless: bool = True,
+                 storage_dir: str = ".cache/browser"):
+        self.workers = workers
+        self.max_pages = max_pages
+        self.headless = headless
+        self.storage_dir = Path(storage_dir)
+        self.block_resource_types: List[str] = list(self.BLOCK_RESOURCE_TYPES)
+        self.block_hosts: List[str] = list(self.BLOCK_HOSTS)
+        self._local = threading.local()
+        self._page_slots = threading.BoundedSemaphore(max_pages)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def configure(self, config: Optional[dict]) -> None:
+        """Apply the ``browser`` section of settings.yaml."""
+        config = config or {}
+        self.workers = int(config.get("workers", self.workers))
+        self.max_pages = int(config.get("max_pages", self.max_pages))
+        self.headless = bool(config.get("headless", self.headless))
+        self.storage_dir = Path(config.get("storage_dir", self.storage_dir))
+        self.block_resource_types = list(
+            config.get("block_resource_types", self.block_resource_types)
+        )
+        self.block_hosts = list(config.get("block_hosts", self.block_hosts))
+        self._page_slots = threading.BoundedSemaphore(self.max_pages)
+
+    @staticmethod
+    def available() -> bool:
+        """Whether Playwright is installed."""
+        return importlib.util.find_spec("playwright") is not None
+
+    def _browser(self):
+        """Get (or launch) the browser owned by the calling thread."""
+        state = getattr(self._local, "state", None)
+        if state is None:
+            from playwright.sync_api import sync_playwright
+
+            playwright = sync_playwright().start()
+            browser = playwright.chromium.launch(headless=self.headless)
+            state = (playwright, browser)
+            self._local.state = state
+        return state[1]
+
+    def _route(self, route) -> None:
+        """Abort non-essential requests, let everything else through."""
+        request = route.request
+        host = urlparse(request.url).netloc
+        if request.resource_type in self.block_resource_types or any(
+            host == blocked or host.endswith("." + blocked) for blocked in self.block_hosts
+        ):
+            route.abort()
+        else:
+            route.continue_()
+
+    def _storage_path(self, storage_key: str) -> Path:
+        safe_key = re.sub(r"[^A-Za-z0-9._-]", "_", storage_key)
+        return self.storage_dir / f"{safe_key}.json"
+
+    @contextmanager
+    def context(self, storage_key: Optional[str] = None, **options):
+        """Open an isolated browser context for one company.
+
+        Args:
+            storage_key: Name under which cookies/local storage are persisted
+                between runs (e.g. the fetcher's source name).
+            **options: Extra ``browser.new_context`` options.
+        """
+        storage_path = self._storage_path(storage_key) if storage_key else None
+        if storage_path is not None and storage_path.exists():
+            options.setdefault("storage_state", str(storage_path))
+
+        context = self._browser().new_context(**options)
+        context.route("**/*", self._route)
+        try:
+            yield context
+            if storage_path is not None:
+                storage_path.parent.mkdir(parents=True, exist_ok=True)
+                context.storage_state(path=str(storage_path))
+        finally:
+            context.close()
+
+    @contextmanager
+    def page(self, context=None, storage_key: Optional[str] = None, **options):
+        """Open a page, waiting for a free page slot first.
+
+        Args:
+            context: Existing context to open the page in. If omitted, a
+                fresh isolated context is created and closed with the page.
+            storage_key: Persisted storage name for a fresh context.
+            **options: Context options used when creating a fresh context.
+        """
+        with self._page_slots:
+            if context is not None:
+                page = context.new_page()
+                try:
+                    yield page
+                finally:
+                    page.close()
+            else:
+                with self.context(storage_key=storage_key, **options) as own_context:
+                    yield own_context.new_page()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="browser"
+                )
+            return self._executor
+
+    async def run(self, fn: Callable, *args):
+        """Run a blocking browser fetch on one of the pool's workers."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), fn, *args)
+
+    def _close_thread_browser(self) -> None:
+        state = getattr(self._local, "state", None)
+        if state is None:
+            return
+        self._local.state = None
+        playwright, browser = state
+        try:
+            browser.close()
+        finally:
+            playwright.stop()
+
+    def _close_worker(self, barrier: threading.Barrier) -> None:
+        # The barrier makes every worker thread pick up exactly one close task
+        try:
+            barrier.wait(timeout=30)
+        except threading.BrokenBarrierError:
+            pass
+        self._close_thread_browser()
+
+    def close(self) -> None:
+        """Close every browser the pool launched and stop its workers."""
+        self._close_thread_browser()
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is None:
+            return
+
+        barrier = threading.Barrier(self.workers)
+        futures = [executor.submit(self._close_worker, barrier) for _ in range(self.workers)]
+        wait(futures)
+        executor.shutdown()
+
+
+# Process-wide pool shared by all browser-based fetchers
+BROWSER_POOL = BrowserPool()
+
+
+def run_and_wait_for_response(page, url_fragment: str, action: Callable[[], None],
+                              timeout_ms: float = 10000) -> bool:
+    """Run a page action and wait until a response whose URL contains
+    ``url_fragment`` arrives.
+
+    Used instead of fixed sleeps: the fetchers already know which XHR
+    carries the data they want, so waiting on it returns as soon as the
+    data is in.
+
+    Returns:
+        True if a matching response arrived, False on timeout.
+    """
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    try:
+        with page.expect_response(lambda response: url_fragment in response.url, timeout=timeout_ms):
+            action()
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+def wait_for_growth(page, previous_height: int, timeout_ms: float = 2000) -> bool:
+    """Wait until the document grows past ``previous_height`` pixels.
+
+    Returns:
+        True if new content appeared, False on timeout.
+    """
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    try:
+        page.wait_for_function(
+            "height => document.body.scrollHeight > height",
+            arg=previous_height,
+            timeout=timeout_ms,
+        )
+        return True
+    except PlaywrightTimeoutError:
+        return False
@@ -1,13 +1,136 @@
 """ATS detection logic."""
 
+import json
 import re
-from typing import Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlparse
-import httpx
+
+from ..http_client import CLIENT_MANAGER
+
+
+class DetectionCache:
+    """Remembers detected ATS types by career URL between runs.
+
+    'unknown' results expire after ``unknown_ttl_days`` rather than
+    ``ttl_days``, so a page that was briefly broken or served a stub is
+    checked again soon.
+    """
+
+    def __init__(self, path: str = ".cache/ats_detection.json", ttl_days: float = 30,
+                 unknown_ttl_days: float = 1):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_days * 86400
+        self.unknown_ttl_seconds = unknown_ttl_days * 86400
+        self._entries: Optional[Dict[str, dict]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, dict]:
+        if self._entries is None:
+            self._entries = {}
+            if self.path.exists():
+                try:
+                    with open(self.path, "r") as f:
+                        self._entries = json.load(f)
+                except Exception:
+                    self._entries = {}
+        return self._entries
+
+    def get(self, url: str) -> Optional[Tuple[str, str]]:
+        """Get the cached ``(ats_type, evidence)`` for a URL, or None if missing or stale."""
+        with self._lock:
+            entry = self._load().get(url)
+        if entry is None:
+            return None
+        ats_type = entry.get("ats_type", "unknown")
+        ttl = self.unknown_ttl_seconds if ats_type == "unknown" else self.ttl_seconds
+        if time.time() - entry.get("detected_at", 0) > ttl:
+            return None
+        return ats_type, entry.get("evidence", "")
+
+    def set(self, url: str, ats_type: str, evidence: str = "") -> None:
+        with self._lock:
+            self._load()[url] = {
+                "ats_type": ats_type,
+                "evidence": evidence,
+                "detected_at": time.time(),
+            }
+            self._dirty = True
+
+    def flush(self) -> None:
+        """Write new detections to disk."""
+        with self._lock:
+            if not self._dirty:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "w") as f:
+                json.dump(self._entries, f, indent=2)
+            self._dirty = False
+
+
+# Process-wide cache shared by all detectors
+DETECTION_CACHE = DetectionCache()
+
+
+class IndicatorMatcher:
+    """Finds the highest-priority ATS indicator in a text in one pass.
+
+    All patterns are compiled into a single case-insensitive alternation
+    with one named group per pattern. Priority follows the order of the
+    ATS families in ``patterns``; scanning stops early once a hit of the
+    top family is found.
+    """
+
+    def __init__(self, patterns: Dict[str, List[str]]):
+        self._families: List[Tuple[int, str]] = []
+        branches = []
+        for rank, (ats_type, family_patterns) in enumerate(patterns.items()):
+            for pattern in family_patterns:
+                branches.append(f"(?P<p{len(self._families)}>{pattern})")
+                self._families.append((rank, ats_type))
+        self._regex = re.compile("|".join(branches), re.IGNORECASE) if branches else None
+
+    def search(self, text: str) -> Optional[Tuple[str, str]]:
+        """Find the best hit in ``text``.
+
+        Returns:
+            ``(ats_type, evidence)`` where evidence is the matched text,
+            or None if nothing matched.
+        """
+        best = self.search_ranked(text)
+        return (best[1], best[2]) if best else None
+
+    def search_ranked(self, text: str) -> Optional[Tuple[int, str, str]]:
+        """Like ``search``, but return ``(rank, ats_type, evidence)``; rank 0 is best."""
+        if self._regex is None:
+            return None
+
+        best = None
+        for match in self._regex.finditer(text):
+            rank, ats_type = self._families[int(match.lastgroup[1:])]
+            if best is None or rank < best[0]:
+                best = (rank, ats_type, match.group())
+                if rank == 0:
+                    break
+        return best
 
 
 class ATSDetector:
-    """Detects which ATS system a career page uses."""
+    """Detects which ATS system a career page uses.
+
+    Pages are streamed and checked chunk by chunk; reading stops as soon
+    as an indicator of the top-priority family is found or after
+    ``SNIFF_BYTES``, and the highest-priority hit seen wins. Results are
+    cached per URL in ``DETECTION_CACHE``.
+    """
+
+    SNIFF_BYTES = 256 * 1024
+    # Characters carried over between chunks so matches spanning a boundary are found
+    CHUNK_OVERLAP = 512
 
     ATS_PATTERNS = {
         "greenhouse": [
@@ -52,15 +175,25 @@ class ATSDetector:
         ],
     }
 
+    # Finds an ATS URL inside an iframe's src attribute
+    IFRAME_SRC_TEMPLATE = r"""<iframe[^>]+src=["'][^"']*?(?:{patterns})"""
+
     def __init__(self, timeout: float = 15.0):
         self.timeout = timeout
-        self.client = httpx.Client(
-            timeout=timeout,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-            },
-            follow_redirects=True,
-        )
+        self.client = CLIENT_MANAGER.get_client(timeout)
+        self._url_matcher = IndicatorMatcher(self.ATS_PATTERNS)
+        self._html_matcher = IndicatorMatcher(self._html_patterns())
+
+    def _html_patterns(self) -> Dict[str, List[str]]:
+        """HTML indicators and iframe sources of each ATS family, as regexes."""
+        patterns = {}
+        for ats_type in dict.fromkeys([*self.HTML_INDICATORS, *self.ATS_PATTERNS]):
+            family = [re.escape(indicator) for indicator in self.HTML_INDICATORS.get(ats_type, [])]
+            url_patterns = self.ATS_PATTERNS.get(ats_type)
+            if url_patterns:
+                family.append(self.IFRAME_SRC_TEMPLATE.format(patterns="|".join(url_patterns)))
+            patterns[ats_type] = family
+        return patterns
 
     def detect(self, career_url: str) -> str:
         """Detect ATS type from career URL.
@@ -71,58 +204,93 @@ class ATSDetector:
         Returns:
             ATS type: 'greenhouse', 'lever', 'ashby', 'workday', or 'unknown'
         """
+        return self.detect_with_evidence(career_url)[0]
+
+    def detect_with_evidence(self, career_url: str) -> Tuple[str, str]:
+        """Detect ATS type and return the text that gave it away.
+
+        Returns:
+            ``(ats_type, evidence)``; evidence is empty for 'unknown'.
+        """
+        result = self._detect(career_url)
+        DETECTION_CACHE.flush()
+        return result
+
+    def detect_many(self, career_urls: Iterable[str], concurrency: int = 16) -> Dict[str, str]:
+        """Detect ATS types for many career URLs concurrently.
+
+        Args:
+            career_urls: Career page URLs (duplicates are detected once).
+            concurrency: Maximum pages fetched at once.
+
+        Returns:
+            Dict mapping each URL to its ATS type.
+        """
+        urls = list(dict.fromkeys(career_urls))
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            results = {
+                url: ats_type for url, (ats_type, _) in zip(urls, executor.map(self._detect, urls))
+            }
+        DETECTION_CACHE.flush()
+        return results
+
+    def _detect(self, career_url: str) -> Tuple[str, str]:
         # First check URL patterns
-        ats_type = self._check_url_patterns(career_url)
-        if ats_type:
-            return ats_type
+        hit = self._url_matcher.search(career_url)
+        if hit:
+            return hit
+
+        cached = DETECTION_CACHE.get(career_url)
+        if cached:
+            return cached
+
+        # Fetch page and check HTML content; failed fetches (including
+        # streams cut off part way) are not cached, and pages with no
+        # indicator only for a short while
+        hit = self._sniff_page(career_url)
+        if hit is None:
+            return "unknown", ""
+        DETECTION_CACHE.set(career_url, *hit)
+        return hit
+
+    def _sniff_page(self, career_url: str) -> Optional[Tuple[str, str]]:
+        """Stream a career page, keeping its highest-priority ATS indicator.
 
-        # Fetch page and check HTML content
+        A lower-priority hit (e.g. a generic "workday" mention) does not end
+        the scan, as an embed of a higher-priority ATS may come further down.
+
+        Returns:
+            ``(ats_type, evidence)``, ``('unknown', '')`` if nothing was
+            found in the first ``SNIFF_BYTES``, or None if the page could
+            not be fetched.
+        """
         try:
-            response = self.client.get(career_url)
-            if response.status_code == 200:
-                ats_type = self._check_html_content(response.text)
-                if ats_type:
-                    return ats_type
-
-                # Check for iframe sources
-                ats_type = self._check_iframe_sources(response.text)
-                if ats_type:
-                    return ats_type
+            # Bypass the response cache, which would read the whole body
+            with self.client.stream("GET", career_url, extensions={"no_cache": True}) as response:
+                if response.status_code != 200:
+                    return None
+
+                best = None
+                tail = ""
+                for chunk in response.iter_text():
+                    window = tail + chunk
+                    hit = self._html_matcher.search_ranked(window)
+                    if hit and (best is None or hit[0] < best[0]):
+                        best = hit
+                        if best[0] == 0:
+                            break
+                    if response.num_bytes_downloaded >= self.SNIFF_BYTES:
+                        break
+                    tail = window[-self.CHUNK_OVERLAP:]
         except Exception:
-            pass
-
-        return "unknown"
-
-    def _check_url_patterns(self, url: str) -> Optional[str]:
-        """Check URL against known ATS patterns."""
-        for ats_type, patterns in self.ATS_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, url, re.IGNORECASE):
-                    return ats_type
-        return None
-
-    def _check_html_content(self, html: str) -> Optional[str]:
-        """Check HTML content for ATS indicators."""
-        html_lower = html.lower()
-        for ats_type, indicators in self.HTML_INDICATORS.items():
-            for indicator in indicators:
-                if indicator.lower() in html_lower:
-                    return ats_type
-        return None
-
-    def _check_iframe_sources(self, html: str) -> Optional[str]:
-        """Check iframe src attributes for ATS URLs."""
-        iframe_pattern = r'<iframe[^>]+src=["\']([^"\']+)["\']'
-        matches = re.findall(iframe_pattern, html, re.IGNORECASE)
-        for src in matches:
-            ats_type = self._check_url_patterns(src)
-            if ats_type:
-                return ats_type
-        return None
+            return None
+
+        return (best[1], best[2]) if best else ("unknown", "")
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        self.client.close()
+        """Release the HTTP client (the shared pool stays open)."""
+        DETECTION_CACHE.flush()
+        self.client = None
 
     def __enter__(self) -> "ATSDetector":
         return self
@@ -0,0 +1,96 @@
+"""Lazy mapping of ATS types to fetcher classes."""
+
+import importlib
+import threading
+from importlib.metadata import entry_points
+from typing import TYPE_CHECKING, Dict, List, Type, Union
+
+if TYPE_CHECKING:
+    from .base import CareerFetcher
+
+
+class FetcherRegistry:
+    """Maps ATS types to fetcher classes, importing each adapter on first use.
+
+    Built-in adapters are declared in ``BUILTIN_FETCHERS`` as
+    ``"module:Class"`` paths, so a run only imports the fetchers of the
+    companies it actually crawls. Unknown types fall back to the
+    ``generic`` fetcher.
+
+    Third-party adapters register without touching core, either by calling
+    ``register()`` or by exposing an entry point in the ``jobforge.fetchers``
+    group (name = ATS type, value = ``"package.module:Class"``). Entry points
+    are only scanned when a type missing from the table is looked up.
+    """
+
+    ENTRY_POINT_GROUP = "jobforge.fetchers"
+    FALLBACK_TYPE = "generic"
+
+    BUILTIN_FETCHERS = {
+        "greenhouse": f"{__package__}.greenhouse:GreenhouseFetcher",
+        "lever": f"{__package__}.lever:LeverFetcher",
+        "ashby": f"{__package__}.ashby:AshbyFetcher",
+        "workday": f"{__package__}.workday:WorkdayFetcher",
+        "uber": f"{__package__}.uber:UberFetcher",
+        "amazon": f"{__package__}.amazon:AmazonFetcher",
+        "meta": f"{__package__}.meta:MetaFetcher",
+        "google": f"{__package__}.google:GoogleFetcher",
+        "tiktok": f"{__package__}.tiktok:TikTokFetcher",
+        "generic": f"{__package__}.generic:GenericFetcher",
+    }
+
+    def __init__(self):
+        self._targets: Dict[str, Union[str, type]] = dict(self.BUILTIN_FETCHERS)
+        self._entry_points_loaded = False
+        self._lock = threading.RLock()
+
+    def register(self, ats_type: str, fetcher: Union[str, type]) -> None:
+        """Register a fetcher class, or its ``"module:Class"`` path, for an ATS type."""
+        with self._lock:
+            self._targets[ats_type] = fetcher
+
+    def types(self) -> List[str]:
+        """All registered ATS types (including entry point adapters)."""
+        with self._lock:
+            self._load_entry_points()
+            return list(self._targets)
+
+    def _load_entry_points(self) -> None:
+        if self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+        try:
+            found = entry_points()
+            if hasattr(found, "select"):
+                found = found.select(group=self.ENTRY_POINT_GROUP)
+            else:
+                found = found.get(self.ENTRY_POINT_GROUP, [])
+        except Exception:
+            return
+        for entry_point in found:
+            # Entry points never override adapters registered in code
+            self._targets.setdefault(entry_point.name, entry_point.value)
+
+    def get(self, ats_type: str) -> Type["CareerFetcher"]:
+        """Get the fetcher class for an ATS type, importing it if needed."""
+        with self._lock:
+            if ats_type not in self._targets:
+                self._load_entry_points()
+            if ats_type not in self._targets:
+                ats_type = self.FALLBACK_TYPE
+
+            target = self._targets[ats_type]
+            if isinstance(target, str):
+                module_name, _, class_name = target.partition(":")
+                target = getattr(importlib.import_module(module_name), class_name)
+                self._targets[ats_type] = target
+            return target
+
+    def create(self, ats_type: str, company_name: str, career_url: str,
+               timeout: float = 30.0) -> "CareerFetcher":
+        """Instantiate the fetcher for an ATS type."""
+        return self.get(ats_type)(company_name, career_url, timeout=timeout)
+
+
+# Process-wide registry used by the orchestrators
+FETCHER_REGISTRY = FetcherRegistry()
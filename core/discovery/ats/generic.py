@@ -1,15 +1,72 @@
 """Generic career page fetcher using Playwright."""
 
+import asyncio
+import codecs
 import re
-from typing import List
+from html.parser import HTMLParser
+from typing import List, Optional, Set
 from urllib.parse import urljoin, urlparse
 
 from .base import CareerFetcher
+from .browser import BROWSER_POOL, wait_for_growth
 from ..models import Job
 
 
 class GenericFetcher(CareerFetcher):
-    """Generic fetcher using Playwright for JavaScript-rendered pages."""
+    """Generic fetcher using Playwright for JavaScript-rendered pages.
+
+    Links are pulled out of the page with a streaming HTML tokenizer
+    (``_LinkExtractor``), so pages are parsed as they download, in one pass
+    and without holding more than the current tag and link text.
+
+    In the browser, a MutationObserver (``LINK_COLLECTOR_JS``) queues every
+    anchor added to the DOM, or whose text or href changes, so each scroll
+    only hands the new links back to Python instead of re-reading the whole
+    page. Text and href are read when the queue is drained, so anchors that
+    a framework fills in after inserting them are not lost.
+    """
+
+    # Queues existing, newly inserted and changed anchors in window.__jobforgeLinks;
+    # window.__jobforgeDrain() empties the queue into {href, text} objects
+    LINK_COLLECTOR_JS = r"""
+        () => {
+            if (window.__jobforgeLinks) return;
+            const queue = window.__jobforgeLinks = [];
+            const queued = new WeakSet();
+            const add = a => {
+                if (queued.has(a)) return;
+                queued.add(a);
+                queue.push(a);
+            };
+            const collect = root => {
+                if (!root.querySelectorAll) return;
+                if (root.matches && root.matches('a[href]')) add(root);
+                root.querySelectorAll('a[href]').forEach(add);
+            };
+            const enclosing = node => {
+                const element = node.nodeType === Node.ELEMENT_NODE ? node : node.parentElement;
+                const a = element && element.closest('a[href]');
+                if (a) add(a);
+            };
+            window.__jobforgeDrain = () => queue.splice(0).map(a => {
+                queued.delete(a);
+                return {href: a.getAttribute('href'), text: a.textContent || ''};
+            });
+            collect(document);
+            new MutationObserver(mutations => {
+                for (const mutation of mutations) {
+                    enclosing(mutation.target);
+                    mutation.addedNodes.forEach(collect);
+                }
+            }).observe(document.documentElement, {
+                childList: true, subtree: true, characterData: true,
+                attributes: true, attributeFilter: ['href'],
+            });
+        }
+    """
+    # null once a navigation replaced the document (and the collector with it)
+    DRAIN_LINKS_JS = "() => window.__jobforgeDrain ? window.__jobforgeDrain() : null"
+    LINKS_QUEUED_JS = "() => !window.__jobforgeLinks || window.__jobforgeLinks.length > 0"
 
     # Keywords that indicate job-related links
     JOB_KEYWORDS = [
@@ -24,11 +81,13 @@ class GenericFetcher(CareerFetcher):
         r"/signin", r"/signup", r"\.pdf$", r"\.png$",
         r"\.jpg$", r"javascript:", r"mailto:", r"tel:"
     ]
+    EXCLUDE_REGEX = re.compile("|".join(EXCLUDE_PATTERNS), re.IGNORECASE)
+
+    # Links with job IDs or specific patterns
+    JOB_ID_REGEX = re.compile(r"/(\d{5,}|[a-f0-9-]{8,})")
 
     def __init__(self, company_name: str, career_url: str, timeout: float = 30.0):
         super().__init__(company_name, career_url, timeout)
-        self._playwright = None
-        self._browser = None
 
     def fetch_job_list(self) -> List[Job]:
         """Fetch jobs using Playwright for full page rendering."""
@@ -41,14 +100,31 @@ class GenericFetcher(CareerFetcher):
         jobs = self._fetch_with_playwright()
         return jobs
 
+    async def fetch_job_list_async(self) -> List[Job]:
+        """Fetch jobs, only taking a browser pool worker if plain HTTP fails."""
+        jobs = await asyncio.to_thread(self._fetch_simple)
+        if jobs:
+            return jobs
+
+        return await BROWSER_POOL.run(self._fetch_with_playwright)
+
     def _fetch_simple(self) -> List[Job]:
-        """Try simple HTTP fetch first."""
+        """Try simple HTTP fetch first.
+
+        The page is parsed as it streams in, so it bypasses the response
+        cache, which would buffer the whole body.
+        """
         jobs = []
 
         try:
-            response = self.client.get(self.career_url)
-            if response.status_code == 200:
-                jobs = self._extract_jobs_from_html(response.text, self.career_url)
+            with self.client.stream(
+                "GET", self.career_url, extensions={"no_cache": True}
+            ) as response:
+                if response.status_code == 200:
+                    extractor = _LinkExtractor(self, self.career_url, response.encoding or "utf-8")
+                    for chunk in response.iter_bytes():
+                        extractor.feed_bytes(chunk)
+                    jobs = extractor.finish()
         except Exception:
             pass
 
@@ -58,65 +134,87 @@ class GenericFetcher(CareerFetcher):
         """Fetch using Playwright for JavaScript-rendered content."""
         jobs = []
 
-        try:
-            from playwright.sync_api import sync_playwright
-
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+        if not BROWSER_POOL.available():
+            print("Playwright not installed. Run: pip install playwright && playwright install")
+            return jobs
 
+        try:
+            with BROWSER_POOL.page(storage_key=urlparse(self.career_url).netloc) as page:
                 try:
+                    # networkidle already waits for the initial dynamic content
                     page.goto(self.career_url, wait_until="networkidle", timeout=self.timeout * 1000)
 
-                    # Wait for initial dynamic content to load
-                    page.wait_for_timeout(3000)
-
                     # Scroll to load dynamically loaded content (infinite scroll)
                     jobs = self._scroll_and_extract(page)
 
                 except Exception as e:
                     print(f"Playwright error for {self.company_name}: {e}")
-                finally:
-                    browser.close()
 
-        except ImportError:
-            print("Playwright not installed. Run: pip install playwright && playwright install")
         except Exception as e:
             print(f"Error with Playwright for {self.company_name}: {e}")
 
         return jobs
 
     def _scroll_and_extract(self, page) -> List[Job]:
-        """Scroll page to load all dynamic content and extract jobs."""
+        """Scroll page to load all dynamic content and extract jobs.
+
+        Only links the collector saw being added or changed are processed
+        after each scroll; scrolling stops as soon as a scroll adds no
+        links. If the page fails part way, the jobs found so far are kept.
+        """
         max_scrolls = 10
-        scroll_pause = 2000  # ms
-        prev_job_count = 0
-        no_change_count = 0
-
-        for i in range(max_scrolls):
-            # Try clicking "Load More" or "Show More" buttons
-            self._click_load_more(page)
-
-            # Scroll to bottom
-            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            page.wait_for_timeout(scroll_pause)
-
-            # Extract jobs from current content
-            html = page.content()
-            jobs = self._extract_jobs_from_html(html, self.career_url)
-
-            # Check if we found new jobs
-            if len(jobs) == prev_job_count:
-                no_change_count += 1
-                if no_change_count >= 2:
-                    # No new jobs after 2 scrolls, stop
+        scroll_timeout = 2000  # ms to wait for new links after a scroll
+        jobs = []
+        seen_urls = set()
+
+        try:
+            page.evaluate(self.LINK_COLLECTOR_JS)
+            self._collect_links(page, jobs, seen_urls)
+
+            for i in range(max_scrolls):
+                # Try clicking "Load More" or "Show More" buttons
+                self._click_load_more(page)
+
+                # Scroll to bottom and wait until new links show up
+                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                if not self._wait_for_links(page, scroll_timeout):
                     break
-            else:
-                no_change_count = 0
-                prev_job_count = len(jobs)
+
+                self._collect_links(page, jobs, seen_urls)
+        except Exception as e:
+            print(f"Playwright error for {self.company_name}: {e} (keeping {len(jobs)} jobs)")
 
         return jobs
 
+    def _collect_links(self, page, jobs: List[Job], seen_urls: Set[str]) -> None:
+        """Turn the links queued since the last call into jobs."""
+        try:
+            links = page.evaluate(self.DRAIN_LINKS_JS)
+        except Exception:
+            # The old document's context went away mid-navigation
+            links = None
+        if links is None:
+            # A navigation (e.g. a "Load More" link) replaced the document:
+            # install the collector again, which queues the links already there
+            page.wait_for_load_state()
+            page.evaluate(self.LINK_COLLECTOR_JS)
+            links = page.evaluate(self.DRAIN_LINKS_JS) or []
+
+        for link in links:
+            if not link.get("href"):
+                continue
+            job = self._link_to_job(link["href"], link.get("text") or "", self.career_url, seen_urls)
+            if job:
+                jobs.append(job)
+
+    def _wait_for_links(self, page, timeout_ms: float) -> bool:
+        """Wait until the collector has queued new links; False on timeout."""
+        try:
+            page.wait_for_function(self.LINKS_QUEUED_JS, timeout=timeout_ms)
+            return True
+        except Exception:
+            return False
+
     def _click_load_more(self, page):
         """Try to click common 'Load More' buttons."""
         load_more_selectors = [
@@ -135,62 +233,54 @@ class GenericFetcher(CareerFetcher):
             try:
                 button = page.locator(selector).first
                 if button.is_visible(timeout=500):
+                    height = page.evaluate("document.body.scrollHeight")
                     button.click()
-                    page.wait_for_timeout(1500)
+                    wait_for_growth(page, height, 1500)
             except Exception:
                 pass
 
-    def _extract_jobs_from_html(self, html: str, base_url: str) -> List[Job]:
-        """Extract job listings from HTML content."""
-        jobs = []
-        seen_urls = set()
+    def _link_to_job(self, href: str, link_text: str, base_url: str,
+                     seen_urls: Set[str]) -> Optional[Job]:
+        """Turn one link into a job, or None if it does not look like one."""
+        text = link_text.strip()
 
-        # Find all links
-        link_pattern = r'<a[^>]+href=["\']([^"\']+)["\'][^>]*>(.*?)</a>'
-        matches = re.findall(link_pattern, html, re.DOTALL | re.IGNORECASE)
+        # Skip if no meaningful text
+        if not text or len(text) < 3:
+            return None
 
-        for href, link_text in matches:
-            # Clean up link text
-            text = re.sub(r'<[^>]+>', '', link_text).strip()
+        # Skip excluded patterns
+        if self.EXCLUDE_REGEX.search(href):
+            return None
 
-            # Skip if no meaningful text
-            if not text or len(text) < 3:
-                continue
-
-            # Skip excluded patterns
-            if any(re.search(pat, href, re.IGNORECASE) for pat in self.EXCLUDE_PATTERNS):
-                continue
+        # Check if this looks like a job link
+        combined = f"{href} {text}".lower()
+        is_job_link = any(kw in combined for kw in self.JOB_KEYWORDS)
 
-            # Check if this looks like a job link
-            combined = f"{href} {text}".lower()
-            is_job_link = any(kw in combined for kw in self.JOB_KEYWORDS)
+        if not (is_job_link or self.JOB_ID_REGEX.search(href)):
+            return None
 
-            # Also look for links with job IDs or specific patterns
-            job_id_pattern = r'/(\d{5,}|[a-f0-9-]{8,})'
-            has_job_id = bool(re.search(job_id_pattern, href))
+        # Make URL absolute
+        url = urljoin(base_url, href)
 
-            if is_job_link or has_job_id:
-                # Make URL absolute
-                url = urljoin(base_url, href)
+        # Basic title cleaning
+        title = self._clean_title(text)
 
-                # Deduplicate
-                canonical = url.split("?")[0].lower()
-                if canonical in seen_urls:
-                    continue
-                seen_urls.add(canonical)
+        if len(title) <= 5:  # Skip very short titles
+            return None
 
-                # Basic title cleaning
-                title = self._clean_title(text)
+        # Deduplicate (after the title check, so a link seen again once its
+        # text is filled in still counts)
+        canonical = url.split("?")[0].lower()
+        if canonical in seen_urls:
+            return None
+        seen_urls.add(canonical)
 
-                if len(title) > 5:  # Skip very short titles
-                    jobs.append(Job(
-                        company=self.company_name,
-                        title=title,
-                        url=url,
-                        source="generic",
-                    ))
-
-        return jobs
+        return Job(
+            company=self.company_name,
+            title=title,
+            url=url,
+            source="generic",
+        )
 
     def _clean_title(self, text: str) -> str:
         """Clean up extracted job title."""
@@ -202,3 +292,80 @@ class GenericFetcher(CareerFetcher):
             text = text.replace(suffix, "")
 
         return text.strip()
+
+
+class _LinkExtractor(HTMLParser):
+    """Streams HTML and turns ``<a href>`` links into jobs as they close.
+
+    Only the unparsed tail of the input and the text of the current link
+    (capped at ``MAX_LINK_TEXT`` characters) are buffered. The bodies of
+    raw text elements (``<script>``, ``<style>``) are dropped as they
+    stream past: ``HTMLParser`` would otherwise hold all of one and rescan
+    it on every chunk until its end tag arrives.
+    """
+
+    MAX_LINK_TEXT = 1000
+    RAW_TEXT_TAIL = 64  # Kept from a skipped body in case its end tag is split
+
+    def __init__(self, fetcher: GenericFetcher, base_url: str, encoding: str = "utf-8"):
+        super().__init__(convert_charrefs=True)
+        self._fetcher = fetcher
+        self._base_url = base_url
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self._seen_urls: Set[str] = set()
+        self._href: Optional[str] = None
+        self._text: List[str] = []
+        self._text_length = 0
+        self._raw_tail = ""
+        self.jobs: List[Job] = []
+
+    def feed_bytes(self, chunk: bytes) -> None:
+        self.feed(self._decoder.decode(chunk))
+
+    def feed(self, data: str) -> None:
+        """Parse a chunk of text, skipping raw text element bodies."""
+        if self.cdata_elem is not None:
+            data = self._raw_tail + data
+        while True:
+            if self.cdata_elem is not None:
+                # Inside <script>/<style>: drop everything before the end tag
+                match = self.interesting.search(data)
+                if match is None:
+                    self._raw_tail = data[-self.RAW_TEXT_TAIL:]
+                    return
+                data = data[match.start():]
+            super().feed(data)
+            if self.cdata_elem is None:
+                return
+            # The parser stopped in a raw text element, holding its body so far
+            data, self.rawdata = self.rawdata, ""
+
+    def handle_starttag(self, tag, attrs) -> None:
+        if tag != "a":
+            return
+        href = dict(attrs).get("href")
+        self._href = href or None
+        self._text = []
+        self._text_length = 0
+
+    def handle_endtag(self, tag) -> None:
+        if tag != "a" or self._href is None:
+            return
+        job = self._fetcher._link_to_job(
+            self._href, "".join(self._text), self._base_url, self._seen_urls
+        )
+        if job:
+            self.jobs.append(job)
+        self._href = None
+
+    def handle_data(self, data) -> None:
+        if self._href is None or self._text_length >= self.MAX_LINK_TEXT:
+            return
+        data = data[:self.MAX_LINK_TEXT - self._text_length]
+        self._text.append(data)
+        self._text_length += len(data)
+
+    def finish(self) -> List[Job]:
+        self.feed(self._decoder.decode(b"", final=True))
+        self.close()
+        return self.jobs
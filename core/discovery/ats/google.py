@@ -1,73 +1,281 @@
-"""Google Careers fetcher using Playwright."""
+"""Google Careers fetcher (server-rendered data, Playwright fallback)."""
 
+import json
 import re
-from typing import List, Tuple
+from collections import deque
+from contextlib import ExitStack
+from typing import AsyncIterator, Iterator, List
 
-from .base import CareerFetcher
+from .base import CareerFetcher, aclosing
+from .browser import BROWSER_POOL
 from ..models import Job
 
 
 class GoogleFetcher(CareerFetcher):
-    """Fetcher for Google careers using Playwright pagination."""
+    """Fetcher for Google careers.
+
+    Results pages are server-rendered with their job data embedded in
+    ``AF_initDataCallback`` script blocks, so each page is a single GET
+    parsed without a browser. Playwright pagination is only used when
+    that yields nothing (markup changed, request blocked).
+
+    In incremental mode results are sorted by date and pagination stops
+    once enough consecutive pages hold only known jobs.
+    """
+
+    uses_browser = True
 
     BASE_URL = "https://www.google.com/about/careers/applications/jobs/results/"
     JOB_URL_TEMPLATE = "https://www.google.com/about/careers/applications/jobs/results/{job_id}"
 
+    # True once the results list has rendered at least one job link
+    RESULTS_READY_JS = r"""
+        () => Array.from(document.querySelectorAll('a[href*="jobs/results/"]'))
+            .some(a => /jobs\/results\/\d{15,}/.test(a.href))
+    """
+
+    # Result pages loaded concurrently (browser tabs are also capped by the
+    # pool's max_pages); 1 walks the pages one at a time
+    PAGE_WINDOW = 4
+    MAX_PAGES = 200  # Safety limit
+
+    INIT_DATA_PATTERN = re.compile(r"AF_initDataCallback\(\{[^<]*?\bdata:")
+    JOB_ID_PATTERN = re.compile(r"\d{15,}")
+
     def __init__(self, company_name: str, career_url: str, timeout: float = 30.0):
         super().__init__(company_name, career_url, timeout)
 
     def fetch_job_list(self) -> List[Job]:
-        """Fetch all jobs from Google careers by paginating through results."""
-        jobs = []
+        """Fetch all jobs, falling back to the browser if the HTML has no data."""
+        return [job for batch in self.iter_job_batches() for job in batch]
+
+    async def fetch_job_list_async(self) -> List[Job]:
+        """Fetch pages with the async client; use a browser pool worker only if needed."""
+        return [job async for batch in self.iter_job_batches_async() for job in batch]
+
+    def iter_job_batches(self) -> Iterator[List[Job]]:
+        """Yield each results page's jobs as it is parsed (browser fallback in one batch)."""
+        found = False
+        for page_jobs in self._iter_http_pages():
+            found = True
+            yield page_jobs
+        if not found:
+            jobs = self._fetch_with_browser()
+            if jobs:
+                yield jobs
+
+    async def iter_job_batches_async(self) -> AsyncIterator[List[Job]]:
+        """Async variant of ``iter_job_batches``."""
+        found = False
+        async for page_jobs in self._iter_http_pages_async():
+            found = True
+            yield page_jobs
+        if not found:
+            jobs = await BROWSER_POOL.run(self._fetch_with_browser)
+            if jobs:
+                yield jobs
+
+    def _page_url(self, page_num: int) -> str:
+        if self.incremental:
+            return f"{self.BASE_URL}?sort_by=date&page={page_num}"
+        return f"{self.BASE_URL}?page={page_num}"
 
+    def _iter_http_pages(self) -> Iterator[List[Job]]:
+        """Walk results pages with plain GETs until one has no new jobs."""
+        seen_ids = set()
+        known_pages = 0
+
+        for page_num in range(1, self.MAX_PAGES + 1):
+            try:
+                response = self.client.get(self._page_url(page_num))
+                html = response.text if response.status_code == 200 else ""
+            except Exception as e:
+                print(f"Error loading page {page_num}: {e}")
+                break
+
+            page_jobs = self._parse_embedded_jobs(html, seen_ids)
+            if not page_jobs:
+                break
+            # Check before yielding: the caller may store the page at once
+            known_pages = known_pages + 1 if self._all_known(page_jobs) else 0
+            yield page_jobs
+
+            if self.incremental and known_pages >= self.known_page_limit:
+                break
+
+    async def _get_page_async(self, page_num: int) -> str:
         try:
-            from playwright.sync_api import sync_playwright
-        except ImportError:
+            response = await self.async_client.get(self._page_url(page_num))
+            return response.text if response.status_code == 200 else ""
+        except Exception as e:
+            print(f"Error loading page {page_num}: {e}")
+            return ""
+
+    async def _iter_http_pages_async(self) -> AsyncIterator[List[Job]]:
+        """Fetch up to ``PAGE_WINDOW`` pages ahead, consuming them in order."""
+        seen_ids = set()
+        known_pages = 0
+
+        # aclosing cancels the pages still in flight when we stop early
+        async with aclosing(self._aiter_windowed(
+            self._get_page_async, range(1, self.MAX_PAGES + 1), self.PAGE_WINDOW
+        )) as pages:
+            async for html in pages:
+                page_jobs = self._parse_embedded_jobs(html, seen_ids)
+                if not page_jobs:
+                    break
+                known_pages = known_pages + 1 if self._all_known(page_jobs) else 0
+                yield page_jobs
+
+                if self.incremental and known_pages >= self.known_page_limit:
+                    break
+
+    @classmethod
+    def _embedded_data(cls, html: str) -> List:
+        """Decode the ``data:`` arrays of all AF_initDataCallback blocks."""
+        decoder = json.JSONDecoder()
+        blocks = []
+        for match in cls.INIT_DATA_PATTERN.finditer(html):
+            try:
+                data, _ = decoder.raw_decode(html, match.end())
+                blocks.append(data)
+            except ValueError:
+                continue
+        return blocks
+
+    @classmethod
+    def _job_entries(cls, data) -> List[list]:
+        """Find job records: lists starting with a numeric job ID and a title."""
+        entries = []
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, list):
+                continue
+            if (len(node) >= 2 and isinstance(node[0], str) and isinstance(node[1], str)
+                    and cls.JOB_ID_PATTERN.fullmatch(node[0])):
+                entries.append(node)
+                continue
+            stack.extend(reversed(node))
+        return entries
+
+    @staticmethod
+    def _entry_location(entry: list) -> str:
+        """First location of a job record.
+
+        Locations are a list of lists each starting with a display string
+        ("Mountain View, CA, USA").
+        """
+        for field in entry[2:]:
+            if (isinstance(field, list) and field
+                    and all(isinstance(loc, list) and loc and isinstance(loc[0], str) for loc in field)):
+                locations = [loc[0] for loc in field]
+                location = locations[0]
+                if len(locations) > 1:
+                    location += f" +{len(locations) - 1} more"
+                return location
+        return ""
+
+    def _parse_embedded_jobs(self, html: str, seen_ids: set) -> List[Job]:
+        """Extract new jobs from the structured data of one results page."""
+        jobs = []
+        for data in self._embedded_data(html or ""):
+            for entry in self._job_entries(data):
+                job_id, title = entry[0], entry[1].strip()
+                if job_id in seen_ids or not title:
+                    continue
+                seen_ids.add(job_id)
+                jobs.append(Job(
+                    company=self.company_name,
+                    title=title,
+                    url=self.JOB_URL_TEMPLATE.format(job_id=job_id),
+                    location=self._entry_location(entry),
+                    source="google",
+                ))
+        return jobs
+
+    def _fetch_with_browser(self) -> List[Job]:
+        """Fetch all jobs from Google careers by paginating through results in Chromium.
+
+        Result pages are addressable by number, so up to ``PAGE_WINDOW``
+        tabs load consecutive pages at once. Pages are still consumed in
+        order, which keeps ``seen_ids`` dedup and the stop-on-first-empty-page
+        rule identical to a sequential walk.
+        """
+        jobs = []
+
+        if not BROWSER_POOL.available():
             print("Playwright not installed. Run: pip install playwright && playwright install")
             return jobs
 
+        window = max(1, min(self.PAGE_WINDOW, BROWSER_POOL.max_pages, self.MAX_PAGES))
+        seen_ids = set()
+        known_pages = 0
+
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
-                page_num = 1
-                max_pages = 200  # Safety limit
-                seen_ids = set()
-
-                while page_num <= max_pages:
-                    url = f"{self.BASE_URL}?page={page_num}"
-
-                    try:
-                        page.goto(url, wait_until="networkidle", timeout=self.timeout * 1000)
-                        page.wait_for_timeout(2000)
-                    except Exception as e:
-                        print(f"Error loading page {page_num}: {e}")
+            with BROWSER_POOL.context(storage_key="google") as context, ExitStack() as stack:
+                tabs = [stack.enter_context(BROWSER_POOL.page(context=context)) for _ in range(window)]
+
+                # In-flight (page_num, tab) pairs, oldest first
+                in_flight = deque()
+                next_page = 1
+                for tab in tabs:
+                    if not self._start_page(tab, next_page):
                         break
+                    in_flight.append((next_page, tab))
+                    next_page += 1
 
-                    # Extract jobs using both HTML and text
-                    html = page.content()
-                    text = page.inner_text("body")
-                    page_jobs = self._extract_jobs(html, text, seen_ids)
+                while in_flight:
+                    page_num, tab = in_flight.popleft()
+                    page_jobs = self._finish_page(tab, seen_ids)
 
                     if not page_jobs:
-                        # No more jobs found
+                        # No more jobs found; later pages in the window are past the end
                         break
 
                     jobs.extend(page_jobs)
-                    page_num += 1
+
+                    known_pages = known_pages + 1 if self._all_known(page_jobs) else 0
+                    if self.incremental and known_pages >= self.known_page_limit:
+                        break
 
                     # Progress indicator every 10 pages
                     if page_num % 10 == 0:
                         print(f"    Fetched {len(jobs)} jobs so far...")
 
-                browser.close()
+                    # Reuse the tab for the next page beyond the window
+                    if next_page <= self.MAX_PAGES and self._start_page(tab, next_page):
+                        in_flight.append((next_page, tab))
+                        next_page += 1
 
         except Exception as e:
             print(f"Error fetching Google jobs: {e}")
 
         return jobs
 
+    def _start_page(self, page, page_num: int) -> bool:
+        """Start loading a results page without waiting for it to render."""
+        try:
+            page.goto(self._page_url(page_num), wait_until="commit", timeout=self.timeout * 1000)
+            return True
+        except Exception as e:
+            print(f"Error loading page {page_num}: {e}")
+            return False
+
+    def _finish_page(self, page, seen_ids: set) -> List[Job]:
+        """Wait for a started page to render and extract its jobs."""
+        # Wait for job links rather than a fixed delay; an empty
+        # page times out and ends pagination
+        try:
+            page.wait_for_function(self.RESULTS_READY_JS, timeout=min(self.timeout, 10) * 1000)
+        except Exception:
+            pass
+
+        # Extract jobs using both HTML and text
+        html = page.content()
+        text = page.inner_text("body")
+        return self._extract_jobs(html, text, seen_ids)
+
     def _extract_jobs(self, html: str, text: str, seen_ids: set) -> List[Job]:
         """Extract job listings from page content."""
         jobs = []
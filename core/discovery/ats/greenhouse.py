@@ -1,5 +1,6 @@
 """Greenhouse ATS adapter."""
 
+import asyncio
 import re
 from typing import List
 from urllib.parse import urlparse
@@ -9,7 +10,12 @@ from ..models import Job
 
 
 class GreenhouseFetcher(CareerFetcher):
-    """Fetcher for Greenhouse ATS job boards."""
+    """Fetcher for Greenhouse ATS job boards.
+
+    The board API reports ``updated_at`` per job, so Greenhouse supports
+    delta sync: only jobs created or updated since the last sync are
+    returned, and jobs gone from the board are reported as closed.
+    """
 
     def __init__(self, company_name: str, career_url: str, timeout: float = 30.0):
         super().__init__(company_name, career_url, timeout)
@@ -30,21 +36,21 @@ class GreenhouseFetcher(CareerFetcher):
         # Fallback to company name slug
         return self.company_name.lower().replace(" ", "")
 
+    @property
+    def api_url(self) -> str:
+        """Greenhouse public board API endpoint."""
+        return f"https://boards-api.greenhouse.io/v1/boards/{self.board_token}/jobs"
+
     def fetch_job_list(self) -> List[Job]:
         """Fetch jobs from Greenhouse API."""
         jobs = []
 
-        # Greenhouse public API endpoint
-        api_url = f"https://boards-api.greenhouse.io/v1/boards/{self.board_token}/jobs"
-
         try:
-            response = self.client.get(api_url)
+            response = self.client.get(self.api_url)
             if response.status_code == 200:
-                data = response.json()
-                for job_data in data.get("jobs", []):
-                    job = self._parse_job(job_data)
-                    if job:
-                        jobs.append(job)
+                if self._check_unchanged(response.content):
+                    return []
+                jobs = self._apply_delta(self._parse_api_response(response.json()))
             else:
                 # Try alternate API format
                 jobs = self._fetch_from_embed_api()
@@ -53,6 +59,33 @@ class GreenhouseFetcher(CareerFetcher):
 
         return jobs
 
+    async def fetch_job_list_async(self) -> List[Job]:
+        """Fetch jobs from Greenhouse API using the async client."""
+        jobs = []
+
+        try:
+            response = await self.async_client.get(self.api_url)
+            if response.status_code == 200:
+                if self._check_unchanged(response.content):
+                    return []
+                jobs = self._apply_delta(self._parse_api_response(response.json()))
+            else:
+                # Try alternate API format
+                jobs = await asyncio.to_thread(self._fetch_from_embed_api)
+        except Exception as e:
+            print(f"Error fetching Greenhouse jobs for {self.company_name}: {e}")
+
+        return jobs
+
+    def _parse_api_response(self, data: dict) -> List[Job]:
+        """Parse jobs from the board API response."""
+        jobs = []
+        for job_data in data.get("jobs", []):
+            job = self._parse_job(job_data)
+            if job:
+                jobs.append(job)
+        return jobs
+
     def _fetch_from_embed_api(self) -> List[Job]:
         """Try fetching from embed API format."""
         jobs = []
@@ -80,6 +113,7 @@ class GreenhouseFetcher(CareerFetcher):
             location=location_str,
             team=self._extract_department(job_data),
             source="greenhouse",
+            updated_at=job_data.get("updated_at"),
         )
 
     def _extract_department(self, job_data: dict) -> str:
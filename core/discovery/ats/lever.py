@@ -1,15 +1,28 @@
 """Lever ATS adapter."""
 
+import asyncio
+import codecs
+import hashlib
 import re
-from typing import List
+from itertools import count
+from typing import AsyncIterator, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
 
-from .base import CareerFetcher
+from .base import CareerFetcher, aclosing
+from ..jsonstream import JsonArrayStream
 from ..models import Job
 
 
 class LeverFetcher(CareerFetcher):
-    """Fetcher for Lever ATS job boards."""
+    """Fetcher for Lever ATS job boards.
+
+    The postings API is paged with ``skip``/``limit``. Each page is parsed
+    into jobs while its body streams in and yielded as one batch, so memory
+    stays bounded by a page rather than the whole board.
+    """
+
+    PAGE_SIZE = 100
+    PAGE_WINDOW = 4  # Pages requested at once after the first
 
     def __init__(self, company_name: str, career_url: str, timeout: float = 30.0):
         super().__init__(company_name, career_url, timeout)
@@ -28,30 +41,133 @@ class LeverFetcher(CareerFetcher):
         # Fallback to company name slug
         return self.company_name.lower().replace(" ", "")
 
+    @property
+    def api_url(self) -> str:
+        """Lever postings endpoint (returns HTML by default, JSON with ?mode=json)."""
+        return f"https://api.lever.co/v0/postings/{self.company_slug}"
+
+    def _page_params(self, page_index: int) -> dict:
+        return {"mode": "json", "skip": page_index * self.PAGE_SIZE, "limit": self.PAGE_SIZE}
+
+    def _stream_page(self, page_index: int) -> Optional[Tuple[List[Job], str]]:
+        """Fetch one page, parsing postings as the body streams in.
+
+        Pages bypass the response cache, which would buffer the whole body.
+
+        Returns:
+            Tuple of (jobs, sha256 of the page body), or None on a non-200.
+        """
+        with self.client.stream(
+            "GET", self.api_url, params=self._page_params(page_index),
+            extensions={"no_cache": True},
+        ) as response:
+            if response.status_code != 200:
+                return None
+            parser = _PageParser(self)
+            for chunk in response.iter_bytes():
+                parser.feed(chunk)
+            return parser.finish()
+
+    async def _stream_page_async(self, page_index: int) -> Optional[Tuple[List[Job], str]]:
+        """Async variant of ``_stream_page``."""
+        async with self.async_client.stream(
+            "GET", self.api_url, params=self._page_params(page_index),
+            extensions={"no_cache": True},
+        ) as response:
+            if response.status_code != 200:
+                return None
+            parser = _PageParser(self)
+            async for chunk in response.aiter_bytes():
+                parser.feed(chunk)
+            return parser.finish()
+
+    def _finish(self, digests: List[str]) -> None:
+        """Fingerprint the board from its page digests."""
+        self.fingerprint = hashlib.sha256("".join(digests).encode()).hexdigest()
+
     def fetch_job_list(self) -> List[Job]:
-        """Fetch jobs from Lever."""
-        jobs = []
+        """Fetch jobs from Lever; no jobs if the board is unchanged."""
+        jobs = [job for batch in self.iter_job_batches() for job in batch]
+        return [] if self.unchanged else jobs
+
+    async def fetch_job_list_async(self) -> List[Job]:
+        """Fetch jobs from Lever using the async client."""
+        jobs = [job async for batch in self.iter_job_batches_async() for job in batch]
+        return [] if self.unchanged else jobs
+
+    def iter_job_batches(self) -> Iterator[List[Job]]:
+        """Yield each ``skip``/``limit`` page's jobs as soon as it is parsed.
 
-        # Lever jobs endpoint (returns HTML by default, JSON with ?mode=json)
-        api_url = f"https://api.lever.co/v0/postings/{self.company_slug}"
+        The board is fingerprinted from the page digests once the last page
+        is in, so ``unchanged`` is only known after the final batch.
+        """
+        digests = []
 
         try:
-            response = self.client.get(api_url)
-            if response.status_code == 200:
-                data = response.json()
-                if isinstance(data, list):
-                    for job_data in data:
-                        job = self._parse_job(job_data)
-                        if job:
-                            jobs.append(job)
-            else:
-                # Try fetching from HTML page
-                jobs = self._fetch_from_html()
+            page_index = 0
+            while True:
+                page = self._stream_page(page_index)
+                if page is None:
+                    if page_index == 0:
+                        # Try fetching from HTML page
+                        yield from self._html_batches()
+                        return
+                    break
+
+                page_jobs, digest = page
+                digests.append(digest)
+                if page_jobs:
+                    yield page_jobs
+                if len(page_jobs) < self.PAGE_SIZE:
+                    break
+                page_index += 1
         except Exception as e:
             print(f"Error fetching Lever jobs for {self.company_name}: {e}")
-            jobs = self._fetch_from_html()
+            if not digests:
+                yield from self._html_batches()
+            return
 
-        return jobs
+        self._finish(digests)
+
+    async def iter_job_batches_async(self) -> AsyncIterator[List[Job]]:
+        """Async variant of ``iter_job_batches``.
+
+        The first page is fetched alone; if it is full, the following pages
+        are requested with up to ``PAGE_WINDOW`` in flight until a short
+        page shows up.
+        """
+        digests = []
+
+        try:
+            page = await self._stream_page_async(0)
+            if page is None:
+                for jobs in await asyncio.to_thread(self._html_batches):
+                    yield jobs
+                return
+
+            pages = self._aiter_windowed(self._stream_page_async, count(1), self.PAGE_WINDOW)
+            async with aclosing(pages):
+                while page is not None:
+                    page_jobs, digest = page
+                    digests.append(digest)
+                    if page_jobs:
+                        yield page_jobs
+                    if len(page_jobs) < self.PAGE_SIZE:
+                        break
+                    page = await pages.__anext__()
+        except Exception as e:
+            print(f"Error fetching Lever jobs for {self.company_name}: {e}")
+            if not digests:
+                for jobs in await asyncio.to_thread(self._html_batches):
+                    yield jobs
+            return
+
+        self._finish(digests)
+
+    def _html_batches(self) -> List[List[Job]]:
+        """The HTML page's jobs as a single batch, or no batches."""
+        jobs = self._fetch_from_html()
+        return [jobs] if jobs else []
 
     def _fetch_from_html(self) -> List[Job]:
         """Fetch jobs by parsing the Lever HTML page."""
@@ -103,3 +219,26 @@ class LeverFetcher(CareerFetcher):
             ))
 
         return jobs
+
+
+class _PageParser:
+    """Turns the streamed bytes of one postings page into jobs and a digest."""
+
+    def __init__(self, fetcher: LeverFetcher):
+        self._fetcher = fetcher
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._stream = JsonArrayStream()
+        self._digest = hashlib.sha256()
+        self.jobs: List[Job] = []
+
+    def feed(self, chunk: bytes) -> None:
+        self._digest.update(chunk)
+        for job_data in self._stream.feed(self._decoder.decode(chunk)):
+            job = self._fetcher._parse_job(job_data)
+            if job:
+                self.jobs.append(job)
+
+    def finish(self) -> Tuple[List[Job], str]:
+        self._stream.feed(self._decoder.decode(b"", final=True))
+        self._stream.close()
+        return self.jobs, self._digest.hexdigest()
@@ -1,54 +1,166 @@
 """Meta careers GraphQL fetcher using Playwright."""
 
-from typing import List
+import asyncio
+import json
+from typing import List, Optional
 
 from .base import CareerFetcher
+from .browser import BROWSER_POOL, run_and_wait_for_response
+from .replay import REPLAY_STORE, CapturedRequest
 from ..models import Job
 
 
 class MetaFetcher(CareerFetcher):
-    """Fetcher for Meta careers using GraphQL via Playwright."""
+    """Fetcher for Meta careers using GraphQL via Playwright.
+
+    The browser session captures the job search GraphQL request (with its
+    session tokens); later runs re-send it over plain HTTP until the
+    tokens expire, then capture a fresh one with the browser. If the
+    search variables carry a page number or offset, the replay pages
+    through them like the browser's scrolling does, until a page comes
+    back empty, short or with nothing new.
+    """
+
+    uses_browser = True
 
     CAREERS_URL = "https://www.metacareers.com/jobsearch"
     JOB_URL_TEMPLATE = "https://www.metacareers.com/jobs/{job_id}"
+    API_FRAGMENT = "graphql"
+    MAX_PAGES = 50  # Same cap as the browser's scrolls
+
+    # Search variables that select a page, and that give an offset's page size
+    PAGE_NUMBER_FIELDS = ("page", "page_number", "pageNumber")
+    OFFSET_FIELDS = ("offset", "start")
+    PAGE_SIZE_FIELDS = ("results_per_page", "limit", "count", "first", "page_size")
 
     def __init__(self, company_name: str, career_url: str, timeout: float = 30.0):
         super().__init__(company_name, career_url, timeout)
 
     def fetch_job_list(self) -> List[Job]:
+        """Fetch all jobs, replaying the captured GraphQL request when possible."""
+        jobs = self._fetch_via_replay()
+        if jobs:
+            return jobs
+        return self._fetch_with_browser()
+
+    async def fetch_job_list_async(self) -> List[Job]:
+        """Replay the API in a plain thread; use a browser pool worker only if needed."""
+        jobs = await asyncio.to_thread(self._fetch_via_replay)
+        if jobs:
+            return jobs
+        return await BROWSER_POOL.run(self._fetch_with_browser)
+
+    def _fetch_via_replay(self) -> List[Job]:
+        """Re-send the captured job search GraphQL query."""
+        results = REPLAY_STORE.replay(
+            "meta", self.client, self._replay_body, self._extract_results,
+            max_pages=self.MAX_PAGES, stop=self._page_stopper(),
+        )
+        return self._to_jobs(results or [])
+
+    @staticmethod
+    def _page_stopper():
+        """Page callback that is True on a short page or one with no new jobs."""
+        first_size = None
+        seen_ids = set()
+
+        def stop(page_results: list) -> bool:
+            nonlocal first_size
+            ids = {job_data.get("id") for job_data in page_results}
+            new_ids = ids - seen_ids
+            seen_ids.update(ids)
+            if first_size is None:
+                first_size = len(page_results)
+                return False
+            # A server that ignores the page field keeps sending page one
+            return len(page_results) < first_size or not new_ids
+
+        return stop
+
+    @classmethod
+    def _replay_body(cls, body, index: int):
+        """The captured search, moved to page ``index``; None if it cannot be paged.
+
+        The GraphQL variables are a JSON string in the form body; the page
+        field may sit at their top level or in ``search_input``.
+        """
+        if index == 0:
+            return body
+        if not isinstance(body, dict):
+            return None
+        try:
+            variables = json.loads(body.get("variables") or "{}")
+        except ValueError:
+            return None
+        if not isinstance(variables, dict):
+            return None
+
+        for scope in (variables, variables.get("search_input")):
+            if isinstance(scope, dict) and cls._turn_page(scope, index):
+                return {**body, "variables": json.dumps(variables)}
+        # No paging field: the first response was the whole result list
+        return None
+
+    @classmethod
+    def _turn_page(cls, scope: dict, index: int) -> bool:
+        """Advance a page number or offset in ``scope`` by ``index`` pages."""
+        for field in cls.PAGE_NUMBER_FIELDS:
+            if isinstance(scope.get(field), int):
+                scope[field] += index
+                return True
+        size = cls._page_size(scope)
+        for field in cls.OFFSET_FIELDS:
+            if isinstance(scope.get(field), int) and size:
+                scope[field] += index * size
+                return True
+        return False
+
+    @classmethod
+    def _page_size(cls, scope: dict) -> Optional[int]:
+        for field in cls.PAGE_SIZE_FIELDS:
+            if isinstance(scope.get(field), int) and scope[field] > 0:
+                return scope[field]
+        return None
+
+    @staticmethod
+    def _extract_results(data: dict) -> list:
+        job_search = data.get("data", {}).get("job_search_with_featured_jobs", {})
+        return job_search.get("all_jobs", [])
+
+    def _fetch_with_browser(self) -> List[Job]:
         """Fetch all jobs from Meta's careers by intercepting GraphQL responses."""
         jobs = []
 
-        try:
-            from playwright.sync_api import sync_playwright
-        except ImportError:
+        if not BROWSER_POOL.available():
             print("Playwright not installed. Run: pip install playwright && playwright install")
             return jobs
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context()
-                page = context.new_page()
-
+            with BROWSER_POOL.page(storage_key="meta") as page:
                 all_jobs = []
+                timeout_ms = self.timeout * 1000
 
                 def handle_response(response):
-                    if "graphql" in response.url:
+                    if self.API_FRAGMENT in response.url:
                         try:
-                            data = response.json()
                             # Extract jobs from GraphQL response
-                            job_search = data.get("data", {}).get("job_search_with_featured_jobs", {})
-                            job_list = job_search.get("all_jobs", [])
+                            job_list = self._extract_results(response.json())
+                            if job_list and not all_jobs:
+                                # The job search query (other GraphQL calls carry no jobs)
+                                REPLAY_STORE.save("meta", CapturedRequest.from_playwright(response.request))
                             all_jobs.extend(job_list)
                         except Exception:
                             pass
 
                 page.on("response", handle_response)
 
-                # Load the careers page
-                page.goto(self.CAREERS_URL, wait_until="networkidle", timeout=self.timeout * 1000)
-                page.wait_for_timeout(3000)
+                # Load the careers page; done as soon as the first GraphQL XHR lands
+                run_and_wait_for_response(
+                    page,
+                    self.API_FRAGMENT,
+                    lambda: page.goto(self.CAREERS_URL, wait_until="domcontentloaded", timeout=timeout_ms),
+                    timeout_ms,
+                )
 
                 # Scroll to load more jobs
                 max_scrolls = 50
@@ -56,9 +168,15 @@ class MetaFetcher(CareerFetcher):
                 no_change_count = 0
 
                 for _ in range(max_scrolls):
-                    # Scroll to bottom
-                    page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    page.wait_for_timeout(1500)
+                    # Scroll to bottom and wait for the next GraphQL page
+                    loaded = run_and_wait_for_response(
+                        page,
+                        self.API_FRAGMENT,
+                        lambda: page.evaluate("window.scrollTo(0, document.body.scrollHeight)"),
+                        5000,
+                    )
+                    if not loaded:
+                        break
 
                     # Check if we got new results
                     if len(all_jobs) == prev_count:
@@ -69,36 +187,39 @@ class MetaFetcher(CareerFetcher):
                         no_change_count = 0
                         prev_count = len(all_jobs)
 
-                browser.close()
-
-                # Convert results to Job objects
-                seen_ids = set()
-                for job_data in all_jobs:
-                    job_id = job_data.get("id")
-                    if job_id in seen_ids:
-                        continue
-                    seen_ids.add(job_id)
-
-                    title = job_data.get("title", "")
-                    locations = job_data.get("locations", [])
-                    location = ", ".join(locations[:3]) if locations else ""
-                    if len(locations) > 3:
-                        location += f" +{len(locations) - 3} more"
-
-                    teams = job_data.get("teams", [])
-                    team = ", ".join(teams) if teams else ""
-
-                    if job_id and title:
-                        jobs.append(Job(
-                            company=self.company_name,
-                            title=title,
-                            url=self.JOB_URL_TEMPLATE.format(job_id=job_id),
-                            location=location,
-                            team=team,
-                            source="meta",
-                        ))
+                jobs = self._to_jobs(all_jobs)
 
         except Exception as e:
             print(f"Error fetching Meta jobs: {e}")
 
         return jobs
+
+    def _to_jobs(self, results: list) -> List[Job]:
+        """Convert GraphQL results to Job objects."""
+        jobs = []
+        seen_ids = set()
+        for job_data in results:
+            job_id = job_data.get("id")
+            if job_id in seen_ids:
+                continue
+            seen_ids.add(job_id)
+
+            title = job_data.get("title", "")
+            locations = job_data.get("locations", [])
+            location = ", ".join(locations[:3]) if locations else ""
+            if len(locations) > 3:
+                location += f" +{len(locations) - 3} more"
+
+            teams = job_data.get("teams", [])
+            team = ", ".join(teams) if teams else ""
+
+            if job_id and title:
+                jobs.append(Job(
+                    company=self.company_name,
+                    title=title,
+                    url=self.JOB_URL_TEMPLATE.format(job_id=job_id),
+                    location=location,
+                    team=team,
+                    source="meta",
+                ))
+        return jobs
@@ -0,0 +1,204 @@
+"""Replay of JSON API requests captured from browser sessions."""
+
+import json
+import re
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Union
+from urllib.parse import parse_qsl
+
+import httpx
+
+
+class CapturedRequest:
+    """Method, URL, headers and body of one request seen by the browser.
+
+    The body is kept as the raw string the page sent; ``body_data()``
+    decodes it (JSON or form-encoded) so a fetcher can change the paging
+    fields before ``send()`` re-encodes it the same way.
+    """
+
+    # Headers httpx sets itself, or that only make sense on the original connection
+    SKIP_HEADERS = {"content-length", "host", "connection", "accept-encoding"}
+
+    def __init__(self, method: str, url: str, headers: dict, body: Optional[str] = None):
+        self.method = method
+        self.url = url
+        self.headers = headers
+        self.body = body
+
+    @classmethod
+    def from_playwright(cls, request) -> "CapturedRequest":
+        """Capture a Playwright request (including its cookies)."""
+        try:
+            headers = request.all_headers()
+        except Exception:
+            headers = request.headers
+        headers = {
+            name: value for name, value in headers.items()
+            if not name.startswith(":") and name.lower() not in cls.SKIP_HEADERS
+        }
+        return cls(request.method, request.url, headers, request.post_data)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CapturedRequest":
+        return cls(data["method"], data["url"], data.get("headers", {}), data.get("body"))
+
+    def to_dict(self) -> dict:
+        return {"method": self.method, "url": self.url, "headers": self.headers, "body": self.body}
+
+    @property
+    def is_json(self) -> bool:
+        content_type = next(
+            (value for name, value in self.headers.items() if name.lower() == "content-type"), ""
+        )
+        return "json" in content_type or (self.body or "").lstrip().startswith(("{", "["))
+
+    def body_data(self) -> Union[dict, list, None]:
+        """Decoded request body (JSON, or form fields as a dict)."""
+        if not self.body:
+            return None
+        if self.is_json:
+            return json.loads(self.body)
+        return dict(parse_qsl(self.body, keep_blank_values=True))
+
+    def send(self, client: httpx.Client, body: Union[dict, list, None] = None) -> httpx.Response:
+        """Send the request again with an (optionally modified) decoded body."""
+        if body is None:
+            return client.request(self.method, self.url, headers=self.headers)
+        if self.is_json:
+            return client.request(self.method, self.url, headers=self.headers, json=body)
+        return client.request(self.method, self.url, headers=self.headers, data=body)
+
+
+class ReplayStore:
+    """Persists one captured API request per source between runs.
+
+    Browser fetchers capture the request behind their listings the first
+    time they run, then page that endpoint with plain HTTP on later runs.
+    A capture is discarded as soon as replaying it fails, so the next
+    fetch goes back to the browser and captures a fresh one.
+    """
+
+    def __init__(self, replay_dir: str = ".cache/replay", enabled: bool = True):
+        self.replay_dir = Path(replay_dir)
+        self.enabled = enabled
+
+    def configure(self, config: Optional[dict]) -> None:
+        """Apply the ``replay``/``replay_dir`` keys of the ``browser`` settings section."""
+        config = config or {}
+        self.enabled = bool(config.get("replay", self.enabled))
+        self.replay_dir = Path(config.get("replay_dir", self.replay_dir))
+
+    def _path(self, source: str) -> Path:
+        safe_source = re.sub(r"[^A-Za-z0-9._-]", "_", source)
+        return self.replay_dir / f"{safe_source}.json"
+
+    def load(self, source: str) -> Optional[CapturedRequest]:
+        """Get the captured request for a source, or None."""
+        if not self.enabled:
+            return None
+        path = self._path(source)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r") as f:
+                return CapturedRequest.from_dict(json.load(f))
+        except Exception:
+            return None
+
+    def save(self, source: str, request: CapturedRequest) -> None:
+        if not self.enabled:
+            return
+        path = self._path(source)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(request.to_dict(), f, indent=2)
+
+    def discard(self, source: str) -> None:
+        try:
+            self._path(source).unlink()
+        except FileNotFoundError:
+            pass
+
+    def replay(self, source: str, client: httpx.Client, page_body: Callable, extract: Callable,
+               max_pages: int, stop: Optional[Callable[[list], bool]] = None) -> Optional[List]:
+        """Page a source's endpoint with its captured request (see ``iter_replay_pages``).
+
+        Returns:
+            All results, or None if there is no usable capture. A capture
+            that fails on the first page is discarded.
+        """
+        results = [
+            result
+            for page in self.iter_replay(source, client, page_body, extract, max_pages, stop)
+            for result in page
+        ]
+        return results or None
+
+    def iter_replay(self, source: str, client: httpx.Client, page_body: Callable,
+                    extract: Callable, max_pages: int,
+                    stop: Optional[Callable[[list], bool]] = None) -> Iterator[list]:
+        """Like ``replay``, but yield each page's results as it arrives.
+
+        Nothing is yielded if there is no usable capture; a capture that
+        fails on the first page is discarded.
+        """
+        captured = self.load(source)
+        if captured is None:
+            return
+        replayed = False
+        for page_results in iter_replay_pages(client, captured, page_body, extract, max_pages, stop):
+            replayed = True
+            yield page_results
+        if not replayed:
+            print(f"    ↻ Captured {source} API request no longer works; recapturing with the browser")
+            self.discard(source)
+
+
+# Process-wide store shared by the browser fetchers
+REPLAY_STORE = ReplayStore()
+
+
+def iter_replay_pages(
+    client: httpx.Client,
+    captured: CapturedRequest,
+    page_body: Callable[[Union[dict, list, None], int], Union[dict, list, None]],
+    extract: Callable[[dict], list],
+    max_pages: int,
+    stop: Optional[Callable[[list], bool]] = None,
+) -> Iterator[list]:
+    """Page an endpoint by replaying a captured request.
+
+    Args:
+        client: HTTP client to send the requests with.
+        captured: The request captured from the browser.
+        page_body: Given the captured body and a 0-based page index, returns
+            the body for that page, or None once there are no more pages.
+        extract: Pulls the list of results out of a decoded response.
+        max_pages: Safety limit on the number of requests.
+        stop: Called with each page's results before the page is yielded;
+            returning True ends paging after that page (e.g. once pages
+            only hold known jobs).
+
+    Yields:
+        Each page's results, in page order. Nothing is yielded if the first
+        page failed (the capture is stale and must be refreshed with the
+        browser).
+    """
+    for index in range(max_pages):
+        body = page_body(captured.body_data(), index)
+        if body is None and index > 0:
+            break
+
+        try:
+            response = captured.send(client, body)
+            page_results = extract(response.json()) if response.status_code == 200 else []
+        except Exception:
+            page_results = []
+
+        if not page_results:
+            return
+        done = stop is not None and stop(page_results)
+        yield page_results
+        if done:
+            break
@@ -1,101 +1,190 @@
 """TikTok/ByteDance careers fetcher using Playwright."""
 
-from typing import List
+import asyncio
+from typing import AsyncIterator, Iterator, List, Optional
 
 from .base import CareerFetcher
+from .browser import BROWSER_POOL, run_and_wait_for_response
+from .replay import REPLAY_STORE, CapturedRequest
 from ..models import Job
 
 
 class TikTokFetcher(CareerFetcher):
-    """Fetcher for TikTok careers using pagination via Playwright."""
+    """Fetcher for TikTok careers using pagination via Playwright.
+
+    The browser session captures the ``search/job/posts`` request; later
+    runs page it by offset over plain HTTP, one page per yielded batch, and
+    only go back to the browser (whose jobs come as a single batch) when
+    the replay stops working.
+
+    The listing is newest first, so in incremental mode both paths stop
+    once enough consecutive pages hold only known jobs.
+    """
+
+    uses_browser = True
 
     CAREERS_URL = "https://lifeattiktok.com/position"
     JOB_URL_TEMPLATE = "https://lifeattiktok.com/position/{job_id}"
+    API_FRAGMENT = "search/job/posts"
+    MAX_PAGES = 500
 
     def __init__(self, company_name: str, career_url: str, timeout: float = 30.0):
         super().__init__(company_name, career_url, timeout)
 
     def fetch_job_list(self) -> List[Job]:
+        """Fetch all jobs, replaying the captured API request when possible."""
+        return [job for batch in self.iter_job_batches() for job in batch]
+
+    async def fetch_job_list_async(self) -> List[Job]:
+        """Async variant of ``fetch_job_list``."""
+        return [job async for batch in self.iter_job_batches_async() for job in batch]
+
+    def iter_job_batches(self) -> Iterator[List[Job]]:
+        """Yield each replayed page's new jobs, or the browser's jobs as one batch."""
+        found = False
+        for jobs in self._iter_replay_batches():
+            found = True
+            yield jobs
+        if not found:
+            jobs = self._fetch_with_browser()
+            if jobs:
+                yield jobs
+
+    async def iter_job_batches_async(self) -> AsyncIterator[List[Job]]:
+        """Replay the API in a plain thread; use a browser pool worker only if needed."""
+        batches = self._iter_replay_batches()
+        found = False
+        while (jobs := await asyncio.to_thread(next, batches, None)) is not None:
+            found = True
+            yield jobs
+        if not found:
+            jobs = await BROWSER_POOL.run(self._fetch_with_browser)
+            if jobs:
+                yield jobs
+
+    def _iter_replay_batches(self) -> Iterator[List[Job]]:
+        """Page search/job/posts directly with the captured request."""
+        seen_ids = set()
+        for results in REPLAY_STORE.iter_replay(
+            "tiktok", self.client, self._replay_body, self._extract_results,
+            max_pages=self.MAX_PAGES, stop=self._known_page_stopper(),
+        ):
+            jobs = self._to_jobs(results, seen_ids)
+            if jobs:
+                yield jobs
+
+    def _known_page_stopper(self):
+        """Page callback that is True once ``known_page_limit`` pages in a row were all known."""
+        known_pages = 0
+
+        def stop(page_results: list) -> bool:
+            nonlocal known_pages
+            known_pages = known_pages + 1 if self._all_known(self._to_jobs(page_results)) else 0
+            return self.incremental and known_pages >= self.known_page_limit
+
+        return stop
+
+    @staticmethod
+    def _replay_body(body, index: int):
+        if not isinstance(body, dict):
+            return body if index == 0 else None
+        limit = body.get("limit") or 12
+        return {**body, "offset": index * limit}
+
+    @staticmethod
+    def _extract_results(data: dict) -> list:
+        return data.get("data", {}).get("job_post_list", [])
+
+    def _fetch_with_browser(self) -> List[Job]:
         """Fetch all jobs from TikTok careers by clicking through pagination."""
         jobs = []
 
-        try:
-            from playwright.sync_api import sync_playwright
-        except ImportError:
+        if not BROWSER_POOL.available():
             print("Playwright not installed. Run: pip install playwright && playwright install")
             return jobs
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context()
-                page = context.new_page()
-
+            with BROWSER_POOL.page(storage_key="tiktok") as page:
                 all_jobs = []
+                timeout_ms = self.timeout * 1000
 
                 def handle_response(response):
-                    if "search/job/posts" in response.url:
+                    if self.API_FRAGMENT in response.url:
                         try:
-                            data = response.json()
-                            job_list = data.get("data", {}).get("job_post_list", [])
+                            job_list = self._extract_results(response.json())
+                            if job_list and not all_jobs:
+                                # First results page: keep its request for replay
+                                REPLAY_STORE.save("tiktok", CapturedRequest.from_playwright(response.request))
                             all_jobs.extend(job_list)
                         except Exception:
                             pass
 
                 page.on("response", handle_response)
+                stop = self._known_page_stopper()
 
-                # Load the careers page
-                page.goto(self.CAREERS_URL, wait_until="networkidle", timeout=self.timeout * 1000)
-                page.wait_for_timeout(3000)
+                # Load the careers page; done as soon as the first search XHR lands
+                run_and_wait_for_response(
+                    page,
+                    self.API_FRAGMENT,
+                    lambda: page.goto(self.CAREERS_URL, wait_until="domcontentloaded", timeout=timeout_ms),
+                    timeout_ms,
+                )
 
                 # Click through pagination - find the highest page number available
-                max_pages = 500
                 current_page = 1
 
-                while current_page < max_pages:
+                while current_page < self.MAX_PAGES:
                     current_page += 1
+                    page_start = len(all_jobs)
 
-                    # Try to click the next page number
+                    # Try to click the next page number and wait for its results
                     try:
                         next_btn = page.locator(f"button:text-is('{current_page}')").first
-                        if next_btn.is_visible(timeout=2000):
-                            next_btn.click()
-                            page.wait_for_timeout(2000)
-                        else:
-                            # No more pages
+                        next_btn.wait_for(state="visible", timeout=2000)
+                        if not run_and_wait_for_response(page, self.API_FRAGMENT, next_btn.click, timeout_ms):
                             break
                     except Exception:
+                        # No more pages
                         break
 
-                browser.close()
-
-                # Convert results to Job objects
-                seen_ids = set()
-                for job_data in all_jobs:
-                    job_id = job_data.get("id")
-                    if job_id in seen_ids:
-                        continue
-                    seen_ids.add(job_id)
-
-                    title = job_data.get("title", "")
-                    location = self._extract_location(job_data)
-                    team = job_data.get("job_function_name", "")
-
-                    if job_id and title:
-                        jobs.append(Job(
-                            company=self.company_name,
-                            title=title,
-                            url=self.JOB_URL_TEMPLATE.format(job_id=job_id),
-                            location=location,
-                            team=team,
-                            source="tiktok",
-                        ))
+                    if stop(all_jobs[page_start:]):
+                        break
+
+                jobs = self._to_jobs(all_jobs)
 
         except Exception as e:
             print(f"Error fetching TikTok jobs: {e}")
 
         return jobs
 
+    def _to_jobs(self, results: list, seen_ids: Optional[set] = None) -> List[Job]:
+        """Convert API results to Job objects.
+
+        Pass ``seen_ids`` to drop duplicates across calls.
+        """
+        jobs = []
+        seen_ids = set() if seen_ids is None else seen_ids
+        for job_data in results:
+            job_id = job_data.get("id")
+            if job_id in seen_ids:
+                continue
+            seen_ids.add(job_id)
+
+            title = job_data.get("title", "")
+            location = self._extract_location(job_data)
+            team = job_data.get("job_function_name", "")
+
+            if job_id and title:
+                jobs.append(Job(
+                    company=self.company_name,
+                    title=title,
+                    url=self.JOB_URL_TEMPLATE.format(job_id=job_id),
+                    location=location,
+                    team=team,
+                    source="tiktok",
+                ))
+        return jobs
+
     def _extract_location(self, job_data: dict) -> str:
         """Extract location from city_info structure."""
         city_info = job_data.get("city_info", {})
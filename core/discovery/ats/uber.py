@@ -1,96 +1,140 @@
 """Uber careers API fetcher using Playwright."""
 
+import asyncio
 from typing import List
 
 from .base import CareerFetcher
+from .browser import BROWSER_POOL, run_and_wait_for_response
+from .replay import REPLAY_STORE, CapturedRequest
 from ..models import Job
 
 
 class UberFetcher(CareerFetcher):
-    """Fetcher for Uber careers using their internal API via Playwright."""
+    """Fetcher for Uber careers using their internal API via Playwright.
+
+    The browser session captures the ``loadSearchJobsResults`` request;
+    later runs page that endpoint directly over HTTP and only fall back to
+    the browser when the replay stops working.
+    """
+
+    uses_browser = True
 
     CAREERS_URL = "https://www.uber.com/us/en/careers/list/"
     JOB_URL_TEMPLATE = "https://www.uber.com/us/en/careers/list/{job_id}/"
+    API_FRAGMENT = "loadSearchJobsResults"
+    MAX_PAGES = 100
 
     def __init__(self, company_name: str, career_url: str, timeout: float = 30.0):
         super().__init__(company_name, career_url, timeout)
 
     def fetch_job_list(self) -> List[Job]:
+        """Fetch all jobs, replaying the captured API request when possible."""
+        jobs = self._fetch_via_replay()
+        if jobs:
+            return jobs
+        return self._fetch_with_browser()
+
+    async def fetch_job_list_async(self) -> List[Job]:
+        """Replay the API in a plain thread; use a browser pool worker only if needed."""
+        jobs = await asyncio.to_thread(self._fetch_via_replay)
+        if jobs:
+            return jobs
+        return await BROWSER_POOL.run(self._fetch_with_browser)
+
+    def _fetch_via_replay(self) -> List[Job]:
+        """Page loadSearchJobsResults directly with the captured request."""
+        results = REPLAY_STORE.replay(
+            "uber", self.client, self._replay_body, self._extract_results, max_pages=self.MAX_PAGES
+        )
+        return self._to_jobs(results or [])
+
+    @staticmethod
+    def _replay_body(body, index: int):
+        if not isinstance(body, dict):
+            return body if index == 0 else None
+        return {**body, "page": index}
+
+    @staticmethod
+    def _extract_results(data: dict) -> list:
+        return data.get("data", {}).get("results", [])
+
+    def _fetch_with_browser(self) -> List[Job]:
         """Fetch all jobs from Uber's careers by intercepting API responses."""
         jobs = []
 
-        try:
-            from playwright.sync_api import sync_playwright
-        except ImportError:
+        if not BROWSER_POOL.available():
             print("Playwright not installed. Run: pip install playwright && playwright install")
             return jobs
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context()
-                page = context.new_page()
-
+            with BROWSER_POOL.page(storage_key="uber") as page:
                 all_results = []
+                timeout_ms = self.timeout * 1000
 
                 def handle_response(response):
-                    if "loadSearchJobsResults" in response.url:
+                    if self.API_FRAGMENT in response.url:
                         try:
-                            data = response.json()
-                            results = data.get("data", {}).get("results", [])
+                            results = self._extract_results(response.json())
+                            if results and not all_results:
+                                # First results page: keep its request for replay
+                                REPLAY_STORE.save("uber", CapturedRequest.from_playwright(response.request))
                             all_results.extend(results)
                         except Exception:
                             pass
 
                 page.on("response", handle_response)
 
-                # Load the careers page
-                page.goto(self.CAREERS_URL, wait_until="networkidle", timeout=self.timeout * 1000)
-                page.wait_for_timeout(3000)
-
-                # Click "Show more openings" button repeatedly to load all jobs
-                max_clicks = 100
-                for _ in range(max_clicks):
+                # Load the careers page; done as soon as the first results XHR lands
+                run_and_wait_for_response(
+                    page,
+                    self.API_FRAGMENT,
+                    lambda: page.goto(self.CAREERS_URL, wait_until="domcontentloaded", timeout=timeout_ms),
+                    timeout_ms,
+                )
+
+                # Click "Show more openings" repeatedly, waiting on each results XHR
+                show_more = page.locator("button:has-text('Show more openings')")
+                for _ in range(self.MAX_PAGES):
                     try:
-                        show_more = page.locator("button:has-text('Show more openings')")
-                        if show_more.is_visible(timeout=2000):
-                            show_more.click()
-                            page.wait_for_timeout(1500)
-                        else:
+                        show_more.wait_for(state="visible", timeout=2000)
+                        if not run_and_wait_for_response(page, self.API_FRAGMENT, show_more.click, timeout_ms):
                             break
                     except Exception:
                         break
 
-                browser.close()
-
-                # Convert results to Job objects
-                seen_ids = set()
-                for job_data in all_results:
-                    job_id = job_data.get("id")
-                    if job_id in seen_ids:
-                        continue
-                    seen_ids.add(job_id)
-
-                    title = job_data.get("title", "")
-                    location_data = job_data.get("location", {})
-                    location = self._format_location(location_data)
-                    team = job_data.get("team", "")
-
-                    if job_id and title:
-                        jobs.append(Job(
-                            company=self.company_name,
-                            title=title,
-                            url=self.JOB_URL_TEMPLATE.format(job_id=job_id),
-                            location=location,
-                            team=team,
-                            source="uber",
-                        ))
+                jobs = self._to_jobs(all_results)
 
         except Exception as e:
             print(f"Error fetching Uber jobs: {e}")
 
         return jobs
 
+    def _to_jobs(self, results: list) -> List[Job]:
+        """Convert API results to Job objects."""
+        jobs = []
+        seen_ids = set()
+        for job_data in results:
+            job_id = job_data.get("id")
+            if job_id in seen_ids:
+                continue
+            seen_ids.add(job_id)
+
+            title = job_data.get("title", "")
+            location_data = job_data.get("location", {})
+            location = self._format_location(location_data)
+            team = job_data.get("team", "")
+
+            if job_id and title:
+                jobs.append(Job(
+                    company=self.company_name,
+                    title=title,
+                    url=self.JOB_URL_TEMPLATE.format(job_id=job_id),
+                    location=location,
+                    team=team,
+                    source="uber",
+                ))
+        return jobs
+
     def _format_location(self, location_data) -> str:
         """Format location dictionary into a string."""
         if not location_data:
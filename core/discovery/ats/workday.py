@@ -2,10 +2,12 @@
 
 import re
 import json
-from typing import List, Optional
+from itertools import chain
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse, parse_qs
 
-from .base import CareerFetcher
+from .base import CareerFetcher, aclosing
+from ..http_client import CLIENT_MANAGER
 from ..models import Job
 
 
@@ -14,8 +16,22 @@ class WorkdayFetcher(CareerFetcher):
 
     Workday is more complex and may require Playwright for full rendering.
     This implementation attempts API-based extraction first.
+
+    The search API is paged by ``total`` with pages requested concurrently
+    under the shared per-host connection cap, and each page's jobs are
+    yielded as one batch. Tenants with more than ``MAX_RESULTS`` postings
+    are split by ``appliedFacets`` (location, then job family, ...) and the
+    partitions are paged in parallel.
+
+    In incremental mode (the API lists newest first) pages are fetched
+    with up to a window in flight until enough consecutive pages hold only
+    known jobs.
     """
 
+    PAGE_SIZE = 20  # Most tenants reject larger limits
+    MAX_RESULTS = 2000  # Deepest the search API pages
+    PREFERRED_FACETS = ["locationCountry", "locations", "jobFamilyGroup", "timeType"]
+
     def __init__(self, company_name: str, career_url: str, timeout: float = 30.0):
         super().__init__(company_name, career_url, timeout)
         self.workday_host = self._extract_workday_host()
@@ -36,53 +52,233 @@ class WorkdayFetcher(CareerFetcher):
             return parts[-1] if parts[-1] else (parts[-2] if len(parts) >= 2 else "")
         return ""
 
+    @property
+    def api_url(self) -> str:
+        """Workday CXS search endpoint (common pattern across tenants)."""
+        return f"https://{self.workday_host}/wday/cxs/{self._get_tenant()}/{self.company_path}/jobs"
+
+    @property
+    def page_window(self) -> int:
+        """Search pages in flight at once; matches the shared per-host cap."""
+        return max(1, CLIENT_MANAGER.max_connections_per_host)
+
     def fetch_job_list(self) -> List[Job]:
         """Fetch jobs from Workday.
 
         Workday has various implementations. This tries multiple approaches.
         """
-        jobs = []
+        return [job for batch in self.iter_job_batches() for job in batch]
 
-        # Try the search API first
-        jobs = self._fetch_from_search_api()
-        if jobs:
-            return jobs
+    async def fetch_job_list_async(self) -> List[Job]:
+        """Fetch jobs from Workday using the async client."""
+        return [job async for batch in self.iter_job_batches_async() for job in batch]
 
-        # Try parsing the initial page data
-        jobs = self._fetch_from_page_data()
-        if jobs:
-            return jobs
+    def iter_job_batches(self) -> Iterator[List[Job]]:
+        """Yield each search page's new jobs as soon as the page arrives.
 
-        # Fall back to HTML parsing
-        jobs = self._fetch_from_html()
+        If the search API yields nothing, the career page is parsed instead
+        (embedded data, then HTML links) and returned as one batch.
+        """
+        seen_urls = set()
+        found = False
+        pages = self._iter_recent_pages() if self.incremental else self._iter_pages()
+        for page in pages:
+            jobs = self._parse_pages([page], seen_urls)
+            if jobs:
+                found = True
+                yield jobs
+        if found:
+            return
 
-        return jobs
+        try:
+            response = self.client.get(self.career_url)
+            if response.status_code == 200:
+                jobs = self._parse_career_page(response.text)
+                if jobs:
+                    yield jobs
+        except Exception:
+            pass
 
-    def _fetch_from_search_api(self) -> List[Job]:
-        """Try fetching from Workday search API."""
-        jobs = []
+    async def iter_job_batches_async(self) -> AsyncIterator[List[Job]]:
+        """Async variant of ``iter_job_batches``."""
+        seen_urls = set()
+        found = False
+        try:
+            pages = self._iter_recent_pages_async() if self.incremental else self._iter_pages_async()
+            async with aclosing(pages):
+                async for page in pages:
+                    jobs = self._parse_pages([page], seen_urls)
+                    if jobs:
+                        found = True
+                        yield jobs
+            if found:
+                return
+
+            response = await self.async_client.get(self.career_url)
+            if response.status_code == 200:
+                jobs = self._parse_career_page(response.text)
+                if jobs:
+                    yield jobs
+        except Exception:
+            pass
 
-        # Common Workday API endpoint pattern
-        api_url = f"https://{self.workday_host}/wday/cxs/{self._get_tenant()}/{self.company_path}/jobs"
+    def _payload(self, offset: int, applied_facets: Dict[str, List[str]]) -> dict:
+        return {
+            "appliedFacets": applied_facets,
+            "limit": self.PAGE_SIZE,
+            "offset": offset,
+            "searchText": ""
+        }
 
+    def _post_page(self, offset: int, applied_facets: Dict[str, List[str]]) -> Optional[dict]:
         try:
-            payload = {
-                "appliedFacets": {},
-                "limit": 100,
-                "offset": 0,
-                "searchText": ""
-            }
             response = self.client.post(
-                api_url,
-                json=payload,
+                self.api_url,
+                json=self._payload(offset, applied_facets),
+                headers={"Content-Type": "application/json"}
+            )
+            if response.status_code == 200:
+                return response.json()
+        except Exception:
+            pass
+        return None
+
+    async def _post_page_async(self, offset: int,
+                               applied_facets: Dict[str, List[str]]) -> Optional[dict]:
+        try:
+            response = await self.async_client.post(
+                self.api_url,
+                json=self._payload(offset, applied_facets),
                 headers={"Content-Type": "application/json"}
             )
             if response.status_code == 200:
-                data = response.json()
-                jobs = self._parse_api_response(data)
+                return response.json()
         except Exception:
             pass
+        return None
+
+    def _remaining_offsets(self, first_page: dict) -> List[int]:
+        """Offsets still to fetch, from the ``total`` on the first page.
+
+        Only the first page carries a reliable ``total``; later pages often
+        report 0.
+        """
+        total = first_page.get("total", 0)
+        return list(range(self.PAGE_SIZE, min(total, self.MAX_RESULTS), self.PAGE_SIZE))
+
+    @classmethod
+    def _facet_groups(cls, facets: list) -> Dict[str, List[str]]:
+        """Map facetParameter -> value ids, flattening nested facet groups."""
+        groups: Dict[str, List[str]] = {}
+        for facet in facets or []:
+            parameter = facet.get("facetParameter")
+            for value in facet.get("values", []):
+                if "facetParameter" in value:
+                    # Grouped facet (e.g. locationMainGroup -> locations)
+                    for name, ids in cls._facet_groups([value]).items():
+                        groups.setdefault(name, []).extend(ids)
+                elif parameter and value.get("id"):
+                    groups.setdefault(parameter, []).append(value["id"])
+        return groups
+
+    def _partitions(self, first_page: dict,
+                    applied_facets: Dict[str, List[str]]) -> List[Dict[str, List[str]]]:
+        """appliedFacets sub-queries to crawl instead of paging, or [] if paging suffices."""
+        if first_page.get("total", 0) <= self.MAX_RESULTS:
+            return []
+
+        groups = self._facet_groups(first_page.get("facets", []))
+        candidates = [name for name in self.PREFERRED_FACETS if name in groups]
+        candidates += [name for name in groups if name not in candidates]
+        for name in candidates:
+            if name not in applied_facets:
+                return [{**applied_facets, name: [value_id]} for value_id in groups[name]]
+
+        print(f"  ⚠️  Workday query {applied_facets or 'all'} has {first_page.get('total')} jobs; "
+              f"only the first {self.MAX_RESULTS} are reachable")
+        return []
+
+    def _expand(self, applied_facets: Dict[str, List[str]],
+                first_page: dict) -> Tuple[List[Dict[str, List[str]]], List[int]]:
+        """Split a query into partitions, or list its remaining offsets."""
+        partitions = self._partitions(first_page, applied_facets)
+        if partitions:
+            return partitions, []
+        return [], self._remaining_offsets(first_page)
+
+    def _iter_pages(self) -> Iterator[dict]:
+        """Yield every search page, each query's pages in offset order.
+
+        Partition first pages and page offsets share one window of
+        ``page_window`` requests, so partitions are paged in parallel.
+        """
+        return self._iter_crawl(self._post_page, self._expand, {}, self.page_window)
 
+    def _iter_pages_async(self) -> AsyncIterator[dict]:
+        """Async variant of ``_iter_pages``."""
+        return self._aiter_crawl(self._post_page_async, self._expand, {}, self.page_window)
+
+    def _iter_recent_pages(self) -> Iterator[Optional[dict]]:
+        """Page newest-first until ``known_page_limit`` pages in a row hold only known jobs.
+
+        No facet partitioning: an incremental crawl never needs to go past
+        ``MAX_RESULTS``.
+        """
+        first_page = self._post_page(0, {})
+        if not first_page:
+            return
+
+        pages = chain([first_page], self._iter_windowed(
+            lambda offset: self._post_page(offset, {}),
+            self._remaining_offsets(first_page), self.page_window,
+        ))
+        known_pages = 0
+        for page in pages:
+            # Judge the page before handing it on: the caller may store it
+            # right away, and its jobs would then all look known
+            known_pages = known_pages + 1 if self._all_known(self._parse_pages([page])) else 0
+            yield page
+            if known_pages >= self.known_page_limit:
+                break
+
+    async def _iter_recent_pages_async(self) -> AsyncIterator[Optional[dict]]:
+        """Async variant of ``_iter_recent_pages``."""
+        first_page = await self._post_page_async(0, {})
+        if not first_page:
+            return
+
+        # aclosing cancels the pages still in flight when we stop early
+        async with aclosing(self._aiter_windowed(
+            lambda offset: self._post_page_async(offset, {}),
+            self._remaining_offsets(first_page), self.page_window,
+        )) as rest:
+            known_pages = 0
+            page = first_page
+            while True:
+                known_pages = known_pages + 1 if self._all_known(self._parse_pages([page])) else 0
+                yield page
+                if known_pages >= self.known_page_limit:
+                    break
+                try:
+                    page = await rest.__anext__()
+                except StopAsyncIteration:
+                    break
+
+    def _parse_pages(self, pages: List[Optional[dict]],
+                     seen_urls: Optional[set] = None) -> List[Job]:
+        """Parse search pages in order, dropping postings already seen.
+
+        Pass ``seen_urls`` to dedup across calls.
+        """
+        jobs = []
+        seen_urls = set() if seen_urls is None else seen_urls
+        for data in pages:
+            if not data:
+                continue
+            for job in self._parse_api_response(data):
+                if job.url not in seen_urls:
+                    seen_urls.add(job.url)
+                    jobs.append(job)
         return jobs
 
     def _get_tenant(self) -> str:
@@ -127,20 +323,22 @@ class WorkdayFetcher(CareerFetcher):
 
         return ""
 
-    def _fetch_from_page_data(self) -> List[Job]:
+    def _parse_career_page(self, html: str) -> List[Job]:
+        """Parse a downloaded career page: embedded data first, then links."""
+        return self._fetch_from_page_data(html) or self._fetch_from_html(html)
+
+    def _fetch_from_page_data(self, html: str) -> List[Job]:
         """Try extracting job data embedded in the page."""
         jobs = []
 
         try:
-            response = self.client.get(self.career_url)
-            if response.status_code == 200:
-                # Look for embedded JSON data
-                pattern = r'window\.__INITIAL_STATE__\s*=\s*({.*?});'
-                match = re.search(pattern, response.text, re.DOTALL)
-                if match:
-                    data = json.loads(match.group(1))
-                    # Parse the initial state data
-                    jobs = self._parse_initial_state(data)
+            # Look for embedded JSON data
+            pattern = r'window\.__INITIAL_STATE__\s*=\s*({.*?});'
+            match = re.search(pattern, html, re.DOTALL)
+            if match:
+                data = json.loads(match.group(1))
+                # Parse the initial state data
+                jobs = self._parse_initial_state(data)
         except Exception:
             pass
 
@@ -169,31 +367,26 @@ class WorkdayFetcher(CareerFetcher):
 
         return jobs
 
-    def _fetch_from_html(self) -> List[Job]:
+    def _fetch_from_html(self, html: str) -> List[Job]:
         """Fallback: parse job links from HTML."""
         jobs = []
 
-        try:
-            response = self.client.get(self.career_url)
-            if response.status_code == 200:
-                # Look for job links
-                pattern = r'<a[^>]+href="([^"]*job[^"]*)"[^>]*>([^<]+)</a>'
-                matches = re.findall(pattern, response.text, re.IGNORECASE)
-
-                seen = set()
-                for url, title in matches:
-                    if url not in seen and len(title.strip()) > 3:
-                        seen.add(url)
-                        # Make URL absolute if needed
-                        if not url.startswith("http"):
-                            url = f"https://{self.workday_host}{url}"
-                        jobs.append(Job(
-                            company=self.company_name,
-                            title=title.strip(),
-                            url=url,
-                            source="workday",
-                        ))
-        except Exception:
-            pass
+        # Look for job links
+        pattern = r'<a[^>]+href="([^"]*job[^"]*)"[^>]*>([^<]+)</a>'
+        matches = re.findall(pattern, html, re.IGNORECASE)
+
+        seen = set()
+        for url, title in matches:
+            if url not in seen and len(title.strip()) > 3:
+                seen.add(url)
+                # Make URL absolute if needed
+                if not url.startswith("http"):
+                    url = f"https://{self.workday_host}{url}"
+                jobs.append(Job(
+                    company=self.company_name,
+                    title=title.strip(),
+                    url=url,
+                    source="workday",
+                ))
 
         return jobs
@@ -0,0 +1,73 @@
+"""On-disk cache of job descriptions keyed by posting content hash."""
+
+import hashlib
+import json
+import random
+import re
+import time
+from pathlib import Path
+from typing import Dict
+
+
+class DetailCache:
+    """Stores job descriptions per board, keyed by a hash of the posting.
+
+    The key is a hash of the posting's board-level entry (id, title,
+    location, ...), so a description is fetched again when the posting
+    itself changed. That entry does not cover the description, so each
+    description also expires after at most ``ttl_days`` to pick up edits;
+    expiry is spread over the second half of that period so a board's
+    descriptions are not all fetched again on the same run. Each save
+    keeps just the current board's entries, so the cache never outgrows
+    the boards it covers.
+    """
+
+    def __init__(self, cache_dir: str = ".cache/details", ttl_days: float = 7):
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_days * 86400
+
+    @staticmethod
+    def content_hash(posting: dict) -> str:
+        """Stable hash of a posting's board entry."""
+        return hashlib.sha256(json.dumps(posting, sort_keys=True).encode()).hexdigest()
+
+    def _path(self, board: str) -> Path:
+        safe_board = re.sub(r"[^A-Za-z0-9._-]", "_", board)
+        return self.cache_dir / f"{safe_board}.json"
+
+    def load(self, board: str) -> Dict[str, dict]:
+        """Get a board's unexpired entries (content hash -> entry).
+
+        Each entry holds ``description`` and ``expires_at``.
+        """
+        path = self._path(board)
+        if not path.exists():
+            return {}
+        try:
+            with open(path, "r") as f:
+                entries = json.load(f)
+        except Exception:
+            return {}
+        now = time.time()
+        return {
+            key: entry for key, entry in entries.items()
+            if isinstance(entry, dict) and entry.get("expires_at", 0) > now
+        }
+
+    def entry(self, description: str) -> dict:
+        """Cache entry for a description that was just fetched."""
+        return {
+            "description": description,
+            "expires_at": time.time() + self.ttl_seconds * random.uniform(0.5, 1),
+        }
+
+    def save(self, board: str, entries: Dict[str, dict]) -> None:
+        """Replace a board's cached entries."""
+        path = self._path(board)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(entries, f)
+
+
+# Process-wide cache shared by fetchers that enrich jobs with descriptions
+DETAIL_CACHE = DetailCache()
@@ -0,0 +1,324 @@
+"""On-disk HTTP response cache with conditional revalidation."""
+
+import asyncio
+import hashlib
+import json
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+
+class ResponseCache:
+    """Size-bounded LRU store of successful responses.
+
+    Bodies are kept on disk exactly as received (still compressed), one file
+    per entry. Metadata (status, headers, validators, timestamps) lives in a
+    single ``index.json`` next to them.
+
+    Entries younger than ``ttl`` seconds are served without touching the
+    network. Older entries are revalidated with ``If-None-Match`` /
+    ``If-Modified-Since`` and served from disk when the server answers 304.
+
+    Only board API responses are cached (``CACHEABLE_URLS``), so career
+    pages and HTML results pages never crowd API entries out of the LRU.
+    The index is written once, on ``flush()`` (transport close), rather
+    than after every stored response.
+    """
+
+    CACHEABLE_METHODS = ("GET", "POST")
+
+    # Regexes (searched in the request URL) of the board APIs worth caching
+    CACHEABLE_URLS = [
+        r"^https://boards-api\.greenhouse\.io/",
+        r"^https://api\.lever\.co/",
+        r"^https://jobs\.ashbyhq\.com/api/",
+        r"^https://www\.amazon\.jobs/[^/]+/search\.json",
+        r"/wday/cxs/",
+    ]
+
+    def __init__(self, cache_dir: str = ".cache/http", ttl: float = 3600,
+                 max_size_mb: float = 200, enabled: bool = True):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.enabled = enabled
+        self.cacheable_urls: List[str] = list(self.CACHEABLE_URLS)
+        self._url_regex = self._compile_urls(self.cacheable_urls)
+        self._index: Optional[Dict[str, dict]] = None
+        self._total_size = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _compile_urls(patterns: List[str]) -> Optional[re.Pattern]:
+        return re.compile("|".join(f"(?:{pattern})" for pattern in patterns)) if patterns else None
+
+    def configure(self, config: Optional[dict]) -> None:
+        """Apply the ``http_cache`` section of settings.yaml."""
+        config = config or {}
+        with self._lock:
+            self._flush_locked()
+            self.enabled = bool(config.get("enabled", self.enabled))
+            self.cache_dir = Path(config.get("dir", self.cache_dir))
+            self.ttl = float(config.get("ttl", self.ttl))
+            if "max_size_mb" in config:
+                self.max_size_bytes = int(float(config["max_size_mb"]) * 1024 * 1024)
+            self.cacheable_urls = list(config.get("urls", self.cacheable_urls))
+            self._url_regex = self._compile_urls(self.cacheable_urls)
+            self._index = None
+
+    @property
+    def index_path(self) -> Path:
+        return self.cache_dir / "index.json"
+
+    def _body_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.body"
+
+    def _load_index(self) -> Dict[str, dict]:
+        if self._index is None:
+            self._index = {}
+            if self.index_path.exists():
+                try:
+                    with open(self.index_path, "r") as f:
+                        self._index = json.load(f)
+                except Exception:
+                    self._index = {}
+            self._total_size = sum(e.get("size", 0) for e in self._index.values())
+        return self._index
+
+    def is_cacheable(self, request: httpx.Request) -> bool:
+        """Only cache idempotent board API reads (GET, and GraphQL/search POSTs).
+
+        Requests sent with ``extensions={"no_cache": True}`` bypass the cache
+        (e.g. partial reads that stop before the end of the body).
+        """
+        return (
+            self.enabled
+            and request.method in self.CACHEABLE_METHODS
+            and not request.extensions.get("no_cache")
+            and self._url_regex is not None
+            and self._url_regex.search(str(request.url)) is not None
+        )
+
+    def key_for(self, request: httpx.Request) -> str:
+        """Cache key from method, URL and request body."""
+        digest = hashlib.sha256()
+        digest.update(request.method.encode())
+        digest.update(str(request.url).encode())
+        digest.update(request.read())
+        return digest.hexdigest()
+
+    def lookup(self, key: str) -> Optional[dict]:
+        """Get entry metadata, or None if missing."""
+        with self._lock:
+            entry = self._load_index().get(key)
+            if entry is not None and not self._body_path(key).exists():
+                self._total_size -= entry.get("size", 0)
+                del self._index[key]
+                self._dirty = True
+                return None
+            return entry
+
+    def is_fresh(self, entry: dict) -> bool:
+        return time.time() - entry.get("stored_at", 0) < self.ttl
+
+    def read_body(self, key: str) -> bytes:
+        with self._lock:
+            entry = self._load_index().get(key)
+            if entry is not None:
+                entry["last_access"] = time.time()
+                self._dirty = True
+        return self._body_path(key).read_bytes()
+
+    def store(self, key: str, request: httpx.Request, response: httpx.Response, body: bytes) -> None:
+        """Save a 200 response body and its validators."""
+        with self._lock:
+            index = self._load_index()
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._body_path(key).write_bytes(body)
+            now = time.time()
+            previous = index.get(key)
+            if previous is not None:
+                self._total_size -= previous.get("size", 0)
+            self._total_size += len(body)
+            index[key] = {
+                "url": str(request.url),
+                "status": response.status_code,
+                "headers": list(response.headers.multi_items()),
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified"),
+                "size": len(body),
+                "stored_at": now,
+                "last_access": now,
+            }
+            self._evict_locked()
+            self._dirty = True
+
+    def refresh(self, key: str, response: httpx.Response) -> None:
+        """Mark an entry fresh again after a 304, picking up new validators."""
+        with self._lock:
+            entry = self._load_index().get(key)
+            if entry is None:
+                return
+            now = time.time()
+            entry["stored_at"] = now
+            entry["last_access"] = now
+            if response.headers.get("etag"):
+                entry["etag"] = response.headers["etag"]
+            if response.headers.get("last-modified"):
+                entry["last_modified"] = response.headers["last-modified"]
+            self._dirty = True
+
+    def _evict_locked(self) -> None:
+        """Drop least recently used entries until under the size bound."""
+        index = self._index
+        if self._total_size <= self.max_size_bytes:
+            return
+        for key in sorted(index, key=lambda k: index[k].get("last_access", 0)):
+            self._total_size -= index[key].get("size", 0)
+            del index[key]
+            try:
+                self._body_path(key).unlink()
+            except FileNotFoundError:
+                pass
+            if self._total_size <= self.max_size_bytes:
+                break
+
+    def _save_index_locked(self) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self._index, f)
+        tmp_path.replace(self.index_path)
+        self._dirty = False
+
+    def _flush_locked(self) -> None:
+        if self._dirty and self._index is not None:
+            self._save_index_locked()
+
+    def flush(self) -> None:
+        """Persist access times and revalidation results."""
+        with self._lock:
+            self._flush_locked()
+
+    def add_validators(self, request: httpx.Request, entry: dict) -> None:
+        """Turn the request into a conditional one."""
+        if entry.get("etag"):
+            request.headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            request.headers["If-Modified-Since"] = entry["last_modified"]
+
+    def cached_response(self, key: str, entry: dict, source: str) -> httpx.Response:
+        """Build a response from a stored entry.
+
+        ``source`` is exposed as ``response.extensions["cache"]``
+        ("hit" or "revalidated").
+        """
+        return self.response_from(entry, self.read_body(key), source)
+
+    @staticmethod
+    def response_from(entry: dict, body: bytes, source: str) -> httpx.Response:
+        """Build a response from an entry and its already-read body."""
+        return httpx.Response(
+            status_code=entry.get("status", 200),
+            headers=entry.get("headers", []),
+            stream=httpx.ByteStream(body),
+            extensions={"cache": source},
+        )
+
+
+# Process-wide cache shared by every fetcher
+RESPONSE_CACHE = ResponseCache()
+
+
+class CachingTransport(httpx.BaseTransport):
+    """Transport wrapper that serves and revalidates from ResponseCache."""
+
+    def __init__(self, transport: httpx.BaseTransport, cache: ResponseCache = RESPONSE_CACHE):
+        self._transport = transport
+        self._cache = cache
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if not self._cache.is_cacheable(request):
+            return self._transport.handle_request(request)
+
+        key = self._cache.key_for(request)
+        entry = self._cache.lookup(key)
+        if entry is not None:
+            if self._cache.is_fresh(entry):
+                return self._cache.cached_response(key, entry, "hit")
+            self._cache.add_validators(request, entry)
+
+        response = self._transport.handle_request(request)
+
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            self._cache.refresh(key, response)
+            return self._cache.cached_response(key, entry, "revalidated")
+
+        if response.status_code == 200:
+            body = b"".join(response.iter_raw())
+            self._cache.store(key, request, response, body)
+            return httpx.Response(
+                status_code=response.status_code,
+                headers=response.headers,
+                stream=httpx.ByteStream(body),
+                extensions={**response.extensions, "cache": "miss"},
+            )
+
+        return response
+
+    def close(self) -> None:
+        self._cache.flush()
+        self._transport.close()
+
+
+class AsyncCachingTransport(httpx.AsyncBaseTransport):
+    """Async variant of CachingTransport.
+
+    Cache disk I/O runs in worker threads so it never blocks the event loop.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, cache: ResponseCache = RESPONSE_CACHE):
+        self._transport = transport
+        self._cache = cache
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not self._cache.is_cacheable(request):
+            return await self._transport.handle_async_request(request)
+
+        key = self._cache.key_for(request)
+        entry = await asyncio.to_thread(self._cache.lookup, key)
+        if entry is not None:
+            if self._cache.is_fresh(entry):
+                body = await asyncio.to_thread(self._cache.read_body, key)
+                return self._cache.response_from(entry, body, "hit")
+            self._cache.add_validators(request, entry)
+
+        response = await self._transport.handle_async_request(request)
+
+        if response.status_code == 304 and entry is not None:
+            await response.aclose()
+            self._cache.refresh(key, response)
+            body = await asyncio.to_thread(self._cache.read_body, key)
+            return self._cache.response_from(entry, body, "revalidated")
+
+        if response.status_code == 200:
+            body = b"".join([chunk async for chunk in response.aiter_raw()])
+            await asyncio.to_thread(self._cache.store, key, request, response, body)
+            return httpx.Response(
+                status_code=response.status_code,
+                headers=response.headers,
+                stream=httpx.ByteStream(body),
+                extensions={**response.extensions, "cache": "miss"},
+            )
+
+        return response
+
+    async def aclose(self) -> None:
+        await asyncio.to_thread(self._cache.flush)
+        await self._transport.aclose()
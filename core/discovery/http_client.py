@@ -0,0 +1,244 @@
+"""Process-wide pooled HTTP clients shared by fetchers and the ATS detector."""
+
+import asyncio
+import importlib.util
+import threading
+from typing import Callable, Dict, Optional
+
+import httpx
+
+from .ratelimit import RateLimitedTransport, AsyncRateLimitedTransport
+from .http_cache import CachingTransport, AsyncCachingTransport
+from .retry import RetryTransport, AsyncRetryTransport
+
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+}
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    """Response stream that frees a per-host slot once the body is closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+
+    def __iter__(self):
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    """Async response stream that frees a per-host slot once closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class HostLimitedTransport(httpx.BaseTransport):
+    """Caps in-flight requests per host on top of the shared pool."""
+
+    def __init__(self, transport: httpx.BaseTransport, max_per_host: int):
+        self._transport = transport
+        self._max_per_host = max_per_host
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self._max_per_host)
+            return self._semaphores[host]
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        semaphore = self._semaphore(request.url.host)
+        semaphore.acquire()
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(response.stream, semaphore.release),
+            extensions=response.extensions,
+        )
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncHostLimitedTransport(httpx.AsyncBaseTransport):
+    """Async variant of HostLimitedTransport."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_per_host: int):
+        self._transport = transport
+        self._max_per_host = max_per_host
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self._max_per_host)
+        semaphore = self._semaphores[host]
+        await semaphore.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_AsyncReleasingStream(response.stream, semaphore.release),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class ClientManager:
+    """Hands out HTTP clients backed by one shared keep-alive pool.
+
+    All clients from the manager share a single transport stack
+    (response cache -> retry/circuit breaker -> rate limiter -> per-host
+    cap -> pool), so every
+    fetcher talking to the same host reuses the same warm connections
+    (multiplexed over HTTP/2 when the ``h2`` package is installed).
+    Clients are cached per timeout value; they are cheap wrappers around
+    the shared pool.
+
+    Fetchers must not close borrowed clients. Call ``close()``/``aclose()``
+    on the manager once the run is finished.
+    """
+
+    def __init__(self):
+        self.http2 = True
+        self.max_connections = 100
+        self.max_keepalive_connections = 20
+        self.keepalive_expiry = 30.0
+        self.max_connections_per_host = 6
+        self._transport: Optional[httpx.BaseTransport] = None
+        self._async_transport: Optional[httpx.AsyncBaseTransport] = None
+        self._clients: Dict[float, httpx.Client] = {}
+        self._async_clients: Dict[float, httpx.AsyncClient] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, config: Optional[dict]) -> None:
+        """Apply the ``http`` section of settings.yaml.
+
+        Only affects pools created after the call.
+        """
+        config = config or {}
+        self.http2 = bool(config.get("http2", self.http2))
+        self.max_connections = int(config.get("max_connections", self.max_connections))
+        self.max_keepalive_connections = int(
+            config.get("max_keepalive_connections", self.max_keepalive_connections)
+        )
+        self.keepalive_expiry = float(config.get("keepalive_expiry", self.keepalive_expiry))
+        self.max_connections_per_host = int(
+            config.get("max_connections_per_host", self.max_connections_per_host)
+        )
+
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def _use_http2(self) -> bool:
+        # HTTP/2 support in httpx is an optional extra (pip install httpx[http2])
+        return self.http2 and importlib.util.find_spec("h2") is not None
+
+    def _build_transport(self) -> httpx.BaseTransport:
+        transport = httpx.HTTPTransport(http2=self._use_http2(), limits=self.limits)
+        transport = HostLimitedTransport(transport, self.max_connections_per_host)
+        transport = RateLimitedTransport(transport)
+        transport = RetryTransport(transport)
+        return CachingTransport(transport)
+
+    def _build_async_transport(self) -> httpx.AsyncBaseTransport:
+        transport = httpx.AsyncHTTPTransport(http2=self._use_http2(), limits=self.limits)
+        transport = AsyncHostLimitedTransport(transport, self.max_connections_per_host)
+        transport = AsyncRateLimitedTransport(transport)
+        transport = AsyncRetryTransport(transport)
+        return AsyncCachingTransport(transport)
+
+    def get_client(self, timeout: float = 30.0) -> httpx.Client:
+        """Borrow a blocking client with the given timeout."""
+        with self._lock:
+            if self._transport is None:
+                self._transport = self._build_transport()
+            client = self._clients.get(timeout)
+            if client is None:
+                client = httpx.Client(
+                    timeout=timeout,
+                    headers=DEFAULT_HEADERS,
+                    follow_redirects=True,
+                    transport=self._transport,
+                )
+                self._clients[timeout] = client
+            return client
+
+    def get_async_client(self, timeout: float = 30.0) -> httpx.AsyncClient:
+        """Borrow an async client with the given timeout.
+
+        Async pools are tied to the running event loop, so ``aclose()``
+        must be awaited before that loop exits.
+        """
+        if self._async_transport is None:
+            self._async_transport = self._build_async_transport()
+        client = self._async_clients.get(timeout)
+        if client is None:
+            client = httpx.AsyncClient(
+                timeout=timeout,
+                headers=DEFAULT_HEADERS,
+                follow_redirects=True,
+                transport=self._async_transport,
+            )
+            self._async_clients[timeout] = client
+        return client
+
+    def close(self) -> None:
+        """Close the shared blocking pool."""
+        with self._lock:
+            self._clients = {}
+            if self._transport is not None:
+                self._transport.close()
+                self._transport = None
+
+    async def aclose(self) -> None:
+        """Close the shared async pool."""
+        self._async_clients = {}
+        if self._async_transport is not None:
+            await self._async_transport.aclose()
+            self._async_transport = None
+
+
+# Process-wide manager used by all fetchers and the ATS detector
+CLIENT_MANAGER = ClientManager()
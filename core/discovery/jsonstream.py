@@ -0,0 +1,75 @@
+"""Incremental decoding of JSON array responses."""
+
+import json
+from typing import List
+
+
+class JsonArrayStream:
+    """Decodes the elements of a top-level JSON array as text arrives.
+
+    Feed response text chunk by chunk; each call returns the elements that
+    are complete so far. Only the current, partially received element is
+    buffered, so memory stays flat however long the array is.
+    """
+
+    WHITESPACE = " \t\r\n"
+    NUMBER_CHARS = "0123456789.eE+-"
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._started = False
+        self.done = False
+
+    def feed(self, text: str) -> List:
+        """Add a chunk of text and return the newly completed elements."""
+        if self.done:
+            return []
+
+        buffer = self._buffer + text
+        items = []
+        pos = 0
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in self.WHITESPACE:
+                pos += 1
+            if pos >= len(buffer):
+                break
+
+            char = buffer[pos]
+            if not self._started:
+                if char != "[":
+                    raise ValueError("Expected a JSON array")
+                self._started = True
+                pos += 1
+                continue
+            if char == ",":
+                pos += 1
+                continue
+            if char == "]":
+                self.done = True
+                pos += 1
+                break
+
+            try:
+                item, end = self._decoder.raw_decode(buffer, pos)
+            except ValueError:
+                # Element not fully received yet
+                break
+            if not isinstance(item, (dict, list)) and (
+                end == len(buffer) or buffer[end] in self.NUMBER_CHARS
+            ):
+                # A number may still be growing: at the end of the buffer, or
+                # followed by the part of it that could not be decoded yet
+                # (e.g. "2." until the fraction digits arrive)
+                break
+            items.append(item)
+            pos = end
+
+        self._buffer = buffer[pos:]
+        return items
+
+    def close(self) -> None:
+        """Check that the whole array was received."""
+        if not self.done:
+            raise ValueError("Truncated JSON array")
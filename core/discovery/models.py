@@ -2,10 +2,19 @@
 
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 import json
 
 
+def canonical_job_url(url: str) -> str:
+    """Key identifying a job by its URL.
+
+    Normalizes case and trailing slashes but keeps the query string, since
+    it often holds the job ID (e.g. ``gh_jid``, ``job_id``).
+    """
+    return url.lower().rstrip("/")
+
+
 @dataclass
 class Company:
     """Represents a company to search for jobs."""
@@ -14,6 +23,12 @@ class Company:
     career_url: str
     ats_type: Optional[str] = None
     last_crawled: Optional[str] = None
+    fingerprint: Optional[str] = None
+    changes_seen: float = 0.0
+    hours_observed: float = 0.0
+    crawl_interval_hours: Optional[float] = None
+    high_water_mark: Optional[str] = None
+    open_jobs: List[str] = field(default_factory=list)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -35,6 +50,8 @@ class Job:
     location: Optional[str] = None
     team: Optional[str] = None
     source: str = "unknown"
+    updated_at: Optional[str] = None
+    description: Optional[str] = None
     discovered_at: str = field(default_factory=lambda: datetime.now().isoformat())
 
     def to_dict(self) -> dict:
@@ -56,3 +73,8 @@ class Job:
         # Remove query parameters and trailing slashes
         url = self.url.split("?")[0].rstrip("/")
         return url.lower()
+
+    @property
+    def job_key(self) -> str:
+        """Canonical job URL with the query kept (see ``canonical_job_url``)."""
+        return canonical_job_url(self.url)
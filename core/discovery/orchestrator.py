@@ -1,4 +1,5 @@
 """Discovery orchestrator - coordinates job search across companies."""
+import asyncio
 import sys
 import yaml
 from pathlib import Path
@@ -10,25 +11,36 @@ try:
     from core.discovery.registry import CompanyRegistry
     from core.discovery.filter import JobFilter
     from core.discovery.store import JobStore
-    from core.discovery.ats import (
-        ATSDetector,
-        GreenhouseFetcher,
-        LeverFetcher,
-        AshbyFetcher,
-        WorkdayFetcher,
-        GenericFetcher,
-        UberFetcher,
-        AmazonFetcher,
-        MetaFetcher,
-        GoogleFetcher,
-        TikTokFetcher,
-    )
+    from core.discovery.spool import BatchSpool
+    from core.discovery.ratelimit import RATE_LIMITER
+    from core.discovery.http_client import CLIENT_MANAGER
+    from core.discovery.http_cache import RESPONSE_CACHE
+    from core.discovery.retry import RETRY_POLICY
+    from core.discovery.scheduler import CrawlScheduler
+    from core.discovery.ats.browser import BROWSER_POOL
+    from core.discovery.ats.replay import REPLAY_STORE
+    from core.discovery.ats.fetcher_registry import FETCHER_REGISTRY
     ARGUS_AVAILABLE = True
 except ImportError as e:
     ARGUS_AVAILABLE = False
     IMPORT_ERROR = str(e)
 
 
+DEFAULT_CONCURRENCY = 8
+BATCH_QUEUE_SIZE = 4  # Job batches kept in memory per company ahead of storage
+DEFAULT_SETTINGS = 'config/settings.yaml'
+REGISTRY_PATH = 'results/companies_registry.json'
+
+
+def load_settings(path):
+    """Load discovery settings, returning an empty dict if missing."""
+    settings_path = Path(path)
+    if not settings_path.exists():
+        return {}
+    with open(settings_path) as f:
+        return yaml.safe_load(f) or {}
+
+
 def run_discovery(args):
     """Run job discovery."""
     print("🔍 JobForge - Job Discovery")
@@ -52,59 +64,241 @@ def run_discovery(args):
     
     companies = config.get('companies', [])
     
-    # Filter companies if specified
+    settings = load_settings(getattr(args, 'settings', None) or DEFAULT_SETTINGS)
+    RATE_LIMITER.configure(settings.get('rate_limits'))
+    CLIENT_MANAGER.configure(settings.get('http'))
+    RESPONSE_CACHE.configure(settings.get('http_cache'))
+    RETRY_POLICY.configure(settings.get('retry'), max_retries=settings.get('max_retries'))
+    BROWSER_POOL.configure(settings.get('browser'))
+    REPLAY_STORE.configure(settings.get('browser'))
+    
+    registry = CompanyRegistry(REGISTRY_PATH)
+    scheduler = CrawlScheduler.from_config(settings.get('schedule'))
+    
+    # Filter companies if specified; explicitly named companies are always crawled
     if args.companies:
         company_names = [c.strip() for c in args.companies.split(',')]
         companies = [c for c in companies if c['name'] in company_names]
+    elif not getattr(args, 'all', False):
+        due = [c for c in companies if scheduler.is_due(get_company_record(registry, c))]
+        if len(due) < len(companies):
+            print(f"\n⏭️  Skipping {len(companies) - len(due)} companies not yet due (use --all to crawl everything)")
+        companies = due
+    
+    concurrency = max(1, getattr(args, 'concurrency', None) or DEFAULT_CONCURRENCY)
     
     print(f"\n📋 Searching {len(companies)} companies")
     print(f"⏱️  Timeout: {args.timeout}s")
+    print(f"🔀 Concurrency: {concurrency}")
     print("="*50)
     
-    # Initialize components
+    # Initialize components. The store adds the date folder itself; rooting
+    # it at results/jobs lets it recognise jobs saved on earlier days.
+    store = JobStore('results/jobs')
     output_dir = Path('results/jobs') / datetime.now().strftime('%Y-%m-%d')
-    store = JobStore(str(output_dir))
+    
+    incremental = settings.get('incremental') or {}
+    known_page_limit = int(incremental.get('known_pages', 2)) if incremental.get('enabled', True) else 0
+    delta_sync = bool(incremental.get('delta_sync', True))
+    
+    try:
+        total_jobs, successful = asyncio.run(
+            discover_companies(
+                companies, store, registry, args.timeout, concurrency, scheduler,
+                known_page_limit, delta_sync,
+            )
+        )
+    finally:
+        BROWSER_POOL.close()
+        CLIENT_MANAGER.close()
+    
+    print("\n" + "="*50)
+    print("✅ Discovery Complete!")
+    print(f"   Companies searched: {successful}/{len(companies)}")
+    print(f"   Total jobs found: {total_jobs}")
+    print(f"   Saved to: {output_dir}")
+    
+    return 0
+
+
+async def discover_companies(companies, store, registry, timeout,
+                             concurrency=DEFAULT_CONCURRENCY, scheduler=None,
+                             known_page_limit=0, delta_sync=False):
+    """Fetch all companies concurrently and store results in config order.
+    
+    Up to ``concurrency`` boards are fetched at once. Results are consumed
+    in the order companies appear in the config, so per-company output,
+    ``JobStore`` writes and registry updates stay sequential and
+    deterministic while the network work overlaps.
+    
+    Jobs arrive in batches (a results page at a time for paginating
+    fetchers) and are stored as they come, so storage overlaps the rest of
+    the board's download. Each company keeps at most ``BATCH_QUEUE_SIZE``
+    batches in memory; a fetch that gets further ahead of the consumer
+    spills its batches to a temporary file and keeps going, so a board
+    waiting its turn never holds a concurrency slot idle.
+    
+    Boards whose fingerprint matches the one recorded in the registry on
+    the previous run are reported as unchanged and skip filtering/storage.
+    Each successful crawl also feeds the scheduler's churn estimate.
+    
+    With ``known_page_limit`` > 0, paginating fetchers crawl newest-first
+    and stop after that many consecutive pages of jobs already in ``store``.
+    With ``delta_sync``, fetchers that support it only return jobs updated
+    since the previous run, and jobs gone from the board are recorded as
+    closed.
+    
+    Returns:
+        Tuple of (total jobs found, companies with at least one job).
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    records = [get_company_record(registry, company_config) for company_config in companies]
+    queues = [BatchSpool(BATCH_QUEUE_SIZE) for _ in companies]
+    tasks = [
+        asyncio.create_task(
+            fetch_company(
+                company_config, timeout, semaphore, queue, record,
+                store.is_known if known_page_limit else None, known_page_limit, delta_sync,
+            )
+        )
+        for company_config, record, queue in zip(companies, records, queues)
+    ]
     
     total_jobs = 0
     successful = 0
     
-    for i, company_config in enumerate(companies, 1):
-        company_name = company_config['name']
-        career_url = company_config['career_url']
-        ats_type = company_config.get('ats_type', 'generic')
-        
-        print(f"\n[{i}/{len(companies)}] {company_name}")
-        print(f"   URL: {career_url}")
-        print(f"   ATS: {ats_type}")
-        
-        try:
-            # Select fetcher based on ATS type
-            fetcher = get_fetcher(ats_type, career_url, args.timeout)
+    try:
+        for i, (company_config, task) in enumerate(zip(companies, tasks), 1):
+            company_name = company_config['name']
             
-            # Fetch jobs
-            jobs = fetcher.fetch_job_list()
+            print(f"\n[{i}/{len(companies)}] {company_name}")
+            print(f"   URL: {company_config['career_url']}")
+            print(f"   ATS: {company_config.get('ats_type', 'generic')}")
             
-            if jobs:
-                # Save jobs
-                company = Company(name=company_name, career_url=career_url)
-                store.save_jobs(company, jobs)
+            try:
+                found = 0
+                new_count = 0
+                updated_count = 0
+                urls = set()
+                while (item := await queues[i - 1].get()) is not None:
+                    batch, is_delta = item
+                    found += len(batch)
+                    urls.update(job.canonical_url for job in batch)
+                    if is_delta:
+                        # Delta jobs may be edits or reopenings of stored jobs
+                        new, updated = store.save_updates(batch, company_name)
+                        new_count += new
+                        updated_count += updated
+                    else:
+                        new_count += store.save_jobs(batch, company_name)
+                
+                fetcher = await task
+                # Fetchers without a single board payload are fingerprinted by job IDs
+                if fetcher.fingerprint is None and urls:
+                    fetcher.fingerprint = fetcher.fingerprint_urls(urls)
+                unchanged = fetcher.unchanged
+                # A delta sync can succeed with nothing new to report
+                synced = fetcher.open_urls is not None
                 
-                print(f"   ✅ Found {len(jobs)} jobs")
-                total_jobs += len(jobs)
-                successful += 1
-            else:
-                print(f"   ⚠️  No jobs found")
+                if unchanged:
+                    print("   💤 Unchanged since last run")
+                    successful += 1
+                elif found or synced:
+                    registry.update_fingerprint(company_name, fetcher.fingerprint)
+                    
+                    if synced:
+                        closed = sorted(fetcher.closed_urls)
+                        store.save_closed(closed, company_name)
+                        registry.update_sync_state(
+                            company_name, fetcher.high_water_mark, sorted(fetcher.open_urls)
+                        )
+                        print(f"   🔄 {found} new/updated of {len(fetcher.open_urls)} open jobs "
+                              f"({new_count} new, {updated_count} updated, {len(closed)} closed)")
+                    else:
+                        print(f"   ✅ Found {found} jobs ({new_count} new)")
+                    total_jobs += found
+                    successful += 1
+                else:
+                    # Leave last_crawled alone so the company is retried next run
+                    print("   ⚠️  No jobs found")
+                    continue
                 
-        except Exception as e:
-            print(f"   ❌ Error: {str(e)[:80]}")
+                if scheduler is not None:
+                    changes, hours, interval = scheduler.observe(records[i - 1], changed=not unchanged)
+                    registry.update_schedule(company_name, changes, hours, interval)
+                    print(f"   🗓️  Next crawl in {interval:.0f}h")
+                registry.update_last_crawled(company_name)
+                    
+            except Exception as e:
+                print(f"   ❌ Error: {str(e)[:80]}")
+                # Stop the fetch and drop whatever it buffered
+                await abandon_company(task, queues[i - 1])
+    finally:
+        for queue in queues:
+            queue.close()
+        # Async pools are bound to this event loop
+        await CLIENT_MANAGER.aclose()
     
-    print("\n" + "="*50)
-    print(f"✅ Discovery Complete!")
-    print(f"   Companies searched: {successful}/{len(companies)}")
-    print(f"   Total jobs found: {total_jobs}")
-    print(f"   Saved to: {output_dir}")
+    return total_jobs, successful
+
+
+async def abandon_company(task, batches):
+    """Cancel a company's fetch and discard the batches it buffered."""
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    batches.close()
+
+
+def get_company_record(registry, company_config):
+    """Get the registry record for a configured company, creating it if new."""
+    company = registry.get(company_config['name'])
+    if company is None:
+        company = Company(
+            name=company_config['name'],
+            career_url=company_config['career_url'],
+            ats_type=company_config.get('ats_type'),
+        )
+        registry.add(company)
+    return company
+
+
+async def fetch_company(company_config, timeout, semaphore, batches, record=None,
+                        is_known=None, known_page_limit=0, delta_sync=False):
+    """Fetch one company's jobs, holding a concurrency slot while doing so.
     
-    return 0
+    Args:
+        batches: BatchSpool that receives ``(jobs, is_delta)`` for each batch as
+            it arrives, then None once the fetch is over (also when it fails
+            or is cancelled). ``is_delta`` marks batches from a delta sync,
+            which hold new and updated jobs.
+        record: Registry record with the previous run's fingerprint and
+            delta-sync state.
+    
+    Returns:
+        The fetcher, carrying the board fingerprint, ``unchanged`` and the
+        delta-sync results.
+    """
+    ats_type = company_config.get('ats_type', 'generic')
+    
+    try:
+        async with semaphore:
+            fetcher = get_fetcher(ats_type, company_config['career_url'], timeout)
+            if record is not None:
+                fetcher.previous_fingerprint = record.fingerprint
+                fetcher.since = record.high_water_mark
+                fetcher.previous_open_urls = set(record.open_jobs)
+            fetcher.delta_sync = delta_sync
+            fetcher.is_known = is_known
+            fetcher.known_page_limit = known_page_limit
+            async with fetcher:
+                async for batch in fetcher.iter_job_batches_async():
+                    batches.put((batch, fetcher.open_urls is not None))
+    except BaseException:
+        batches.put(None)
+        raise
+    
+    batches.put(None)
+    return fetcher
 
 
 def get_fetcher(ats_type, url, timeout):
@@ -114,17 +308,5 @@ def get_fetcher(ats_type, url, timeout):
     parsed = urlparse(url)
     company_name = parsed.path.strip('/').split('/')[0] if parsed.path else 'Unknown'
     
-    fetchers = {
-        'greenhouse': GreenhouseFetcher,
-        'lever': LeverFetcher,
-        'ashby': AshbyFetcher,
-        'workday': WorkdayFetcher,
-        'uber': UberFetcher,
-        'amazon': AmazonFetcher,
-        'meta': MetaFetcher,
-        'google': GoogleFetcher,
-        'tiktok': TikTokFetcher,
-    }
-    
-    fetcher_class = fetchers.get(ats_type, GenericFetcher)
-    return fetcher_class(company_name, url, timeout=timeout)
+    # Fetcher modules are imported on first use; unknown types get the generic fetcher
+    return FETCHER_REGISTRY.create(ats_type, company_name, url, timeout=timeout)
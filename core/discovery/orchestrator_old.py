@@ -8,19 +8,10 @@ from .models import Company, Job
 from .registry import CompanyRegistry
 from .filter import JobFilter, LocationFilter
 from .store import JobStore
-from .ats import (
-    ATSDetector,
-    GreenhouseFetcher,
-    LeverFetcher,
-    AshbyFetcher,
-    WorkdayFetcher,
-    GenericFetcher,
-    UberFetcher,
-    AmazonFetcher,
-    MetaFetcher,
-    GoogleFetcher,
-    TikTokFetcher,
-)
+from .http_client import CLIENT_MANAGER
+from .ats.browser import BROWSER_POOL
+from .ats.detector import ATSDetector
+from .ats.fetcher_registry import FETCHER_REGISTRY
 
 
 class Orchestrator:
@@ -126,49 +117,50 @@ class Orchestrator:
             print(f"  Detected: {ats_type}")
 
         # Return appropriate fetcher
-        fetchers = {
-            "greenhouse": GreenhouseFetcher,
-            "lever": LeverFetcher,
-            "ashby": AshbyFetcher,
-            "workday": WorkdayFetcher,
-            "uber": UberFetcher,
-            "amazon": AmazonFetcher,
-            "meta": MetaFetcher,
-            "google": GoogleFetcher,
-            "tiktok": TikTokFetcher,
-        }
-
-        fetcher_class = fetchers.get(ats_type, GenericFetcher)
-        return fetcher_class(company.name, company.career_url, self.timeout)
+        return FETCHER_REGISTRY.create(ats_type, company.name, company.career_url, self.timeout)
 
     def crawl_company(self, company: Company) -> List[Job]:
         """Crawl jobs from a single company.
 
+        Jobs are filtered and saved one batch at a time as the fetcher
+        yields them, so only matching jobs are kept in memory.
+
         Args:
             company: Company to crawl.
 
         Returns:
-            List of Job objects found.
+            List of matching Job objects found.
         """
         print(f"\nCrawling {company.name}...")
 
         try:
             with self._get_fetcher(company) as fetcher:
-                jobs = fetcher.fetch_job_list()
-                print(f"  Found {len(jobs)} jobs")
-
-                # Filter by titles if configured
-                if self.title_filter and jobs:
-                    jobs = self.title_filter.filter_jobs(jobs)
-                    print(f"  After title filter: {len(jobs)} matching jobs")
-
-                # Filter by location if configured
-                if self.location_filter and jobs:
-                    jobs = self.location_filter.filter_jobs(jobs)
+                jobs = []
+                found = 0
+                title_matches = 0
+                new_count = 0
+
+                for batch in fetcher.iter_job_batches():
+                    found += len(batch)
+
+                    # Filter by titles if configured
+                    if self.title_filter:
+                        batch = self.title_filter.filter_jobs(batch)
+                    title_matches += len(batch)
+
+                    # Filter by location if configured
+                    if self.location_filter and batch:
+                        batch = self.location_filter.filter_jobs(batch)
+
+                    # Save to store
+                    new_count += self.store.save_jobs(batch, company.name)
+                    jobs.extend(batch)
+
+                print(f"  Found {found} jobs")
+                if self.title_filter and found:
+                    print(f"  After title filter: {title_matches} matching jobs")
+                if self.location_filter and title_matches:
                     print(f"  After location filter: {len(jobs)} matching jobs")
-
-                # Save to store
-                new_count = self.store.save_jobs(jobs, company.name)
                 print(f"  Saved {new_count} new jobs")
 
                 # Update registry
@@ -199,6 +191,15 @@ class Orchestrator:
         successful_companies = 0
         failed_companies = []
 
+        # Detect missing ATS types up front, concurrently
+        undetected = [c for c in self.companies if not c.ats_type or c.ats_type == "unknown"]
+        if undetected:
+            print(f"Detecting ATS for {len(undetected)} companies...")
+            detected = self.detector.detect_many([c.career_url for c in undetected])
+            for company in undetected:
+                company.ats_type = detected[company.career_url]
+                self.registry.update_ats_type(company.name, company.ats_type)
+
         for company in self.companies:
             try:
                 jobs = self.crawl_company(company)
@@ -211,6 +212,8 @@ class Orchestrator:
 
         # Cleanup
         self.detector.close()
+        BROWSER_POOL.close()
+        CLIENT_MANAGER.close()
 
         # Summary
         print("\n" + "=" * 50)
@@ -0,0 +1,134 @@
+"""Per-host token-bucket rate limiting shared by all fetchers."""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+import httpx
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``.
+    Callers reserve a token and are told how long to wait for it, so
+    concurrent callers queue up behind each other instead of all waking
+    at the same moment.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = max(rate, 0.001)
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token.
+
+        Returns:
+            Seconds the caller must wait before using the token.
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class HostRateLimiter:
+    """Keeps one token bucket per host."""
+
+    DEFAULT_RATE = 5.0
+    DEFAULT_BURST = 10
+
+    def __init__(self, default_rate: float = DEFAULT_RATE, default_burst: int = DEFAULT_BURST):
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self._host_limits: Dict[str, tuple] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, config: Optional[dict]) -> None:
+        """Apply limits from the ``rate_limits`` section of settings.yaml.
+
+        Args:
+            config: Dict with optional ``default`` and ``hosts`` entries, each
+                holding ``requests_per_second`` and ``burst``.
+        """
+        config = config or {}
+        default = config.get("default") or {}
+        with self._lock:
+            self.default_rate = float(default.get("requests_per_second", self.default_rate))
+            self.default_burst = int(default.get("burst", self.default_burst))
+            self._host_limits = {}
+            for host, limits in (config.get("hosts") or {}).items():
+                limits = limits or {}
+                self._host_limits[host.lower()] = (
+                    float(limits.get("requests_per_second", self.default_rate)),
+                    int(limits.get("burst", self.default_burst)),
+                )
+            # Rebuild buckets lazily with the new limits
+            self._buckets = {}
+
+    def bucket(self, host: str) -> TokenBucket:
+        """Get or create the bucket for a host."""
+        host = host.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self._host_limits.get(host, (self.default_rate, self.default_burst))
+                bucket = TokenBucket(rate, burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def wait(self, host: str) -> None:
+        """Block until a request to ``host`` is allowed."""
+        delay = self.bucket(host).reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self, host: str) -> None:
+        """Wait without blocking the event loop until ``host`` is allowed."""
+        delay = self.bucket(host).reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+# Process-wide limiter shared by every fetcher
+RATE_LIMITER = HostRateLimiter()
+
+
+class RateLimitedTransport(httpx.BaseTransport):
+    """Transport wrapper that throttles requests per host."""
+
+    def __init__(self, transport: httpx.BaseTransport, limiter: HostRateLimiter = RATE_LIMITER):
+        self._transport = transport
+        self._limiter = limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self._limiter.wait(request.url.host)
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRateLimitedTransport(httpx.AsyncBaseTransport):
+    """Async transport wrapper that throttles requests per host."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: HostRateLimiter = RATE_LIMITER):
+        self._transport = transport
+        self._limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self._limiter.wait_async(request.url.host)
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -31,6 +31,7 @@ class CompanyRegistry:
             "companies": [c.to_dict() for c in self._companies.values()],
             "updated_at": datetime.now().isoformat()
         }
+        self.registry_path.parent.mkdir(parents=True, exist_ok=True)
         with open(self.registry_path, "w") as f:
             json.dump(data, f, indent=2)
 
@@ -69,3 +70,30 @@ class CompanyRegistry:
         if company:
             company.last_crawled = datetime.now().isoformat()
             self._save()
+
+    def update_fingerprint(self, name: str, fingerprint: str) -> None:
+        """Record the fingerprint of the company's latest board response."""
+        company = self.get(name)
+        if company:
+            company.fingerprint = fingerprint
+            self._save()
+
+    def update_sync_state(self, name: str, high_water_mark: Optional[str], open_jobs: List[str]) -> None:
+        """Record the delta-sync high-water mark and the board's open job URLs."""
+        company = self.get(name)
+        if company:
+            if high_water_mark:
+                company.high_water_mark = high_water_mark
+            company.open_jobs = open_jobs
+            self._save()
+
+    def update_schedule(
+        self, name: str, changes_seen: float, hours_observed: float, interval_hours: float
+    ) -> None:
+        """Record churn history and the next revisit interval."""
+        company = self.get(name)
+        if company:
+            company.changes_seen = changes_seen
+            company.hours_observed = hours_observed
+            company.crawl_interval_hours = interval_hours
+            self._save()
@@ -0,0 +1,262 @@
+"""Retry with backoff and per-host circuit breaking for the shared HTTP path."""
+
+import asyncio
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+import httpx
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised instead of sending a request to a host that is known to be down."""
+
+
+class CircuitBreaker:
+    """Per-host breaker: closed -> open after repeated failures -> half-open.
+
+    While open, requests fail immediately. After ``reset_timeout`` seconds a
+    single trial request is let through; success closes the breaker again,
+    failure re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            # Half-open: let exactly one trial request through
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def is_open(self) -> bool:
+        """Whether the breaker is currently rejecting requests."""
+        with self._lock:
+            return (
+                self._opened_at is not None
+                and time.monotonic() - self._opened_at < self.reset_timeout
+            )
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """Give up a half-open trial without an outcome (e.g. cancelled), so
+        the next request may try again."""
+        with self._lock:
+            self._trial_in_flight = False
+
+
+class RetryPolicy:
+    """Decides which failures to retry and how long to wait between attempts.
+
+    Backoff is exponential with full jitter. A ``Retry-After`` header on a
+    429/503 response takes precedence when present; responses asking for a
+    longer wait than ``max_retry_after`` are returned as-is.
+    """
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        max_retry_after: float = 60.0,
+        breaker_failure_threshold: int = 5,
+        breaker_reset_timeout: float = 60.0,
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+        self.breaker_failure_threshold = breaker_failure_threshold
+        self.breaker_reset_timeout = breaker_reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, config: Optional[dict], max_retries: Optional[int] = None) -> None:
+        """Apply the ``retry`` section and top-level ``max_retries`` from settings.yaml."""
+        config = config or {}
+        if max_retries is not None:
+            self.max_retries = int(max_retries)
+        self.backoff_base = float(config.get("backoff_base", self.backoff_base))
+        self.backoff_max = float(config.get("backoff_max", self.backoff_max))
+        self.max_retry_after = float(config.get("max_retry_after", self.max_retry_after))
+        self.breaker_failure_threshold = int(
+            config.get("breaker_failure_threshold", self.breaker_failure_threshold)
+        )
+        self.breaker_reset_timeout = float(
+            config.get("breaker_reset_timeout", self.breaker_reset_timeout)
+        )
+        with self._lock:
+            self._breakers = {}
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        """Get or create the circuit breaker for a host."""
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(self.breaker_failure_threshold, self.breaker_reset_timeout)
+                self._breakers[host] = breaker
+            return breaker
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for a 0-based attempt number."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def retry_after(self, response: httpx.Response) -> Optional[float]:
+        """Parse a Retry-After header (seconds or HTTP date)."""
+        value = response.headers.get("retry-after")
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+    def delay_for_response(self, response: httpx.Response, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying this response, or None to give up."""
+        if response.status_code not in self.RETRY_STATUSES or attempt >= self.max_retries:
+            return None
+        retry_after = self.retry_after(response)
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_retry_after else None
+        return self.backoff(attempt)
+
+    @staticmethod
+    def is_failure(response: httpx.Response) -> bool:
+        """Whether a response means the host is unhealthy (429 does not)."""
+        return response.status_code >= 500
+
+    @staticmethod
+    def circuit_open(request: httpx.Request) -> CircuitOpenError:
+        return CircuitOpenError(
+            f"Circuit open for {request.url.host}: too many recent failures",
+            request=request,
+        )
+
+
+# Process-wide policy; breakers are shared by every fetcher
+RETRY_POLICY = RetryPolicy()
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Transport wrapper that retries transient failures."""
+
+    def __init__(self, transport: httpx.BaseTransport, policy: RetryPolicy = RETRY_POLICY):
+        self._transport = transport
+        self._policy = policy
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        breaker = self._policy.breaker(request.url.host)
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                raise self._policy.circuit_open(request)
+
+            try:
+                response = self._transport.handle_request(request)
+            except httpx.TransportError:
+                breaker.record_failure()
+                if attempt >= self._policy.max_retries or breaker.is_open():
+                    raise
+                time.sleep(self._policy.backoff(attempt))
+                attempt += 1
+                continue
+            except BaseException:
+                # No verdict on the host; don't leave a half-open trial stuck
+                breaker.release_trial()
+                raise
+
+            if self._policy.is_failure(response):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+            delay = self._policy.delay_for_response(response, attempt)
+            if delay is None or breaker.is_open():
+                return response
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Async variant of RetryTransport."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, policy: RetryPolicy = RETRY_POLICY):
+        self._transport = transport
+        self._policy = policy
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        breaker = self._policy.breaker(request.url.host)
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                raise self._policy.circuit_open(request)
+
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError:
+                breaker.record_failure()
+                if attempt >= self._policy.max_retries or breaker.is_open():
+                    raise
+                await asyncio.sleep(self._policy.backoff(attempt))
+                attempt += 1
+                continue
+            except BaseException:
+                # Cancelled or failed outside the transport layer; don't
+                # leave a half-open trial stuck
+                breaker.release_trial()
+                raise
+
+            if self._policy.is_failure(response):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+            delay = self._policy.delay_for_response(response, attempt)
+            if delay is None or breaker.is_open():
+                return response
+            await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
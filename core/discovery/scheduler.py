@@ -0,0 +1,108 @@
+"""Adaptive crawl scheduling based on each company's posting churn."""
+
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from .models import Company
+
+
+class CrawlScheduler:
+    """Picks a per-company revisit interval from observed board changes.
+
+    Each crawl is one observation: did the board change (fingerprint
+    differs) over the hours since the previous crawl? The change rate is
+    estimated as ``changes / hours`` over exponentially decayed history,
+    seeded with a prior of one change per day so a single quiet crawl
+    does not push a company straight to the maximum interval.
+
+    The revisit interval is ``target_changes_per_visit / rate``, clamped to
+    ``[min_interval_hours, max_interval_hours]``. Busy boards are visited
+    often, quiet ones rarely.
+    """
+
+    PRIOR_CHANGES = 1.0
+    PRIOR_HOURS = 24.0
+
+    def __init__(
+        self,
+        min_interval_hours: float = 6.0,
+        max_interval_hours: float = 168.0,
+        target_changes_per_visit: float = 0.5,
+        decay: float = 0.8,
+        enabled: bool = True,
+    ):
+        """Initialize scheduler.
+
+        Args:
+            min_interval_hours: Shortest allowed revisit interval.
+            max_interval_hours: Longest allowed revisit interval.
+            target_changes_per_visit: Expected board changes between visits.
+            decay: Weight kept by older observations on each new crawl (0-1).
+            enabled: If False every company is always due.
+        """
+        self.min_interval_hours = min_interval_hours
+        self.max_interval_hours = max_interval_hours
+        self.target_changes_per_visit = target_changes_per_visit
+        self.decay = decay
+        self.enabled = enabled
+
+    @classmethod
+    def from_config(cls, config: Optional[dict]) -> "CrawlScheduler":
+        """Create scheduler from the ``schedule`` section of settings.yaml."""
+        config = config or {}
+        defaults = cls()
+        return cls(
+            min_interval_hours=float(config.get("min_interval_hours", defaults.min_interval_hours)),
+            max_interval_hours=float(config.get("max_interval_hours", defaults.max_interval_hours)),
+            target_changes_per_visit=float(
+                config.get("target_changes_per_visit", defaults.target_changes_per_visit)
+            ),
+            decay=float(config.get("decay", defaults.decay)),
+            enabled=bool(config.get("enabled", defaults.enabled)),
+        )
+
+    def next_due(self, company: Company) -> Optional[datetime]:
+        """When the company should next be crawled (None if never crawled)."""
+        if not company.last_crawled:
+            return None
+        interval = company.crawl_interval_hours or self.min_interval_hours
+        return datetime.fromisoformat(company.last_crawled) + timedelta(hours=interval)
+
+    def is_due(self, company: Company, now: Optional[datetime] = None) -> bool:
+        """Check whether a company should be crawled on this run."""
+        if not self.enabled:
+            return True
+        due = self.next_due(company)
+        return due is None or due <= (now or datetime.now())
+
+    def change_rate(self, changes_seen: float, hours_observed: float) -> float:
+        """Estimated board changes per hour."""
+        return (changes_seen + self.PRIOR_CHANGES) / (hours_observed + self.PRIOR_HOURS)
+
+    def observe(
+        self, company: Company, changed: bool, now: Optional[datetime] = None
+    ) -> Tuple[float, float, float]:
+        """Fold one crawl result into the company's churn history.
+
+        Args:
+            company: Registry record (``last_crawled`` still from the previous crawl).
+            changed: Whether the board differed from the previous crawl.
+            now: Time of this crawl.
+
+        Returns:
+            Tuple of (changes_seen, hours_observed, crawl_interval_hours).
+        """
+        changes_seen = company.changes_seen
+        hours_observed = company.hours_observed
+
+        if company.last_crawled:
+            elapsed = (now or datetime.now()) - datetime.fromisoformat(company.last_crawled)
+            hours = max(elapsed.total_seconds() / 3600, 0.0)
+            changes_seen = changes_seen * self.decay + (1.0 if changed else 0.0)
+            hours_observed = hours_observed * self.decay + hours
+
+        rate = self.change_rate(changes_seen, hours_observed)
+        interval = self.target_changes_per_visit / rate
+        interval = min(max(interval, self.min_interval_hours), self.max_interval_hours)
+
+        return changes_seen, hours_observed, interval
@@ -0,0 +1,72 @@
+"""Per-company buffer of job batches between fetching and storage."""
+
+import asyncio
+import pickle
+import tempfile
+from collections import deque
+
+
+class BatchSpool:
+    """FIFO of job batches whose ``put`` never blocks.
+
+    Companies are stored in config order, so a fetch that is not at the head
+    of the line may get far ahead of its consumer. Rather than stalling that
+    fetch (and the concurrency slot it holds), batches beyond
+    ``memory_limit`` are pickled to a temporary file and read back in order,
+    so memory stays bounded by a few batches per company while every fetch
+    keeps downloading.
+    """
+
+    def __init__(self, memory_limit: int = 4):
+        self.memory_limit = max(1, memory_limit)
+        self._memory = deque()
+        self._file = None
+        self._spilled = 0  # Batches in the file not read yet
+        self._read_pos = 0
+        self._ready = asyncio.Event()
+
+    def put(self, item) -> None:
+        """Append a batch (or the end-of-stream None)."""
+        # Once spilling, later batches go to the file too, behind the ones
+        # already there
+        if self._spilled or len(self._memory) >= self.memory_limit:
+            self._spill(item)
+        else:
+            self._memory.append(item)
+        self._ready.set()
+
+    async def get(self):
+        """Remove and return the oldest batch, waiting for one if needed."""
+        while not self._memory and not self._spilled:
+            self._ready.clear()
+            await self._ready.wait()
+        if self._memory:
+            return self._memory.popleft()
+        return self._unspill()
+
+    def close(self) -> None:
+        """Drop unread batches and delete the spill file."""
+        self._memory.clear()
+        self._spilled = 0
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _spill(self, item) -> None:
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(prefix="jobforge-batches-")
+        self._file.seek(0, 2)
+        pickle.dump(item, self._file, pickle.HIGHEST_PROTOCOL)
+        self._spilled += 1
+
+    def _unspill(self):
+        self._file.seek(self._read_pos)
+        item = pickle.load(self._file)
+        self._read_pos = self._file.tell()
+        self._spilled -= 1
+        if not self._spilled:
+            # Everything read: start the file over
+            self._file.seek(0)
+            self._file.truncate()
+            self._read_pos = 0
+        return item
@@ -4,13 +4,22 @@ import csv
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import List, Set
+from typing import List, Set, Tuple
 
-from .models import Job
+from .models import Job, canonical_job_url
 
 
 class JobStore:
-    """Store job listings to files with deduplication."""
+    """Store job listings to files with deduplication.
+
+    The URLs of every stored job are kept in a compact index
+    (``seen_urls.txt``, one canonical URL per line) so startup reads one
+    file instead of the whole history. The index is rebuilt from the
+    ``jobs.json`` files when it is missing.
+    """
+
+    SEEN_INDEX = "seen_urls.txt"
+    CSV_FIELDS = ["company", "title", "location", "team", "url", "source", "discovered_at"]
 
     def __init__(self, output_dir: str = "job_results"):
         """Initialize job store.
@@ -22,13 +31,28 @@ class JobStore:
         self._seen_jobs: Set[str] = set()
         self._load_existing_jobs()
 
+    @property
+    def _index_path(self) -> Path:
+        return self.output_dir / self.SEEN_INDEX
+
     def _load_existing_jobs(self) -> None:
         """Load existing job URLs for deduplication."""
         if not self.output_dir.exists():
             return
 
-        # Scan existing JSON files
-        for json_file in self.output_dir.rglob("*.json"):
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                self._seen_jobs.update(line.rstrip("\n") for line in f if line.strip())
+            return
+        except FileNotFoundError:
+            pass
+        except Exception:
+            self._seen_jobs.clear()
+
+        # No index yet: scan the stored jobs (only jobs.json; closed.json
+        # lists jobs that are gone, and must not stop a reopened posting
+        # from being saved)
+        for json_file in self.output_dir.rglob("jobs.json"):
             try:
                 with open(json_file, "r") as f:
                     data = json.load(f)
@@ -40,15 +64,29 @@ class JobStore:
             except Exception:
                 pass
 
+        self._write_index(self._seen_jobs, append=False)
+
+    def _write_index(self, urls, append: bool = True) -> None:
+        """Add canonical URLs to the seen index, or rewrite it with them."""
+        if not urls:
+            return
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._index_path, "a" if append else "w", encoding="utf-8") as f:
+                f.writelines(f"{url}\n" for url in urls)
+        except Exception:
+            pass
+
     def _canonical_url(self, url: str) -> str:
         """Create canonical URL for deduplication.
 
         Preserves job ID parameters for proper deduplication.
         """
-        # Normalize case and trailing slashes, but keep query params
-        # since they often contain the job ID (e.g., gh_jid, job_id)
-        url = url.lower().rstrip("/")
-        return url
+        return canonical_job_url(url)
+
+    def is_known(self, url: str) -> bool:
+        """Check whether a job URL is already stored."""
+        return self._canonical_url(url) in self._seen_jobs
 
     def _get_date_folder(self) -> Path:
         """Get folder path for today's date."""
@@ -85,6 +123,7 @@ class JobStore:
 
         if not new_jobs:
             return 0
+        self._write_index([self._canonical_url(job.url) for job in new_jobs])
 
         # Create directory structure
         company_folder = self._get_company_folder(company_name)
@@ -100,8 +139,88 @@ class JobStore:
 
         return len(new_jobs)
 
+    def save_updates(self, jobs: List[Job], company_name: str) -> Tuple[int, int]:
+        """Save the jobs of a delta sync, which are new, edited or reopened.
+
+        Unlike ``save_jobs``, jobs whose URL was seen before are kept: they
+        changed since the last sync. Today's entry for each URL is replaced,
+        so a job is listed once per day folder.
+
+        Returns:
+            Tuple of (new jobs, updated jobs).
+        """
+        if not jobs:
+            return 0, 0
+
+        new_urls = []
+        updates = {}
+        for job in jobs:
+            canonical = self._canonical_url(job.url)
+            if canonical not in self._seen_jobs:
+                self._seen_jobs.add(canonical)
+                new_urls.append(canonical)
+            updates[canonical] = job.to_dict()
+        self._write_index(new_urls)
+        new_count = len(new_urls)
+
+        company_folder = self._get_company_folder(company_name)
+        company_folder.mkdir(parents=True, exist_ok=True)
+        json_path = company_folder / "jobs.json"
+
+        existing = []
+        if json_path.exists():
+            try:
+                with open(json_path, "r") as f:
+                    existing = json.load(f)
+            except Exception:
+                pass
+
+        entries = [
+            entry for entry in existing
+            if self._canonical_url(entry.get("url", "")) not in updates
+        ] + list(updates.values())
+
+        with open(json_path, "w") as f:
+            json.dump(entries, f, indent=2)
+        self._write_csv(entries, company_folder / "jobs.csv", append=False)
+
+        return new_count, len(updates) - new_count
+
+    def save_closed(self, urls: List[str], company_name: str) -> None:
+        """Record jobs that disappeared from a company's board.
+
+        Appended to ``closed.json`` next to the company's ``jobs.json``.
+        """
+        if not urls:
+            return
+
+        company_folder = self._get_company_folder(company_name)
+        company_folder.mkdir(parents=True, exist_ok=True)
+        path = company_folder / "closed.json"
+
+        existing = []
+        if path.exists():
+            try:
+                with open(path, "r") as f:
+                    existing = json.load(f)
+            except Exception:
+                pass
+
+        closed_at = datetime.now().isoformat()
+        with open(path, "w") as f:
+            json.dump(existing + [{"url": url, "closed_at": closed_at} for url in urls], f, indent=2)
+
     def _save_json(self, jobs: List[Job], path: Path) -> None:
-        """Save jobs to JSON file."""
+        """Save jobs to JSON file.
+
+        New jobs are written over the closing bracket of the existing
+        array, so saving a batch costs the same however large the file
+        already is (jobs are saved page by page while a board streams in).
+        """
+        body = json.dumps([job.to_dict() for job in jobs], indent=2)[1:-2]
+        if path.exists() and self._append_json(path, body):
+            return
+
         existing = []
         if path.exists():
             try:
@@ -116,29 +235,47 @@ class JobStore:
         with open(path, "w") as f:
             json.dump(all_jobs, f, indent=2)
 
+    @staticmethod
+    def _append_json(path: Path, body: str) -> bool:
+        """Append pre-encoded array items to a JSON array file in place.
+
+        Returns:
+            False if the file does not end like a JSON array.
+        """
+        with open(path, "rb+") as f:
+            start = max(0, f.seek(0, 2) - 64)
+            f.seek(start)
+            tail = f.read().rstrip()
+            if not tail.endswith(b"]"):
+                return False
+            head = tail[:-1].rstrip()
+            if not head:
+                return False
+
+            # Overwrite from just after the last item (or the opening bracket)
+            f.seek(start + len(head))
+            f.truncate()
+            separator = "" if head.endswith(b"[") else ","
+            f.write(f"{separator}{body}\n]".encode())
+        return True
+
     def _save_csv(self, jobs: List[Job], path: Path) -> None:
         """Save jobs to CSV file."""
+        self._write_csv([job.to_dict() for job in jobs], path, append=True)
+
+    def _write_csv(self, entries: List[dict], path: Path, append: bool) -> None:
+        """Append job entries to a CSV file, or rewrite it with them."""
         # Check if file exists to determine if we need headers
-        write_headers = not path.exists()
+        write_headers = not append or not path.exists()
 
-        with open(path, "a", newline="", encoding="utf-8") as f:
+        with open(path, "a" if append else "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
 
             if write_headers:
-                writer.writerow([
-                    "company", "title", "location", "team", "url", "source", "discovered_at"
-                ])
-
-            for job in jobs:
-                writer.writerow([
-                    job.company,
-                    job.title,
-                    job.location or "",
-                    job.team or "",
-                    job.url,
-                    job.source,
-                    job.discovered_at,
-                ])
+                writer.writerow(self.CSV_FIELDS)
+
+            for entry in entries:
+                writer.writerow([entry.get(field) or "" for field in self.CSV_FIELDS])
 
     def get_stats(self) -> dict:
         """Get storage statistics."""
@@ -37,21 +37,24 @@ def run_matching(args):
         print("   python jobforge.py discover")
         return 1
     
-    jobs = load_all_jobs(jobs_dir)
-    print(f"\n🔍 Found {len(jobs)} jobs to analyze")
-    
-    if not jobs:
-        print("\n❌ No jobs to match. Run discovery first.")
-        return 1
-    
     # Check for remote-only filter
     remote_only = any('remote' in loc.lower() for loc in profile.get('locations', []))
     
-    # Score jobs (simplified for now)
+    # Score jobs one company file at a time, keeping only the matches
     print(f"\n⚡ Scoring jobs (min score: {args.min_score})...")
     if remote_only:
         print("   🌍 Filtering for remote jobs only")
-    scored = score_jobs_simple(jobs, profile, args.min_score, remote_only)
+    total = 0
+    scored = []
+    for batch in iter_job_batches(jobs_dir):
+        total += len(batch)
+        scored.extend(score_jobs_simple(batch, profile, args.min_score, remote_only))
+    scored.sort(key=lambda x: x['score'], reverse=True)
+    print(f"\n🔍 Analyzed {total} jobs")
+    
+    if not total:
+        print("\n❌ No jobs to match. Run discovery first.")
+        return 1
     
     print(f"\n✨ Found {len(scored)} matching jobs")
     
@@ -114,16 +117,16 @@ def extract_profile_from_career(career_files):
     }
 
 
-def load_all_jobs(jobs_dir):
-    """Load all jobs from results directory."""
-    jobs = []
+def iter_job_batches(jobs_dir):
+    """Yield the jobs of each results file in turn."""
     for json_file in jobs_dir.rglob('jobs.json'):
         try:
             with open(json_file) as f:
-                jobs.extend(json.load(f))
+                jobs = json.load(f)
         except:
-            pass
-    return jobs
+            continue
+        if jobs:
+            yield jobs
 
 
 def score_jobs_simple(jobs, profile, min_score, remote_only=False):
@@ -133,6 +136,7 @@ def score_jobs_simple(jobs, profile, min_score, remote_only=False):
     for job in jobs:
         title = job.get('title', '').lower()
         location = job.get('location', '').lower()
+        description = (job.get('description') or '').lower()
         
         # Filter remote jobs if requested
         if remote_only:
@@ -146,7 +150,7 @@ def score_jobs_simple(jobs, profile, min_score, remote_only=False):
             score += 40
         
         # Skills match (40 points)
-        matched_skills = [s for s in profile['skills'] if s in title]
+        matched_skills = [s for s in profile['skills'] if s in title or s in description]
         if matched_skills:
             score += min(40, len(matched_skills) * 10)
         
@@ -40,6 +40,9 @@ Examples:
     discover.add_argument('--companies', help='Comma-separated company names')
     discover.add_argument('--timeout', type=int, default=30, help='Request timeout (seconds)')
     discover.add_argument('--config', default='config/companies.yaml', help='Companies config file')
+    discover.add_argument('--settings', default='config/settings.yaml', help='Settings file (rate limits, etc.)')
+    discover.add_argument('--all', action='store_true', help='Crawl every company, even if not yet due')
+    discover.add_argument('--concurrency', type=int, default=8, help='Max companies fetched in parallel')
     
     # Match command
     match = subparsers.add_parser('match', help='Match jobs to your profile')
@@ -0,0 +1,61 @@
+"""Tests for delta sync bookkeeping in the fetcher base class."""
+
+from core.discovery.ats.greenhouse import GreenhouseFetcher
+from core.discovery.models import Job
+
+
+BOARD = "https://stripe.com/jobs/search"
+
+
+def job(job_id, updated_at):
+    return Job(
+        company="Stripe",
+        title=f"Job {job_id}",
+        url=f"{BOARD}?gh_jid={job_id}",
+        source="greenhouse",
+        updated_at=updated_at,
+    )
+
+
+def make_fetcher(since=None, previous_open_urls=None):
+    fetcher = GreenhouseFetcher("Stripe", BOARD)
+    fetcher.delta_sync = True
+    fetcher.since = since
+    fetcher.previous_open_urls = previous_open_urls
+    return fetcher
+
+
+def test_query_string_job_urls_stay_distinct():
+    jobs = [job(n, "2026-10-01T00:00:00Z") for n in range(5)]
+    fetcher = make_fetcher()
+
+    assert fetcher._apply_delta(jobs) == jobs
+    assert fetcher.open_urls == {f"{BOARD}?gh_jid={n}" for n in range(5)}
+    assert fetcher.high_water_mark == "2026-10-01T00:00:00+00:00"
+
+
+def test_job_closed_between_runs():
+    first = make_fetcher()
+    first._apply_delta([job(n, "2026-10-01T00:00:00Z") for n in range(3)])
+
+    # Job 1 is gone and job 2 was edited since the first sync
+    second = make_fetcher(first.high_water_mark, first.open_urls)
+    delta = second._apply_delta([
+        job(0, "2026-10-01T00:00:00Z"),
+        job(2, "2026-10-05T00:00:00Z"),
+    ])
+
+    assert [j.url for j in delta] == [f"{BOARD}?gh_jid=2"]
+    assert second.closed_urls == {f"{BOARD}?gh_jid=1"}
+
+
+def test_reopened_job_is_emitted():
+    previous = {f"{BOARD}?gh_jid=0"}
+    fetcher = make_fetcher("2026-10-05T00:00:00+00:00", previous)
+    delta = fetcher._apply_delta([
+        job(0, "2026-10-01T00:00:00Z"),
+        job(7, "2026-10-01T00:00:00Z"),
+    ])
+
+    assert [j.url for j in delta] == [f"{BOARD}?gh_jid=7"]
+    assert fetcher.closed_urls == set()
@@ -0,0 +1,44 @@
+"""Tests for incremental JSON array decoding."""
+
+import json
+
+import pytest
+
+from core.discovery.jsonstream import JsonArrayStream
+
+
+def feed_all(chunks):
+    stream = JsonArrayStream()
+    items = []
+    for chunk in chunks:
+        items.extend(stream.feed(chunk))
+    stream.close()
+    return items
+
+
+def test_number_split_at_decimal_point():
+    assert feed_all(["[2", ".", "5]"]) == [2.5]
+
+
+def test_number_split_at_exponent():
+    assert feed_all(["[1", "e", "-", "3, 4", "]"]) == [1e-3, 4]
+
+
+def test_every_split_point():
+    values = [{"a": "ééé", "b": [1, 2]}, 12, -3.25e2, "x", True, None, []]
+    text = json.dumps(values)
+    for size in range(1, len(text) + 1):
+        chunks = [text[i:i + size] for i in range(0, len(text), size)]
+        assert feed_all(chunks) == values
+
+
+def test_truncated_array():
+    stream = JsonArrayStream()
+    assert stream.feed('[{"a": 1}, {"b"') == [{"a": 1}]
+    with pytest.raises(ValueError):
+        stream.close()
+
+
+def test_not_an_array():
+    with pytest.raises(ValueError):
+        JsonArrayStream().feed('{"a": 1}')
@@ -0,0 +1,36 @@
+"""Tests for the per-company batch spool."""
+
+import asyncio
+
+from core.discovery.spool import BatchSpool
+
+
+def test_batches_come_back_in_order_across_the_spill_file():
+    async def run():
+        spool = BatchSpool(memory_limit=2)
+        for n in range(5):
+            spool.put([n])
+        received = [await spool.get(), await spool.get()]
+        spool.put([5])
+        spool.put(None)
+        while (batch := await spool.get()) is not None:
+            received.append(batch)
+        # Drained spill file is reused from the start
+        spool.put([6])
+        received.append(await spool.get())
+        spool.close()
+        return received
+
+    assert asyncio.run(run()) == [[n] for n in range(7)]
+
+
+def test_get_waits_for_put():
+    async def run():
+        spool = BatchSpool()
+        getter = asyncio.ensure_future(spool.get())
+        await asyncio.sleep(0)
+        assert not getter.done()
+        spool.put(["job"])
+        return await getter
+
+    assert asyncio.run(run()) == ["job"]